@@ -0,0 +1,133 @@
+"""Vectorised hand evaluation over NumPy arrays of integer cards.
+
+Rows are hands, columns are cards in the ``src.card`` encoding.  All work is
+done with table gathers on the memory-mapped lookup tables, in chunks so the
+temporaries stay small however many hands are passed in.
+"""
+
+import numpy as np
+
+from src.card import FULL_DECK, to_cards
+from src.lookup_tables import CATEGORY_BOUNDS, RANK_KEYS, get_tables
+
+CHUNK_SIZE = 1 << 18
+CATEGORY_LIMITS = np.array([bound for bound, _ in CATEGORY_BOUNDS], dtype=np.uint16)
+# Card index (position in FULL_DECK) -> integer card.
+DECK = np.array(FULL_DECK, dtype=np.int64)
+# Second byte of a card (suit bit << 4 | rank index) -> its rank key in the
+# low 23 bits plus one count nibble per suit above them.  Summing these over
+# seven cards gives the `rank_sum7` index and the suit counts in one pass.
+CARD_KEYS = np.zeros(256, dtype=np.int64)
+for _rank in range(13):
+    for _shift, _suit_bit in enumerate((1, 2, 4, 8)):
+        CARD_KEYS[_suit_bit << 4 | _rank] = RANK_KEYS[_rank] | 1 << (23 + 4 * _shift)
+RANK_SUM_MASK = (1 << 23) - 1
+# Card index -> CARD_KEYS entry, for callers that deal card indices.
+INDEX_KEYS = CARD_KEYS[(DECK >> 8) & 0xFF]
+
+
+def as_card_array(cards):
+    """Convert a sequence of hands (ints or strings) to an (N, k) int64 array."""
+    if isinstance(cards, np.ndarray):
+        return cards.astype(np.int64, copy=False)
+    if not len(cards):
+        raise ValueError("No hands given")
+    return np.array([to_cards(hand) for hand in cards], dtype=np.int64).reshape(
+        len(cards), -1
+    )
+
+
+def categories(strengths):
+    """Category codes matching `HandEvaluator.hand_ranks` (1 = High Card)."""
+    return (np.searchsorted(CATEGORY_LIMITS, strengths) + 1).astype(np.uint8)
+
+
+def _flush_strengths(tables, cards, suit_counts):
+    # suit_counts holds one count nibble per suit; bit 3 of a nibble is set
+    # once that suit has five cards (at most one suit can with <= 7 cards).
+    flush = (suit_counts + 0x3333) & 0x8888
+    rows = np.flatnonzero(flush)
+    if rows.size:
+        flush = flush[rows]
+        suit_index = (flush > 0x8).astype(np.int64) + (flush > 0x80) + (flush > 0x800)
+        chosen = cards[rows]
+        in_suit = chosen & np.left_shift(1, suit_index + 12)[:, None] != 0
+        mask = np.bitwise_or.reduce(np.where(in_suit, chosen >> 16, 0), axis=1)
+        return rows, tables.array("flush7")[mask]
+    return rows, None
+
+
+def _strength5(tables, cards):
+    mask = cards[:, 0] >> 16
+    suits = cards[:, 0] & 0xF000
+    for column in range(1, 5):
+        mask |= cards[:, column] >> 16
+        suits &= cards[:, column]
+    strengths = tables.array("unique5")[mask]
+    is_flush = suits != 0
+    strengths[is_flush] = tables.array("flush")[mask[is_flush]]
+    paired = np.flatnonzero(strengths == 0)
+    if paired.size:
+        products = np.prod(cards[paired] & 0xFF, axis=1)
+        index = np.searchsorted(tables.array("product_keys"), products)
+        strengths[paired] = tables.array("product_values")[index]
+    return strengths
+
+
+def _best_strength(tables, cards):
+    keys = np.take(CARD_KEYS, (cards >> 8) & 0xFF)
+    total = keys[:, 0].copy()
+    for column in range(1, keys.shape[1]):
+        total += keys[:, column]
+    if keys.shape[1] == 7:
+        strengths = np.take(tables.array("rank_sum7"), total & RANK_SUM_MASK)
+    else:
+        products = np.prod(cards & 0xFF, axis=1).astype(np.uint64)
+        index = np.searchsorted(tables.array("nonflush_keys"), products)
+        strengths = tables.array("nonflush_values")[index]
+    rows, flush = _flush_strengths(tables, cards, total >> 23)
+    if rows.size:
+        strengths[rows] = flush
+    return strengths
+
+
+def strengths_from_keys(totals, hole, board, tables=None):
+    """7-card strengths from `INDEX_KEYS` summed over hole and board cards.
+
+    ``hole`` is an (N, 2) or (2,) and ``board`` an (N, 5) array of card
+    indices; they are only read for the few rows that hold a flush.
+    """
+    tables = tables or get_tables()
+    strengths = np.take(tables.array("rank_sum7"), totals & RANK_SUM_MASK)
+    rows = np.flatnonzero(((totals >> 23) + 0x3333) & 0x8888)
+    if rows.size:
+        hole = np.broadcast_to(hole, (len(totals), 2))[rows]
+        cards = DECK[np.concatenate([hole, board[rows]], axis=1)]
+        strengths[rows] = _best_strength(tables, cards)
+    return strengths
+
+
+def _chunked(function, cards, tables):
+    strengths = np.empty(len(cards), dtype=np.uint16)
+    for start in range(0, len(cards), CHUNK_SIZE):
+        chunk = cards[start : start + CHUNK_SIZE]
+        strengths[start : start + CHUNK_SIZE] = function(tables, chunk)
+    return strengths
+
+
+def evaluate_batch(cards, tables=None):
+    """Strengths and category codes for an (N, 5) array of 5-card hands."""
+    cards = as_card_array(cards)
+    if cards.ndim != 2 or cards.shape[1] != 5:
+        raise ValueError(f"Expected an (N, 5) card array, got shape {cards.shape}")
+    strengths = _chunked(_strength5, cards, tables or get_tables())
+    return strengths, categories(strengths)
+
+
+def best_strength_batch(cards, tables=None):
+    """Strengths and category codes for an (N, 5..7) array of cards."""
+    cards = as_card_array(cards)
+    if cards.ndim != 2 or not 5 <= cards.shape[1] <= 7:
+        raise ValueError(f"Expected an (N, 5-7) card array, got shape {cards.shape}")
+    strengths = _chunked(_best_strength, cards, tables or get_tables())
+    return strengths, categories(strengths)
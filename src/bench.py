@@ -0,0 +1,177 @@
+"""Micro-benchmarks for the hot paths, with JSON baselines.
+
+Each benchmark is a factory that prepares its inputs (a fixed, seeded set of
+hands, so runs are comparable) and returns a zero-argument callable.  The
+callable is run in batches of `BATCH` calls for about ``duration`` seconds;
+throughput is calls per second over the whole run and the latency
+percentiles are taken over the per-call mean of each batch, which keeps
+timer overhead out of sub-microsecond operations.
+"""
+
+import json
+import platform
+import random
+import time
+from pathlib import Path
+
+BATCH = 20
+DURATION = 0.5
+THRESHOLD = 0.2
+SAMPLE_HANDS = 1024
+
+
+def _sample(cards, seed=1234):
+    from src.card import FULL_DECK
+
+    rng = random.Random(seed)
+    return [rng.sample(FULL_DECK, cards) for _ in range(SAMPLE_HANDS)]
+
+
+def _cycle(items, call):
+    state = {"index": 0}
+
+    def run():
+        index = state["index"]
+        state["index"] = (index + 1) % len(items)
+        return call(items[index])
+
+    return run
+
+
+def _deck():
+    from src.deck import Deck
+
+    deck = Deck(random.Random(1))
+
+    def run():
+        deck.reset()
+        deck.shuffle()
+        for _ in range(2):
+            deck.deal(2)
+        deck.deal(5)
+
+    return run
+
+
+def _evaluate():
+    from src.hand_evaluator import HandEvaluator
+
+    evaluator = HandEvaluator()
+    return _cycle(_sample(5), evaluator.evaluate)
+
+
+def _compare_hands():
+    from src.hand_evaluator import HandEvaluator
+
+    evaluator = HandEvaluator()
+    pairs = [(hand[:5], hand[5:]) for hand in _sample(10)]
+    return _cycle(pairs, lambda pair: evaluator.compare_hands(*pair))
+
+
+def _evaluate_best_hand():
+    from src.game import PokerGame
+
+    game = PokerGame(random.Random(1))
+    deals = [(hand[:2], hand[2:]) for hand in _sample(7)]
+    return _cycle(deals, lambda deal: game.evaluate_best_hand(*deal))
+
+
+def _opponent_action():
+    from src.game import PokerGame
+
+    game = PokerGame(random.Random(1))
+    streets = ["preflop", "flop", "turn", "river"]
+    spots = [
+        (streets[i % 4], hand[:2], hand[2 : 2 + [0, 3, 4, 5][i % 4]])
+        for i, hand in enumerate(_sample(7))
+    ]
+    return _cycle(
+        spots,
+        lambda spot: game.opponent_action(
+            4, 10, spot[0], spot[1], spot[2], 100, 0, 100
+        ),
+    )
+
+
+def _play():
+    from src.game import PokerGame
+
+    game = PokerGame(random.Random(1))
+    deals = [(hand[:2], hand[2:4], hand[4:]) for hand in _sample(9)]
+    return _cycle(deals, lambda deal: game.play(deal[0], deal[1], deal[2], 10, 5))
+
+
+BENCHMARKS = {
+    "deck_reset_shuffle_deal": _deck,
+    "evaluate": _evaluate,
+    "compare_hands": _compare_hands,
+    "evaluate_best_hand": _evaluate_best_hand,
+    "opponent_action": _opponent_action,
+    "play": _play,
+}
+
+
+def _percentile(ordered, fraction):
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+def measure(run, duration=DURATION):
+    """Time ``run`` for about ``duration`` seconds; returns ops/s and latencies."""
+    for _ in range(BATCH):
+        run()  # warm-up: lazy tables, caches
+    batches = []
+    clock = time.perf_counter
+    start = clock()
+    while True:
+        begin = clock()
+        for _ in range(BATCH):
+            run()
+        end = clock()
+        batches.append((end - begin) / BATCH)
+        if end - start >= duration:
+            break
+    calls = len(batches) * BATCH
+    batches.sort()
+    return {
+        "ops_per_sec": calls / sum(b * BATCH for b in batches),
+        "calls": calls,
+        "p50_us": _percentile(batches, 0.50) * 1e6,
+        "p90_us": _percentile(batches, 0.90) * 1e6,
+        "p99_us": _percentile(batches, 0.99) * 1e6,
+    }
+
+
+def run_suite(names=None, duration=DURATION):
+    """Run the named benchmarks (all by default) and return the report dict."""
+    names = list(BENCHMARKS) if not names else names
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmark(s): {', '.join(unknown)}")
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "duration": duration,
+        "benchmarks": {name: measure(BENCHMARKS[name](), duration) for name in names},
+    }
+
+
+def save_baseline(report, path):
+    Path(path).write_text(json.dumps(report, indent=2) + "\n")
+
+
+def load_baseline(path):
+    return json.loads(Path(path).read_text())
+
+
+def regressions(report, baseline, threshold=THRESHOLD):
+    """Benchmarks whose throughput fell more than ``threshold`` below baseline.
+
+    Returns ``(name, baseline_ops, current_ops)`` tuples; benchmarks missing
+    from either side are ignored.
+    """
+    slower = []
+    for name, result in report["benchmarks"].items():
+        base = baseline.get("benchmarks", {}).get(name)
+        if base and result["ops_per_sec"] < base["ops_per_sec"] * (1 - threshold):
+            slower.append((name, base["ops_per_sec"], result["ops_per_sec"]))
+    return slower
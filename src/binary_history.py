@@ -0,0 +1,208 @@
+"""Fixed-width binary hand history.
+
+Every hand is one 27-byte record, so hand N lives at a known offset and a
+file of billions of hands can be memory-mapped and indexed directly::
+
+    cards     9 bytes  player hole (2), opponent hole (2), board (5) as
+                       `FULL_DECK` indices; 255 = not dealt / not shown
+    outcome   uint8    street reached << 4 | winner
+    ranks     uint8    player category code << 4 | opponent category code
+    bet       uint32   chips the player put in
+    pot       uint32   final pot
+    net       int32    player's chip change
+    money     uint32   player's stack after the hand
+
+Category codes are the `HandEvaluator.hand_ranks` values (0 = unknown).
+Records are written in order, so a hand's number is not stored: it reads
+back as ``round``, the hand's position in the file counting from 1.  The
+file starts with an 8-byte header (magic, version, record size).  Records
+are the same hands as the JSONL history (`src.history`); `convert_history`
+converts that or the older ``game_history.json`` layout.
+"""
+
+import mmap
+import struct
+from pathlib import Path
+
+from src.card import CARD_INDEX, FULL_DECK, card_from_str, card_to_str
+from src.lookup_tables import CATEGORY_BOUNDS
+
+MAGIC = b"PKHH"
+VERSION = 2
+HEADER = struct.Struct("<4sHH")
+RECORD = struct.Struct("<9sBBIIiI")
+# The same layout as a NumPy dtype, for vectorised reads.
+RECORD_DTYPE = [
+    ("cards", "u1", (9,)),
+    ("outcome", "u1"),
+    ("ranks", "u1"),
+    ("bet", "<u4"),
+    ("pot", "<u4"),
+    ("net", "<i4"),
+    ("money", "<u4"),
+]
+NO_CARD = 0xFF
+STREETS = ["preflop", "flop", "turn", "river", "showdown"]
+WINNERS = [None, "Player", "Opponent", "Tie"]
+CATEGORIES = [None] + [name for _, name in CATEGORY_BOUNDS]
+
+_STREET_CODES = {street: code for code, street in enumerate(STREETS)}
+_WINNER_CODES = {winner: code for code, winner in enumerate(WINNERS)}
+_CATEGORY_CODES = {name: code for code, name in enumerate(CATEGORIES)}
+
+
+def _card_bytes(cards, count):
+    indices = [CARD_INDEX[card_from_str(c) if isinstance(c, str) else c] for c in cards]
+    return bytes(indices + [NO_CARD] * (count - len(indices)))
+
+
+def _cards(raw):
+    return [card_to_str(FULL_DECK[index]) for index in raw if index != NO_CARD]
+
+
+def pack_record(record):
+    """Encode one hand record (the JSONL history layout) as bytes."""
+    cards = (
+        _card_bytes(record["player_hole"], 2)
+        + _card_bytes(record["opponent_hole"], 2)
+        + _card_bytes(record.get("community_cards", []), 5)
+    )
+    street = record.get("street") or (
+        "showdown" if record.get("showdown") else "preflop"
+    )
+    return RECORD.pack(
+        cards,
+        _STREET_CODES[street] << 4 | _WINNER_CODES[record.get("winner")],
+        _CATEGORY_CODES[record.get("player_rank")] << 4
+        | _CATEGORY_CODES[record.get("opponent_rank")],
+        record.get("bet", 0),
+        record.get("pot", 0),
+        record.get("net", 0),
+        record.get("money", 0),
+    )
+
+
+def unpack_record(raw, offset=0, number=1):
+    """Decode one record back into the JSONL history layout as hand ``number``."""
+    cards, outcome, ranks, bet, pot, net, money = RECORD.unpack_from(raw, offset)
+    street = STREETS[outcome >> 4]
+    return {
+        "round": number,
+        "street": street,
+        "player_hole": _cards(cards[:2]),
+        "opponent_hole": _cards(cards[2:4]),
+        "community_cards": _cards(cards[4:]),
+        "winner": WINNERS[outcome & 0xF],
+        "showdown": street == "showdown",
+        "player_rank": CATEGORIES[ranks >> 4],
+        "opponent_rank": CATEGORIES[ranks & 0xF],
+        "bet": bet,
+        "pot": pot,
+        "net": net,
+        "money": money,
+    }
+
+
+class BinaryHistoryWriter:
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+
+    def write(self, record):
+        self._file.write(pack_record(record))
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class BinaryHistory:
+    """Memory-mapped, random-access view of a binary history file."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, size = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION or size != RECORD.size:
+            raise ValueError("Not a binary hand history (or a different version)")
+        # A torn record at the end (crash mid-write) is ignored.
+        self._count = (len(self._map) - HEADER.size) // RECORD.size
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("hand index out of range")
+        return unpack_record(self._map, HEADER.size + index * RECORD.size, index + 1)
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield unpack_record(
+                self._map, HEADER.size + index * RECORD.size, index + 1
+            )
+
+    def raw(self, start=0, stop=None):
+        """Records ``start:stop`` as bytes, e.g. for NumPy or another process."""
+        stop = self._count if stop is None else min(stop, self._count)
+        return self._map[
+            HEADER.size + start * RECORD.size : HEADER.size + stop * RECORD.size
+        ]
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def legacy_record(key, hand, bet=0):
+    """One ``game_history.json`` hand (``"round3": {...}``) as a record.
+
+    That layout only recorded showdowns and has no pot or net.
+    """
+    return {
+        "round": int(key.replace("round", "") or 0),
+        "street": "showdown",
+        "showdown": True,
+        "player_hole": hand["player_hole"],
+        "opponent_hole": hand["opponent_hole"],
+        "community_cards": hand["community_cards"],
+        "winner": hand.get("result"),
+        "player_rank": hand.get("player_rank"),
+        "opponent_rank": hand.get("opponent_rank"),
+        "bet": bet,
+    }
+
+
+def convert_history(source, destination):
+    """Convert a JSONL history or a legacy ``game_history.json`` to binary.
+
+    Returns the number of hands written.
+    """
+    from src.history import read_history
+    from src.stats import history_format, iter_legacy_records
+
+    if history_format(source) == "legacy":
+        records = iter_legacy_records(source)
+    else:
+        records = read_history(source)
+    count = 0
+    with BinaryHistoryWriter(destination) as writer:
+        for record in records:
+            writer.write(record)
+            count += 1
+    return count
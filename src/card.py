@@ -0,0 +1,98 @@
+"""Integer card encoding shared by the deck, the evaluator and the game.
+
+Each card is a single int laid out like Cactus Kev's evaluator::
+
+    xxxbbbbb bbbbbbbb ssssrrrr xxpppppp
+
+    b = one bit per rank (2 = bit 16 ... A = bit 28)
+    s = one bit per suit (S = 0x1, H = 0x2, D = 0x4, C = 0x8)
+    r = rank index (2 = 0 ... A = 12)
+    p = rank prime (2 = 2 ... A = 41)
+
+Strings like "10H" or "AS" are only used at the edges (CLI, JSON history);
+``to_cards`` converts them so older string based calls keep working.
+"""
+
+import re
+
+RANKS = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"]
+SUITS = ["H", "D", "C", "S"]
+PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41]
+SUIT_BITS = {"S": 0x1, "H": 0x2, "D": 0x4, "C": 0x8}
+
+RANK_MASK = 0x0F00
+SUIT_MASK = 0xF000
+PRIME_MASK = 0x00FF
+
+_RANK_INDEX = {rank: index for index, rank in enumerate(RANKS)}
+_RANK_INDEX["T"] = _RANK_INDEX["10"]
+_SUIT_NAMES = {bit: suit for suit, bit in SUIT_BITS.items()}
+
+
+def make_card(rank_index, suit):
+    return (
+        (1 << (16 + rank_index))
+        | (SUIT_BITS[suit] << 12)
+        | (rank_index << 8)
+        | PRIMES[rank_index]
+    )
+
+
+# Same order as the original string deck: rank major, suits H, D, C, S.
+FULL_DECK = tuple(make_card(r, suit) for r in range(len(RANKS)) for suit in SUITS)
+CARD_INDEX = {card: index for index, card in enumerate(FULL_DECK)}
+
+
+def card_from_str(text):
+    text = text.strip().upper()
+    try:
+        return make_card(_RANK_INDEX[text[:-1]], text[-1])
+    except (KeyError, IndexError):
+        raise ValueError(f"Invalid card: {text!r}") from None
+
+
+def card_to_str(card):
+    return RANKS[(card >> 8) & 0xF] + _SUIT_NAMES[(card >> 12) & 0xF]
+
+
+def rank_index(card):
+    return (card >> 8) & 0xF
+
+
+def rank_value(card):
+    return ((card >> 8) & 0xF) + 2
+
+
+def suit_of(card):
+    return _SUIT_NAMES[(card >> 12) & 0xF]
+
+
+def is_red(card):
+    return card & 0x6000 != 0
+
+
+def to_card(card):
+    return card_from_str(card) if isinstance(card, str) else card
+
+
+def to_cards(cards):
+    return [card_from_str(c) if isinstance(c, str) else c for c in cards]
+
+
+def cards_to_str(cards):
+    return [card_to_str(card) for card in cards]
+
+
+_CARDS_PATTERN = re.compile(r"(?:(10|[2-9TJQKA])([HDCS]))*", re.IGNORECASE)
+_CARD_PATTERN = re.compile(r"(10|[2-9TJQKA])([HDCS])", re.IGNORECASE)
+
+
+def parse_cards(text):
+    """Parse "AH KH", "AH,KH" or "AhKh" into a list of int cards."""
+    compact = re.sub(r"[\s,]+", "", text or "")
+    if not _CARDS_PATTERN.fullmatch(compact):
+        raise ValueError(f"Invalid cards: {text!r}")
+    return [
+        make_card(_RANK_INDEX[rank.upper()], suit.upper())
+        for rank, suit in _CARD_PATTERN.findall(compact)
+    ]
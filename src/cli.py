@@ -1,43 +1,132 @@
 import click
-import json
+from src.card import cards_to_str, is_red, parse_cards
 from src.deck import Deck
-from src.game import PokerGame
+from src.game import BOTS, PokerGame
+from src.history import DEFAULT_PATH as DEFAULT_HISTORY_PATH, HandHistoryWriter
 
 
 @click.group()
-def cli():
-    pass
+@click.option(
+    "--profile", is_flag=True, help="Count and time the hot paths; report on exit"
+)
+@click.option(
+    "--profile-format",
+    default="table",
+    type=click.Choice(["table", "json"]),
+    help="Format of the --profile report (written to stderr)",
+)
+@click.option(
+    "--cprofile",
+    "cprofile_path",
+    default=None,
+    help="Also write cProfile stats (pstats format) here",
+)
+@click.pass_context
+def cli(ctx, profile, profile_format, cprofile_path):
+    if profile:
+        from src import profiling
+
+        profiling.enable()
+        ctx.call_on_close(lambda: _profile_report(profiling, profile_format))
+    if cprofile_path:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        ctx.call_on_close(lambda: _dump_cprofile(profiler, cprofile_path))
+
+
+def _profile_report(profiling, profile_format):
+    profiling.disable()
+    rows = profiling.report()
+    if profile_format == "json":
+        import json
+
+        click.echo(json.dumps(rows, indent=2), err=True)
+    else:
+        click.echo(profiling.format_report(rows), err=True)
+
+
+def _dump_cprofile(profiler, path):
+    profiler.disable()
+    profiler.dump_stats(path)
+    click.echo(f"cProfile stats written to {path} (python -m pstats {path})", err=True)
 
 
 @cli.command("info")
 @click.option(
     "--probability", is_flag=True, help="Display probabilities of poker hands"
 )
-def info(probability):
+@click.option(
+    "--preflop", is_flag=True, help="Display starting hands ranked by equity"
+)
+@click.option(
+    "--opponents",
+    default=1,
+    type=click.IntRange(1, 9),
+    help="Number of random opponents for --preflop",
+)
+@click.option(
+    "--cards",
+    default=7,
+    type=click.IntRange(5, 7),
+    help="Hand size for --probability (7 for Hold'em: hole cards and board)",
+)
+def info(probability, preflop, opponents, cards):
+    if preflop:
+        from src.preflop import get_preflop_table
+
+        chart = get_preflop_table().chart(opponents)
+        click.secho(f"Preflop equity vs {opponents} random opponent(s):", fg="blue")
+        for position, (name, equity) in enumerate(chart, 1):
+            click.secho(f"{position:3}. {name:<3} {equity * 100:6.2f}%", fg="yellow")
+        return
     game = PokerGame()
+    if probability:
+        percentages = game.category_percentages(cards)
+        click.secho(f"Best hand of {cards} random cards:", fg="blue")
     for rank, value in game.evaluator.hand_ranks.items():
         if probability:
-            prob = game.probabilities[rank]
+            prob = percentages[rank]
             click.secho(
-                f"{rank}: {value} - {prob:.4f}% - 1 in {1 / prob:,.0f}", fg="yellow"
+                f"{rank}: {value} - {prob:.4f}% - 1 in {100 / prob:,.0f}", fg="yellow"
             )
         else:
             click.secho(f"{rank}: {value}", fg="green")
 
 
 @cli.command("deal")
-@click.option("--hands", default=1, help="Number of hands to deal")
-def deal(hands):
+@click.option(
+    "--hands",
+    default=1,
+    type=click.IntRange(1, 23),
+    help="Number of hands to deal (at most 23 with a full board)",
+)
+@click.option(
+    "--equity",
+    "show_equity",
+    is_flag=True,
+    help="Show each hand's exact equity on the flop against the other hands",
+)
+def deal(hands, show_equity):
     game = PokerGame()
     hands_dealt, community_cards = game.deal_hands(hands)
-    flop = ", ".join(community_cards[:3])
-    for hand in hands_dealt:
-        cards = ", ".join(hand)
-        color = "red" if hand[0][-1] in ["H", "D"] else "black"
+    flop = ", ".join(cards_to_str(community_cards[:3]))
+    for seat, hand in enumerate(hands_dealt):
+        cards = ", ".join(cards_to_str(hand))
+        color = "red" if is_red(hand[0]) else "black"
         click.secho(f"Your cards: {cards}", fg=color)
         click.secho(f"Flop: {flop}", fg="green")
         rank, _ = game.evaluator.evaluate(hand + community_cards[:3])
         click.secho(f"Hand Rank (with flop): {rank}", fg="green")
+        if show_equity:
+            from src.equity import exact_equity
+
+            others = hands_dealt[:seat] + hands_dealt[seat + 1 :] or 1
+            result = exact_equity(hand, others, community_cards[:3])
+            click.secho(
+                f"Equity (with flop): {_percent(result['equity'])}", fg="green"
+            )
     click.echo()
 
 
@@ -45,23 +134,26 @@ def deal(hands):
 @click.option("--name", default="Player", help="Player name")
 @click.option("--bet", default=1, help="Amount to bet", type=click.IntRange(1, 1000))
 def play(name, bet):
-    game = PokerGame()
+    game = PokerGame(cache_size=64)
     (player_hole, opponent_hole), community_cards = game.deal_hands(2)
     pot = bet * 2
-    cards = ", ".join(player_hole)
-    color = "red" if player_hole[0][-1] in ["H", "D"] else "black"
+    player_cards = cards_to_str(player_hole)
+    opponent_cards = cards_to_str(opponent_hole)
+    board = cards_to_str(community_cards)
+    cards = ", ".join(player_cards)
+    color = "red" if is_red(player_hole[0]) else "black"
     click.secho(f"Your cards: {cards}", fg=color)
-    click.secho(f"Flop: {', '.join(community_cards[:3])}", fg="green")
-    click.secho(f"Turn: {community_cards[3]}", fg="green")
-    click.secho(f"With Turn: {', '.join(community_cards[:4])}", fg="green")
-    click.secho(f"River: {community_cards[4]}", fg="green")
-    click.secho(f"With River: {', '.join(community_cards)}", fg="green")
+    click.secho(f"Flop: {', '.join(board[:3])}", fg="green")
+    click.secho(f"Turn: {board[3]}", fg="green")
+    click.secho(f"With Turn: {', '.join(board[:4])}", fg="green")
+    click.secho(f"River: {board[4]}", fg="green")
+    click.secho(f"With River: {', '.join(board)}", fg="green")
     result = game.play(player_hole, opponent_hole, community_cards, pot, bet)
     click.secho(
-        f"Your hand: {player_hole} + {community_cards} -> {result['rank']}", fg="blue"
+        f"Your hand: {player_cards} + {board} -> {result['rank']}", fg="blue"
     )
     click.secho(
-        f"Opponent's hand: {opponent_hole} + {community_cards} -> {result['rank'] if result['winner'] == 'Tie' else game.evaluate_best_hand(opponent_hole, community_cards)[0]}",
+        f"Opponent's hand: {opponent_cards} + {board} -> {result['rank'] if result['winner'] == 'Tie' else game.evaluate_best_hand(opponent_hole, community_cards)[0]}",
         fg="blue",
     )
     if result["winner"] == "Player":
@@ -81,26 +173,59 @@ def play(name, bet):
 @click.option(
     "--money", default=100, help="Starting money", type=click.IntRange(10, 1000)
 )
-def interactive(name, rounds, money):
-    game = PokerGame()
+@click.option(
+    "--history",
+    "history_path",
+    default=DEFAULT_HISTORY_PATH,
+    help="JSONL file each hand is appended to",
+)
+@click.option(
+    "--bot",
+    default="rules",
+    type=click.Choice(BOTS),
+    help="Opponent: hand-category rules, or postflop decisions from equity",
+)
+@click.option(
+    "--budget-ms",
+    default=2.0,
+    type=click.FloatRange(0.1, None),
+    help="Thinking time per decision for --bot equity",
+)
+@click.option(
+    "--player-range",
+    default=None,
+    help='Range --bot equity puts you on, e.g. "22+,A2s+,KTo+" (default: any hand)',
+)
+def interactive(name, rounds, money, history_path, bot, budget_ms, player_range):
+    if player_range is not None:
+        from src.ranges import parse_range
+
+        try:
+            player_range = parse_range(player_range)
+        except ValueError as error:
+            raise click.BadParameter(str(error), param_hint="--player-range")
+    game = PokerGame(
+        cache_size=64, bot=bot, budget=budget_ms / 1000, player_range=player_range
+    )
+    # Only running totals stay in memory; hands are streamed to the writer.
     history = {
         "rounds": 0,
         "wins": 0,
         "losses": 0,
         "ties": 0,
         "money": money,
-        "bets": {},
-        "probabilities": {},
-        "hands": {},
     }
+    writer = HandHistoryWriter(history_path, flush_every=1)
     small_blind, big_blind = 1, 2
     for i in range(1, rounds + 1):
         player_total_bet = 0  # Track total bets for this round
+        start_money = history["money"]
         click.secho(f"Round {i}: Money: ${history['money']}", fg="blue")
         if history["money"] < big_blind:
             click.secho("Not enough money for big blind! Game over.", fg="red")
             break
         (player_hole, opponent_hole), community_cards = game.deal_hands(2)
+        context = game.new_context(opponent_hole)
         pot = small_blind + big_blind
         history["money"] -= big_blind
         player_total_bet += big_blind
@@ -109,8 +234,11 @@ def interactive(name, rounds, money):
             f"Blinds: Small Blind ${small_blind}, Big Blind ${big_blind} (deducted)",
             fg="yellow",
         )
-        cards = ", ".join(player_hole)
-        color = "red" if player_hole[0][-1] in ["H", "D"] else "black"
+        player_cards = cards_to_str(player_hole)
+        opponent_cards = cards_to_str(opponent_hole)
+        board = cards_to_str(community_cards)
+        cards = ", ".join(player_cards)
+        color = "red" if is_red(player_hole[0]) else "black"
         click.secho(f"Your cards: {cards}", fg=color)
         # Pre-flop betting
         current_bet = big_blind
@@ -130,6 +258,7 @@ def interactive(name, rounds, money):
                     opponent_money,
                     0,  # raise_count is not needed anymore
                     history["money"],
+                    context=context,
                 )
                 click.secho(
                     f"Opponent: {opponent_action.capitalize()} ${opponent_bet}",
@@ -174,6 +303,7 @@ def interactive(name, rounds, money):
                         opponent_money,
                         0,  # raise_count is not needed anymore
                         history["money"],
+                        context=context,
                     )
                     click.secho(
                         f"Opponent: {opponent_action.capitalize()} ${opponent_bet}",
@@ -221,6 +351,7 @@ def interactive(name, rounds, money):
                             opponent_money,
                             0,  # raise_count is not needed anymore
                             history["money"],
+                            context=context,
                         )
                         click.secho(
                             f"Opponent: {opponent_action.capitalize()} ${opponent_bet}",
@@ -262,12 +393,26 @@ def interactive(name, rounds, money):
             or (opponent_action is not None and opponent_action == "fold")
             or action == "finish"
         ):
+            writer.write(
+                _hand_record(
+                    i,
+                    "preflop",
+                    player_cards,
+                    opponent_cards,
+                    board[:0],
+                    _fold_winner(action),
+                    player_total_bet,
+                    pot,
+                    history["money"] - start_money,
+                    history["money"],
+                )
+            )
             if action == "finish":
                 break
             continue
         # Flop
-        click.secho(f"Flop: {', '.join(community_cards[:3])}", fg="green")
-        click.secho(f"With Flop: {', '.join(community_cards[:3])}", fg="green")
+        click.secho(f"Flop: {', '.join(board[:3])}", fg="green")
+        click.secho(f"With Flop: {', '.join(board[:3])}", fg="green")
         current_bet = 0
         last_raise = 0  # Reset for new street
         opponent_action = None
@@ -303,6 +448,7 @@ def interactive(name, rounds, money):
                     opponent_money,
                     0,  # raise_count is not needed anymore
                     history["money"],
+                    context=context,
                 )
                 click.secho(
                     f"Opponent: {opponent_action.capitalize()} ${opponent_bet}",
@@ -349,6 +495,7 @@ def interactive(name, rounds, money):
                             opponent_money,
                             0,  # raise_count is not needed anymore
                             history["money"],
+                            context=context,
                         )
                         click.secho(
                             f"Opponent: {opponent_action.capitalize()} ${opponent_bet}",
@@ -401,6 +548,7 @@ def interactive(name, rounds, money):
                             opponent_money,
                             0,  # raise_count is not needed anymore
                             history["money"],
+                            context=context,
                         )
                         click.secho(
                             f"Opponent: {opponent_action.capitalize()} ${opponent_bet}",
@@ -442,12 +590,26 @@ def interactive(name, rounds, money):
             or (opponent_action is not None and opponent_action == "fold")
             or action == "finish"
         ):
+            writer.write(
+                _hand_record(
+                    i,
+                    "flop",
+                    player_cards,
+                    opponent_cards,
+                    board[:3],
+                    _fold_winner(action),
+                    player_total_bet,
+                    pot,
+                    history["money"] - start_money,
+                    history["money"],
+                )
+            )
             if action == "finish":
                 break
             continue
         # Turn
-        click.secho(f"Turn: {community_cards[3]}", fg="green")
-        click.secho(f"With Turn: {', '.join(community_cards[:4])}", fg="green")
+        click.secho(f"Turn: {board[3]}", fg="green")
+        click.secho(f"With Turn: {', '.join(board[:4])}", fg="green")
         current_bet = 0
         last_raise = 0  # Reset for new street
         opponent_action = None
@@ -483,6 +645,7 @@ def interactive(name, rounds, money):
                     opponent_money,
                     0,  # raise_count is not needed anymore
                     history["money"],
+                    context=context,
                 )
                 click.secho(
                     f"Opponent: {opponent_action.capitalize()} ${opponent_bet}",
@@ -529,6 +692,7 @@ def interactive(name, rounds, money):
                             opponent_money,
                             0,  # raise_count is not needed anymore
                             history["money"],
+                            context=context,
                         )
                         click.secho(
                             f"Opponent: {opponent_action.capitalize()} ${opponent_bet}",
@@ -581,6 +745,7 @@ def interactive(name, rounds, money):
                             opponent_money,
                             0,  # raise_count is not needed anymore
                             history["money"],
+                            context=context,
                         )
                         click.secho(
                             f"Opponent: {opponent_action.capitalize()} ${opponent_bet}",
@@ -622,12 +787,26 @@ def interactive(name, rounds, money):
             or (opponent_action is not None and opponent_action == "fold")
             or action == "finish"
         ):
+            writer.write(
+                _hand_record(
+                    i,
+                    "turn",
+                    player_cards,
+                    opponent_cards,
+                    board[:4],
+                    _fold_winner(action),
+                    player_total_bet,
+                    pot,
+                    history["money"] - start_money,
+                    history["money"],
+                )
+            )
             if action == "finish":
                 break
             continue
         # River
-        click.secho(f"River: {community_cards[4]}", fg="green")
-        click.secho(f"With River: {', '.join(community_cards)}", fg="green")
+        click.secho(f"River: {board[4]}", fg="green")
+        click.secho(f"With River: {', '.join(board)}", fg="green")
         current_bet = 0
         last_raise = 0  # Reset for new street
         opponent_action = None
@@ -663,6 +842,7 @@ def interactive(name, rounds, money):
                     opponent_money,
                     0,  # raise_count is not needed anymore
                     history["money"],
+                    context=context,
                 )
                 click.secho(
                     f"Opponent: {opponent_action.capitalize()} ${opponent_bet}",
@@ -709,6 +889,7 @@ def interactive(name, rounds, money):
                             opponent_money,
                             0,  # raise_count is not needed anymore
                             history["money"],
+                            context=context,
                         )
                         click.secho(
                             f"Opponent: {opponent_action.capitalize()} ${opponent_bet}",
@@ -761,6 +942,7 @@ def interactive(name, rounds, money):
                             opponent_money,
                             0,  # raise_count is not needed anymore
                             history["money"],
+                            context=context,
                         )
                         click.secho(
                             f"Opponent: {opponent_action.capitalize()} ${opponent_bet}",
@@ -802,43 +984,56 @@ def interactive(name, rounds, money):
             or (opponent_action is not None and opponent_action == "fold")
             or action == "finish"
         ):
+            writer.write(
+                _hand_record(
+                    i,
+                    "river",
+                    player_cards,
+                    opponent_cards,
+                    board[:5],
+                    _fold_winner(action),
+                    player_total_bet,
+                    pot,
+                    history["money"] - start_money,
+                    history["money"],
+                )
+            )
             if action == "finish":
                 break
             continue
         # Showdown (if all-in, show remaining cards first)
         if history["money"] == 0:
             if len(community_cards[:3]) == 0:  # If all-in on preflop
-                click.secho(f"Flop: {', '.join(community_cards[:3])}", fg="green")
-                click.secho(f"With Flop: {', '.join(community_cards[:3])}", fg="green")
+                click.secho(f"Flop: {', '.join(board[:3])}", fg="green")
+                click.secho(f"With Flop: {', '.join(board[:3])}", fg="green")
             if len(community_cards[:4]) == 3:  # If all-in on flop
-                click.secho(f"Turn: {community_cards[3]}", fg="green")
-                click.secho(f"With Turn: {', '.join(community_cards[:4])}", fg="green")
+                click.secho(f"Turn: {board[3]}", fg="green")
+                click.secho(f"With Turn: {', '.join(board[:4])}", fg="green")
             if len(community_cards) == 4:  # If all-in on turn
-                click.secho(f"River: {community_cards[4]}", fg="green")
-                click.secho(f"With River: {', '.join(community_cards)}", fg="green")
+                click.secho(f"River: {board[4]}", fg="green")
+                click.secho(f"With River: {', '.join(board)}", fg="green")
         result = game.play(
             player_hole, opponent_hole, community_cards, pot, player_total_bet
         )
-        history["bets"][f"round{i}"] = player_total_bet
-        history["hands"][f"round{i}"] = {
-            "player_hole": player_hole,
-            "opponent_hole": opponent_hole,
-            "community_cards": community_cards,
-            "result": result["winner"],
-            "player_rank": result["rank"],
-            "opponent_rank": result["rank"]
+        opponent_rank = (
+            result["rank"]
             if result["winner"] == "Tie"
-            else game.evaluate_best_hand(opponent_hole, community_cards)[0],
-        }
+            else game.evaluate_best_hand(opponent_hole, community_cards)[0]
+        )
         history["rounds"] += 1
         click.secho(
-            f"Your hand: {player_hole} + {community_cards} -> {result['rank']}",
+            f"Your hand: {player_cards} + {board} -> {result['rank']}",
             fg="blue",
         )
         click.secho(
-            f"Opponent's hand: {opponent_hole} + {community_cards} -> {result['rank'] if result['winner'] == 'Tie' else game.evaluate_best_hand(opponent_hole, community_cards)[0]}",
+            f"Opponent's hand: {opponent_cards} + {board} -> {opponent_rank}",
             fg="blue",
         )
+        player_rank = (
+            result["rank"]
+            if result["winner"] != "Opponent"
+            else game.evaluate_best_hand(player_hole, community_cards)[0]
+        )
         if result["winner"] == "Player":
             history["wins"] += 1
             history["money"] += pot
@@ -852,13 +1047,482 @@ def interactive(name, rounds, money):
         else:
             history["ties"] += 1
             click.secho("It's a tie!", fg="yellow")
+        writer.write(
+            _hand_record(
+                i,
+                "showdown",
+                player_cards,
+                opponent_cards,
+                board,
+                result["winner"],
+                player_total_bet,
+                pot,
+                history["money"] - start_money,
+                history["money"],
+                player_rank,
+                opponent_rank,
+            )
+        )
+    writer.close()
     click.secho(f"Rounds: {history['rounds']}", fg="green")
     click.secho(f"Wins: {history['wins']}", fg="green")
     click.secho(f"Losses: {history['losses']}", fg="red")
     click.secho(f"Ties: {history['ties']}", fg="yellow")
     click.secho(f"Money: ${history['money']}", fg="green")
-    with open("game_history.json", "w") as f:
-        json.dump(history, f, indent=4)
+    click.secho(f"Hand history: {history_path}", fg="blue")
+
+
+def _fold_winner(action):
+    if action == "finish":
+        return None
+    return "Opponent" if action == "fold" else "Player"
+
+
+def _hand_record(
+    round_number,
+    street,
+    player_cards,
+    opponent_cards,
+    board,
+    winner,
+    bet,
+    pot,
+    net,
+    money,
+    player_rank=None,
+    opponent_rank=None,
+):
+    return {
+        "round": round_number,
+        "street": street,
+        "player_hole": player_cards,
+        "opponent_hole": opponent_cards,
+        "community_cards": board,
+        "winner": winner,
+        # Left with "finish" before the hand was decided.
+        "abandoned": winner is None,
+        "showdown": street == "showdown",
+        "player_rank": player_rank,
+        "opponent_rank": opponent_rank,
+        "bet": bet,
+        "pot": pot,
+        "net": net,
+        "money": money,
+    }
+
+
+def _parse_cards_option(text, param_hint):
+    try:
+        return parse_cards(text)
+    except ValueError as error:
+        raise click.BadParameter(str(error), param_hint=param_hint)
+
+
+def _parse_villain(text):
+    # Two cards, or else range notation ("QQ+,AKs").
+    try:
+        return parse_cards(text)
+    except ValueError:
+        pass
+    from src.ranges import parse_range
+
+    try:
+        return parse_range(text)
+    except ValueError as error:
+        raise click.BadParameter(str(error), param_hint="--villain")
+
+
+@cli.command("equity")
+@click.argument("hero")
+@click.option(
+    "--opponents", default=1, type=click.IntRange(1, 9), help="Number of opponents"
+)
+@click.option(
+    "--villain",
+    multiple=True,
+    help="Opponent cards ('QS QC') or range ('TT+,AKs,KQo:0.5'); repeatable",
+)
+@click.option("--board", default="", help="Known board cards, e.g. '10H JH 2C'")
+@click.option("--dead", default="", help="Cards removed from the deck")
+@click.option(
+    "--trials",
+    default=1_000_000,
+    type=click.IntRange(1, None),
+    help="Number of Monte Carlo trials",
+)
+@click.option("--seed", default=None, type=int, help="Random seed")
+@click.option(
+    "--exact", is_flag=True, help="Enumerate every runout instead of sampling"
+)
+def equity(hero, opponents, villain, board, dead, trials, seed, exact):
+    from src.equity import exact_equity, monte_carlo_equity
+
+    hero_cards = _parse_cards_option(hero, "HERO")
+    villains = [_parse_villain(hand) for hand in villain]
+    seats = villains + [None] * max(opponents - len(villains), 0)
+    board_cards = _parse_cards_option(board, "--board")
+    dead_cards = _parse_cards_option(dead, "--dead")
+    try:
+        if exact:
+            result = exact_equity(hero_cards, seats, board_cards, dead_cards)
+        else:
+            result = monte_carlo_equity(
+                hero_cards, seats, board_cards, dead_cards, trials=trials, seed=seed
+            )
+    except ValueError as error:
+        raise click.UsageError(str(error))
+    click.secho(
+        f"Hero: {', '.join(cards_to_str(hero_cards))} vs {len(seats)} opponent(s)",
+        fg="blue",
+    )
+    if exact:
+        click.secho(f"Win: {_percent(result['win'])} ({result['win']})", fg="green")
+        click.secho(f"Tie: {_percent(result['tie'])} ({result['tie']})", fg="yellow")
+        click.secho(f"Loss: {_percent(result['loss'])} ({result['loss']})", fg="red")
+        click.secho(
+            f"Equity: {_percent(result['equity'])} ({result['equity']}, "
+            f"{result['deals']:,} deals, {result['evaluated']:,} evaluated)",
+            fg="blue",
+        )
+        return
+    click.secho(f"Win: {_percent(result['win'])}", fg="green")
+    click.secho(f"Tie: {_percent(result['tie'])}", fg="yellow")
+    click.secho(f"Loss: {_percent(result['loss'])}", fg="red")
+    click.secho(
+        f"Equity: {_percent(result['equity'])} "
+        f"(± {result['stderr'] * 100:.2f}%, {result['trials']:,} trials)",
+        fg="blue",
+    )
+
+
+@cli.command("range-equity")
+@click.argument("hero")
+@click.argument("villain")
+@click.option("--board", required=True, help="Flop, turn or river, e.g. '10H JH 2C'")
+@click.option("--dead", default="", help="Cards removed from the deck")
+@click.option(
+    "--combos",
+    default=0,
+    type=click.IntRange(0, None),
+    help="Also list the hero's N best and N worst combos",
+)
+def range_equity_command(hero, villain, board, dead, combos):
+    import numpy as np
+
+    from src.equity import range_equity
+    from src.card import FULL_DECK
+    from src.ranges import COMBOS, parse_range
+
+    ranges = []
+    for text, hint in ((hero, "HERO"), (villain, "VILLAIN")):
+        try:
+            ranges.append(parse_range(text))
+        except ValueError as error:
+            raise click.BadParameter(str(error), param_hint=hint)
+    board_cards = _parse_cards_option(board, "--board")
+    dead_cards = _parse_cards_option(dead, "--dead")
+    try:
+        result = range_equity(*ranges, board_cards, dead_cards)
+    except ValueError as error:
+        raise click.UsageError(str(error))
+    click.secho(
+        f"{hero} vs {villain} on {' '.join(cards_to_str(board_cards))}", fg="blue"
+    )
+    click.secho(f"Win: {_percent(result['win'])}", fg="green")
+    click.secho(f"Tie: {_percent(result['tie'])}", fg="yellow")
+    click.secho(f"Loss: {_percent(result['loss'])}", fg="red")
+    click.secho(
+        f"Equity: {_percent(result['equity'])} ({result['boards']:,} runouts)",
+        fg="blue",
+    )
+    if not combos:
+        return
+    values = result["combos"]
+    slots = np.flatnonzero(~np.isnan(values))
+    slots = slots[np.argsort(-values[slots], kind="stable")]
+    shown = list(slots[:combos])
+    shown += [slot for slot in slots[-combos:] if slot not in shown]
+    for slot in shown:
+        hole = [FULL_DECK[index] for index in COMBOS[slot]]
+        click.echo(f"{' '.join(cards_to_str(hole)):<8} {_percent(values[slot])}")
+
+
+@cli.command("outs")
+@click.argument("hero")
+@click.option("--board", required=True, help="Flop or turn, e.g. '10H JH 2C'")
+@click.option(
+    "--villain", default=None, help="Opponent cards or range; a random hand if omitted"
+)
+@click.option("--dead", default="", help="Cards removed from the deck")
+def outs(hero, board, villain, dead):
+    from src.outs import analyze_outs
+
+    hero_cards = _parse_cards_option(hero, "HERO")
+    opponent = None if villain is None else _parse_villain(villain)
+    board_cards = _parse_cards_option(board, "--board")
+    dead_cards = _parse_cards_option(dead, "--dead")
+    try:
+        result = analyze_outs(hero_cards, board_cards, opponent, dead_cards)
+    except ValueError as error:
+        raise click.UsageError(str(error))
+    click.secho(
+        f"Hero: {', '.join(cards_to_str(hero_cards))} on "
+        f"{' '.join(cards_to_str(board_cards))} vs {villain or 'a random hand'}",
+        fg="blue",
+    )
+    click.echo(f"Now: {result['category']}")
+    click.secho(
+        f"Outs ({len(result['outs'])}): {' '.join(cards_to_str(result['outs']))}",
+        fg="green",
+    )
+    click.echo(f"{'card':<5} {'makes':<16} {'chance':>7} {'equity':>8}")
+    for row in result["cards"]:
+        click.secho(
+            f"{cards_to_str([row['card']])[0]:<5} {row['category']:<16} "
+            f"{_percent(row['probability']):>7} {_percent(row['equity']):>8}",
+            fg="green" if row["improves"] else None,
+        )
+    click.secho("By the river:", fg="blue")
+    click.echo(f"Improve: {_percent(result['improve'])}")
+    for name, probability in result["categories"].items():
+        click.echo(f"  {name:<16} {_percent(probability):>7}")
+    click.secho(
+        f"Equity: {_percent(result['equity'])} (win {_percent(result['win'])}, "
+        f"tie {_percent(result['tie'])}, {result['runouts']:,} runouts)",
+        fg="blue",
+    )
+
+
+@cli.command("simulate")
+@click.option(
+    "--hands", default=100_000, type=click.IntRange(1, None), help="Hands to play"
+)
+@click.option(
+    "--betting", is_flag=True, help="Let the bot play both seats through every street"
+)
+@click.option(
+    "--bet",
+    default=1,
+    type=click.IntRange(1, 1000),
+    help="Fixed bet per seat without --betting",
+)
+@click.option(
+    "--stack",
+    default=100,
+    type=click.IntRange(10, 1000),
+    help="Starting stack per hand with --betting",
+)
+@click.option(
+    "--workers", default=1, type=click.IntRange(1, None), help="Worker processes"
+)
+@click.option("--seed", default=None, type=int, help="Master random seed")
+@click.option(
+    "--replay",
+    default=None,
+    type=click.IntRange(0, None),
+    help="Only replay this hand number of the run with --seed",
+)
+def simulate(hands, betting, bet, stack, workers, seed, replay):
+    import time
+    from src.simulation import replay_hand, simulate_sharded
+
+    if replay is not None:
+        if seed is None:
+            raise click.UsageError("--replay needs the --seed of the run")
+        hand = replay_hand(seed, replay, betting, bet, stack)
+        result = hand["result"]
+        click.secho(f"Hand {replay} of seed {seed}", fg="blue")
+        click.secho(f"Player: {', '.join(cards_to_str(hand['player']))}", fg="green")
+        click.secho(
+            f"Opponent: {', '.join(cards_to_str(hand['opponent']))}", fg="green"
+        )
+        click.secho(f"Board: {', '.join(cards_to_str(hand['board']))}", fg="green")
+        outcome = result["rank"] or "fold"
+        click.secho(
+            f"Winner: {result['winner']} ({outcome}), net {hand['net']:+}", fg="blue"
+        )
+        return
+
+    start = time.perf_counter()
+    stats, seed = simulate_sharded(hands, workers, seed, betting, bet, stack)
+    elapsed = time.perf_counter() - start
+    click.secho(f"Seed: {seed}", fg="blue")
+    _print_simulation(stats, elapsed)
+
+
+def _print_simulation(stats, elapsed):
+    hands = stats["hands"]
+    click.secho(f"Hands: {hands:,}", fg="blue")
+    for key, color in (("wins", "green"), ("losses", "red"), ("ties", "yellow")):
+        click.secho(
+            f"{key.capitalize()}: {stats[key]:,} ({stats[key] / hands:.2%})", fg=color
+        )
+    if stats["folds"]:
+        click.secho(f"Ended by fold: {stats['folds']:,}", fg="yellow")
+    click.secho(
+        f"Net chips: {stats['net']:+,} ({stats['net'] / hands * 100:+.2f} per 100 hands)",
+        fg="blue",
+    )
+    showdowns = hands - stats["folds"]
+    click.secho("Winning hands at showdown:", fg="blue")
+    ranks = PokerGame().evaluator.hand_ranks
+    for rank in sorted(stats["categories"], key=ranks.get, reverse=True):
+        count = stats["categories"][rank]
+        click.secho(f"  {rank}: {count:,} ({count / showdowns:.2%})", fg="green")
+    click.secho(f"{hands / elapsed:,.0f} hands/s ({elapsed:.2f}s)", fg="blue")
+
+
+@cli.command("bench")
+@click.option(
+    "--only", "names", multiple=True, help="Run only this benchmark (repeatable)"
+)
+@click.option(
+    "--duration",
+    default=0.5,
+    type=click.FloatRange(0.01, None),
+    help="Seconds per benchmark",
+)
+@click.option("--save", default=None, help="Write the results to this JSON baseline")
+@click.option(
+    "--baseline",
+    default=None,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Compare against this JSON baseline",
+)
+@click.option(
+    "--threshold",
+    default=0.2,
+    type=click.FloatRange(0, 1),
+    help="Allowed throughput drop before failing (0.2 = 20%)",
+)
+def bench(names, duration, save, baseline, threshold):
+    from src.bench import load_baseline, regressions, run_suite, save_baseline
+
+    try:
+        report = run_suite(names, duration)
+    except ValueError as error:
+        raise click.BadParameter(str(error), param_hint="--only")
+    base = load_baseline(baseline)["benchmarks"] if baseline else {}
+    header = f"{'benchmark':<24} {'ops/s':>12}"
+    header += "".join(f" {title:>9}" for title in ("p50 us", "p90 us", "p99 us"))
+    click.secho(header + (f" {'vs base':>8}" if base else ""), fg="blue")
+    for name, result in report["benchmarks"].items():
+        line = (
+            f"{name:<24} {result['ops_per_sec']:>12,.0f} {result['p50_us']:>9.2f} "
+            f"{result['p90_us']:>9.2f} {result['p99_us']:>9.2f}"
+        )
+        if name in base:
+            line += f" {result['ops_per_sec'] / base[name]['ops_per_sec'] - 1:>+8.1%}"
+        click.secho(line, fg="green")
+    if save:
+        save_baseline(report, save)
+        click.secho(f"Saved baseline to {save}", fg="blue")
+    if baseline:
+        slower = regressions(report, {"benchmarks": base}, threshold)
+        for name, before, after in slower:
+            click.secho(
+                f"Regression: {name} {before:,.0f} -> {after:,.0f} ops/s", fg="red"
+            )
+        if slower:
+            raise click.ClickException(
+                f"{len(slower)} benchmark(s) slower than baseline by more than "
+                f"{threshold:.0%}"
+            )
+
+
+@cli.command("stats")
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--workers", default=1, type=click.IntRange(1, None), help="Worker processes"
+)
+@click.option("--json", "as_json", is_flag=True, help="Print the summary as JSON")
+def stats(path, workers, as_json):
+    from src.stats import summarize_history
+
+    try:
+        summary = summarize_history(path, workers)
+    except (ValueError, KeyError) as error:
+        raise click.UsageError(f"Cannot read {path}: {error}")
+    if as_json:
+        import json
+
+        click.echo(json.dumps(summary, indent=2))
+        return
+    hands = summary["hands"]
+    if summary["abandoned"]:
+        click.secho(
+            f"Abandoned hands (not counted): {summary['abandoned']:,}", fg="yellow"
+        )
+    if not hands:
+        click.secho("No hands recorded.", fg="yellow")
+        return
+    click.secho(f"Hands: {hands:,}", fg="blue")
+    click.secho(f"Win rate: {summary['wins'] / hands:.2%}", fg="green")
+    click.secho(
+        f"Losses: {summary['losses'] / hands:.2%}, ties: {summary['ties'] / hands:.2%}",
+        fg="yellow",
+    )
+    click.secho(
+        f"Net chips: {summary['net']:+,} ({summary['net'] / hands:+.3f} per hand)",
+        fg="blue",
+    )
+    click.secho(f"Showdowns: {summary['showdowns'] / hands:.2%}", fg="blue")
+    ranks = PokerGame().evaluator.hand_ranks
+    for key, title in (
+        ("by_player_rank", "Player's hand"),
+        ("by_opponent_rank", "Opponent's hand"),
+    ):
+        click.secho(f"{title:<16} {'hands':>10} {'win':>8} {'net':>10}", fg="blue")
+        rows = summary[key]
+        for rank in sorted(rows, key=lambda name: ranks.get(name, 0), reverse=True):
+            row = rows[rank]
+            click.secho(
+                f"{rank:<16} {row['hands']:>10,} {row['wins'] / row['hands']:>8.2%} "
+                f"{row['net']:>+10,}",
+                fg="green",
+            )
+
+
+@cli.command("convert-history")
+@click.argument("source", type=click.Path(exists=True, dir_okay=False))
+@click.argument("destination", type=click.Path(dir_okay=False))
+def convert_history(source, destination):
+    from src.binary_history import RECORD, convert_history as convert
+
+    try:
+        count = convert(source, destination)
+    except (ValueError, KeyError) as error:
+        raise click.UsageError(f"Cannot convert {source}: {error}")
+    click.secho(
+        f"Wrote {count:,} hands to {destination} ({RECORD.size} bytes per hand)",
+        fg="green",
+    )
+
+
+@cli.command("build-preflop")
+@click.option(
+    "--trials",
+    default=200_000,
+    type=click.IntRange(1, None),
+    help="Monte Carlo trials per hand and opponent count",
+)
+@click.option(
+    "--workers", default=None, type=click.IntRange(1, None), help="Worker processes"
+)
+@click.option("--seed", default=0, type=int, help="Random seed")
+@click.option("--output", default=None, help="Output file (default: packaged table)")
+def build_preflop(trials, workers, seed, output):
+    import time
+    from src.preflop import build_preflop_table, write_preflop_table
+
+    start = time.perf_counter()
+    equities = build_preflop_table(trials, workers, seed)
+    path = write_preflop_table(equities, trials, output)
+    click.secho(f"Wrote {path} ({time.perf_counter() - start:.1f}s)", fg="green")
+
+
+def _percent(value):
+    return f"{float(value) * 100:.2f}%"
 
 
 if __name__ == "__main__":
@@ -1,21 +1,79 @@
 import random
+from src.card import CARD_INDEX, FULL_DECK, to_card
+
+_INDICES = tuple(range(len(FULL_DECK)))
+
 
 class Deck:
-    def __init__(self):
+    """52 cards dealt from one fixed list without copying it.
+
+    ``_order`` holds `FULL_DECK` indices: ``_order[:_next]`` have been dealt,
+    ``_order[_next:_end]`` are still in the deck and ``_order[_end:]`` were
+    removed as dead cards.  ``shuffle`` only switches to random dealing: each
+    `deal` then runs the partial Fisher-Yates steps for the cards it hands
+    out, so a hand that uses 9 cards never shuffles the other 43.  ``_slot``
+    maps an index back to its position, which makes `remove` O(1).
+    """
+
+    def __init__(self, rng=None):
         self.suits = ["H", "D", "C", "S"]
         self.ranks = [str(i) for i in range(2, 11)] + ["J", "Q", "K", "A"]
-        self.reset()
+        # Any object with random.Random's methods; the shared module-level
+        # generator by default.
+        self.rng = random if rng is None else rng
+        self._order = list(_INDICES)
+        self._slot = list(_INDICES)
+        self._next = 0
+        self._end = len(FULL_DECK)
+        self._shuffled = False
 
-    def reset(self):
-        self.cards = [rank + suit for suit in self.suits for rank in self.ranks]
-        random.seed()
+    @property
+    def cards(self):
+        """The cards still in the deck."""
+        return [FULL_DECK[i] for i in self._order[self._next : self._end]]
+
+    def __len__(self):
+        return self._end - self._next
 
     def shuffle(self):
-        random.shuffle(self.cards)
+        self._shuffled = True
 
     def deal(self, num_cards):
-        if len(self.cards) < num_cards:
+        start, end = self._next, self._end
+        if num_cards > end - start:
             raise ValueError("Not enough cards in deck")
-        dealt_cards = self.cards[:num_cards]
-        self.cards = self.cards[num_cards:]
-        return dealt_cards
\ No newline at end of file
+        if self._shuffled:
+            order, slot, draw = self._order, self._slot, self.rng.random
+            for position in range(start, start + num_cards):
+                pick = position + int(draw() * (end - position))
+                card, other = order[pick], order[position]
+                order[position], order[pick] = card, other
+                slot[card], slot[other] = position, pick
+        self._next = start + num_cards
+        return [FULL_DECK[i] for i in self._order[start : self._next]]
+
+    def remove(self, card):
+        """Take a card out of the deck (e.g. a known dead card) in O(1)."""
+        index = CARD_INDEX[to_card(card)]
+        position = self._slot[index]
+        if not self._next <= position < self._end:
+            raise ValueError("Card is not in the deck")
+        last = self._end - 1
+        order, slot = self._order, self._slot
+        other = order[last]
+        order[position], order[last] = other, index
+        slot[other], slot[index] = position, last
+        self._end = last
+
+    def reset(self):
+        # Restore the original order in place; nothing is allocated.
+        self._order[:] = _INDICES
+        self._slot[:] = _INDICES
+        self._next = 0
+        self._end = len(FULL_DECK)
+        self._shuffled = False
+
+    @staticmethod
+    def full_name_suit(suit):
+        suit_map = {"H": "Hearts", "D": "Diamonds", "C": "Clubs", "S": "Spades"}
+        return suit_map.get(suit, "Unknown")
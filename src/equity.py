@@ -0,0 +1,587 @@
+"""Hand equity against opponents holding known or random cards.
+
+Cards are dealt and evaluated in NumPy batches: each chunk of trials draws
+the missing board and opponent cards with a vectorised partial Fisher-Yates
+shuffle, and 7-card strengths come from summed per-card keys
+(`src.batch.INDEX_KEYS`), so the hero's and the board's contribution is
+computed once per trial rather than once per player.
+
+`exact_equity` enumerates every runout instead.  Runouts that are the same
+up to a relabelling of suits which leaves all known cards in place (e.g.
+diamonds <-> clubs when neither appears in any known hand) give the same
+result, so only one runout per equivalence class is evaluated and it is
+weighted by the size of its class.
+"""
+
+import math
+import time
+from fractions import Fraction
+from itertools import permutations
+
+import numpy as np
+
+from src.batch import INDEX_KEYS, strengths_from_keys
+from src.card import CARD_INDEX, FULL_DECK, to_cards
+from src.lookup_tables import get_tables
+from src.ranges import COMBO_MASKS, COMBOS, NUM_COMBOS, Range
+
+CHUNK_TRIALS = 1 << 16
+EXACT_LIMIT = 25_000_000
+# anytime_equity: chunk size, default time budget (s), target stderr, trial cap.
+ANYTIME_CHUNK = 256
+ANYTIME_BUDGET = 0.002
+ANYTIME_STDERR = 0.01
+ANYTIME_MAX_TRIALS = 1 << 14
+# range_equity: runouts solved per NumPy pass, and the most runouts allowed.
+RANGE_CHUNK_BOARDS = 64
+RANGE_BOARD_LIMIT = 20_000
+# Strengths are below this, so (group * STRENGTH_SPAN + strength) sorts by
+# group first.
+STRENGTH_SPAN = 1 << 13
+# Card index -> its bit in a suit-major mask (13 rank bits per suit).
+SUIT_MAJOR_BITS = np.array(
+    [1 << (13 * suit + rank) for rank in range(13) for suit in range(4)], dtype=np.int64
+)
+
+
+def _indices(cards):
+    try:
+        return [CARD_INDEX[card] for card in to_cards(cards)]
+    except KeyError as error:
+        raise ValueError(f"Invalid card: {error.args[0]!r}") from None
+
+
+def parse_spot(hero, opponents=1, board=(), dead=()):
+    """Validate a spot and return it as card indices.
+
+    ``opponents`` is either a count of random hands or a list whose items are
+    two known cards, a `Range` or ``None`` for a random hand.  Returns
+    ``(hero, opponents, board, live)`` where ``live`` holds the undealt card
+    indices; ranges come back without the combos the known cards block.
+    """
+    hero = _indices(hero)
+    if len(hero) != 2:
+        raise ValueError("Hero needs exactly 2 hole cards")
+    if isinstance(opponents, int):
+        opponents = [None] * opponents
+    if not opponents:
+        raise ValueError("At least one opponent is required")
+    opponents = [
+        hand if hand is None or isinstance(hand, Range) else _indices(hand)
+        for hand in opponents
+    ]
+    if any(isinstance(hand, list) and len(hand) != 2 for hand in opponents):
+        raise ValueError("Known opponent hands need exactly 2 cards")
+    board = _indices(board)
+    if len(board) > 5:
+        raise ValueError("The board has at most 5 cards")
+    used = hero + board + _indices(dead)
+    for hand in opponents:
+        if isinstance(hand, list):
+            used += hand
+    if len(set(used)) != len(used):
+        raise ValueError("The same card is used twice")
+    used = set(used)
+    known = [FULL_DECK[index] for index in used]
+    opponents = [
+        hand.remove(known) if isinstance(hand, Range) else hand for hand in opponents
+    ]
+    if any(isinstance(hand, Range) and not len(hand) for hand in opponents):
+        raise ValueError("An opponent's range has no combos left")
+    live = [index for index in range(52) if index not in used]
+    needed = 5 - len(board) + 2 * opponents.count(None)
+    if needed > len(live):
+        raise ValueError("Not enough cards left in the deck")
+    ranges = sorted(
+        (
+            [int(mask) for mask in COMBO_MASKS[hand.slots()]]
+            for hand in opponents
+            if isinstance(hand, Range)
+        ),
+        key=len,
+    )
+    if not _can_deal(ranges, len(live) - needed):
+        raise ValueError("The opponents' ranges cannot all be dealt together")
+    return hero, opponents, board, live
+
+
+def _can_deal(ranges, spare, used=0):
+    # True if each range (a list of combo masks) can get a combo, no two
+    # sharing a card, with ``spare`` live cards to go round.
+    if not ranges:
+        return True
+    if spare < 2:
+        return False
+    return any(
+        not mask & used and _can_deal(ranges[1:], spare - 2, used | mask)
+        for mask in ranges[0]
+    )
+
+
+def deal_batch(rng, live, trials, num_cards):
+    """Deal ``num_cards`` distinct cards from ``live`` for each trial.
+
+    A partial Fisher-Yates shuffle run on every row at once: only the
+    first ``num_cards`` positions are ever swapped.
+    """
+    deck = np.tile(np.asarray(live, dtype=np.uint8), (trials, 1))
+    rows = np.arange(trials)
+    for position in range(num_cards):
+        swap = rng.integers(position, len(live), size=trials)
+        picked = deck[rows, swap]
+        deck[rows, swap] = deck[:, position]
+        deck[:, position] = picked
+    return deck[:, :num_cards]
+
+
+def showdown_shares(hero_strengths, opponent_strengths):
+    """Hero's pot share per trial: 1 for a win, 1/k for a k-way split."""
+    best = np.max(opponent_strengths, axis=0)
+    tied = np.count_nonzero(opponent_strengths == hero_strengths, axis=0)
+    shares = np.where(hero_strengths > best, 1.0, 0.0)
+    split = hero_strengths == best
+    shares[split] = 1.0 / (1 + tied[split])
+    return shares
+
+
+def _result(trials, wins, ties, share_sum, share_squares):
+    equity = share_sum / trials
+    variance = max(share_squares / trials - equity * equity, 0.0)
+    return {
+        "win": wins / trials,
+        "tie": ties / trials,
+        "loss": (trials - wins - ties) / trials,
+        "equity": equity,
+        "stderr": math.sqrt(variance / trials),
+        "trials": trials,
+    }
+
+
+class _Sampler:
+    """Runs chunks of random runouts for one validated spot."""
+
+    def __init__(self, hero, opponents, board, live, rng):
+        self.opponents = opponents
+        self.board = board
+        self.live = live
+        self.rng = rng
+        self.tables = get_tables()
+        self.missing = 5 - len(board)
+        self.needed = self.missing + 2 * opponents.count(None)
+        # Range seats: the combo slots and their sampling probabilities.
+        self.ranges = [
+            (hand.slots(), hand.weights[hand.slots()] / hand.total())
+            for hand in opponents
+            if isinstance(hand, Range)
+        ]
+        self.hero = np.array(hero)
+        self.hero_key = INDEX_KEYS[self.hero].sum()
+        self.board_key = INDEX_KEYS[board].sum()
+
+    def _deal(self, n):
+        # Range combos are drawn independently of the deck; rows where they
+        # clash with a dealt card or with each other are drawn again.
+        drawn = deal_batch(self.rng, self.live, n, self.needed)
+        held = [COMBOS[self.rng.choice(slots, n, p=p)] for slots, p in self.ranges]
+        rows = np.arange(n)
+        while held and len(rows):
+            cards = np.sort(np.concatenate([drawn[rows]] + [h[rows] for h in held], 1))
+            rows = rows[np.any(cards[:, 1:] == cards[:, :-1], axis=1)]
+            drawn[rows] = deal_batch(self.rng, self.live, len(rows), self.needed)
+            for hole, (slots, p) in zip(held, self.ranges):
+                hole[rows] = COMBOS[self.rng.choice(slots, len(rows), p=p)]
+        return drawn, held
+
+    def shares(self, n):
+        """Hero's pot share in each of ``n`` random runouts."""
+        board, missing, tables = self.board, self.missing, self.tables
+        drawn, held = self._deal(n)
+        held = iter(held)
+        full_board = np.empty((n, 5), dtype=np.uint8)
+        full_board[:, : len(board)] = board
+        full_board[:, len(board) :] = drawn[:, :missing]
+        board_totals = self.board_key + INDEX_KEYS[drawn[:, :missing]].sum(axis=1)
+        hero_strengths = strengths_from_keys(
+            self.hero_key + board_totals, self.hero, full_board, tables
+        )
+        opponent_strengths = np.empty((len(self.opponents), n), dtype=np.uint16)
+        column = missing
+        for seat, hand in enumerate(self.opponents):
+            if hand is None:
+                hole = drawn[:, column : column + 2]
+                hole_key = INDEX_KEYS[hole].sum(axis=1)
+                column += 2
+            elif isinstance(hand, Range):
+                hole = next(held)
+                hole_key = INDEX_KEYS[hole].sum(axis=1)
+            else:
+                hole = np.array(hand)
+                hole_key = INDEX_KEYS[hole].sum()
+            opponent_strengths[seat] = strengths_from_keys(
+                hole_key + board_totals, hole, full_board, tables
+            )
+        return showdown_shares(hero_strengths, opponent_strengths)
+
+
+def monte_carlo_equity(hero, opponents=1, board=(), dead=(), trials=100_000, seed=None):
+    """Estimate hero's win/tie/loss probabilities by random runouts.
+
+    Returns a dict with ``win``, ``tie``, ``loss``, ``equity`` (pot share,
+    ties split), its standard error ``stderr`` and ``trials``.
+    """
+    if trials <= 0:
+        raise ValueError("trials must be positive")
+    sampler = _Sampler(
+        *parse_spot(hero, opponents, board, dead), np.random.default_rng(seed)
+    )
+    wins = ties = 0
+    share_sum = share_squares = 0.0
+    done = 0
+    while done < trials:
+        n = min(CHUNK_TRIALS, trials - done)
+        shares = sampler.shares(n)
+        wins += int(np.count_nonzero(shares == 1.0))
+        ties += int(np.count_nonzero((shares > 0.0) & (shares < 1.0)))
+        share_sum += float(shares.sum())
+        share_squares += float(np.dot(shares, shares))
+        done += n
+    return _result(trials, wins, ties, share_sum, share_squares)
+
+
+def anytime_equity(
+    hero,
+    opponents=1,
+    board=(),
+    dead=(),
+    budget=ANYTIME_BUDGET,
+    target_stderr=ANYTIME_STDERR,
+    max_trials=ANYTIME_MAX_TRIALS,
+    seed=None,
+):
+    """`monte_carlo_equity` that stops as soon as it is good enough.
+
+    Runouts are sampled in chunks until the standard error is at most
+    ``target_stderr``, ``max_trials`` runouts are done or the next chunk
+    would not finish within ``budget`` seconds (None for no time limit).
+    The first chunk (`ANYTIME_CHUNK` runouts) always runs; later ones are
+    sized from the time the previous chunk took.  With a time budget the
+    number of trials, and so the estimate, depends on the machine's speed.
+    """
+    start = time.perf_counter()
+    sampler = _Sampler(
+        *parse_spot(hero, opponents, board, dead), np.random.default_rng(seed)
+    )
+    wins = ties = 0
+    share_sum = share_squares = 0.0
+    done = 0
+    n = min(ANYTIME_CHUNK, max_trials)
+    while True:
+        began = time.perf_counter()
+        shares = sampler.shares(n)
+        took = time.perf_counter() - began
+        wins += int(np.count_nonzero(shares == 1.0))
+        ties += int(np.count_nonzero((shares > 0.0) & (shares < 1.0)))
+        share_sum += float(shares.sum())
+        share_squares += float(np.dot(shares, shares))
+        done += n
+        result = _result(done, wins, ties, share_sum, share_squares)
+        if result["stderr"] <= target_stderr or done >= max_trials:
+            return result
+        size = min(max_trials - done, 4 * n)
+        if target_stderr > 0:
+            # Trials still needed for the target, from stderr ~ 1 / sqrt(trials).
+            size = min(
+                size, math.ceil(done * (result["stderr"] / target_stderr) ** 2) - done
+            )
+        if budget is not None:
+            # A chunk costs a fixed overhead plus a per-runout part, so no
+            # chunk is slower than the last one scaled up by its size ratio.
+            remaining = budget - (time.perf_counter() - start)
+            if remaining < took:
+                return result
+            size = min(size, int(n * remaining / took))
+        n = min(max(size, ANYTIME_CHUNK // 4), max_trials - done)
+
+
+def suit_symmetries(card_sets):
+    """Suit permutations (suit position -> suit position) fixing every card set."""
+    symmetries = []
+    for perm in permutations(range(4)):
+        mapping = [rank * 4 + perm[suit] for rank in range(13) for suit in range(4)]
+        if all({mapping[card] for card in cards} == set(cards) for cards in card_sets):
+            symmetries.append(perm)
+    return symmetries
+
+
+def _orbit_minimal(masks, symmetries):
+    # A combination is kept when its suit-major card mask is the smallest in
+    # its orbit; the orbit size is |G| / |stabiliser|, counted on the way, so
+    # no sort or hash over all combinations is needed.
+    fields = [(masks >> (13 * suit)) & 0x1FFF for suit in range(4)]
+    is_minimal = np.ones(len(masks), dtype=bool)
+    stabiliser = np.ones(len(masks), dtype=np.int64)
+    for perm in symmetries:
+        if perm == (0, 1, 2, 3):
+            continue
+        image = fields[0] << (13 * perm[0])
+        for suit in range(1, 4):
+            image |= fields[suit] << (13 * perm[suit])
+        is_minimal &= masks <= image
+        stabiliser += image == masks
+    keep = np.flatnonzero(is_minimal)
+    return keep, len(symmetries) // stabiliser[keep]
+
+
+def canonical_combinations(pool, k, symmetries=()):
+    """k-card combinations of ``pool``, one per suit-isomorphism class.
+
+    Returns ``(combinations, weights)``: a (C, k) card index array and the
+    size of each combination's class.  Without ``symmetries`` every
+    combination is returned with weight 1.  Combinations are built one card
+    at a time and the orbit test runs on the masks before the last level is
+    materialised, so the discarded rows are never copied.
+    """
+    pool = np.asarray(pool, dtype=np.uint8)
+    n = len(pool)
+    if k == 0 or k > n:
+        return np.zeros((int(k == 0), k), dtype=np.uint8), np.ones(int(k == 0), dtype=np.int64)
+    reduce = len(symmetries) > 1
+    bits = SUIT_MAJOR_BITS[pool]
+    combos = np.arange(n - k + 1, dtype=np.uint8)[:, None]
+    masks = bits[: n - k + 1]
+    weights = np.ones(len(combos), dtype=np.int64)
+    if k == 1 and reduce:
+        keep, weights = _orbit_minimal(masks, symmetries)
+        combos = combos[keep]
+    for level in range(1, k):
+        last = combos[:, -1].astype(np.int64)
+        counts = (n - k + level) - last
+        ends = np.cumsum(counts)
+        rows = np.repeat(np.arange(len(combos)), counts)
+        values = np.arange(len(rows)) + np.repeat(last + 1 - (ends - counts), counts)
+        if level == k - 1:
+            if reduce:
+                keep, weights = _orbit_minimal(masks[rows] | bits[values], symmetries)
+                rows, values = rows[keep], values[keep]
+            else:
+                weights = np.ones(len(rows), dtype=np.int64)
+        else:
+            masks = masks[rows] | bits[values]
+        grown = np.empty((len(rows), level + 1), dtype=np.uint8)
+        grown[:, :level] = combos[rows]
+        grown[:, level] = values
+        combos = grown
+    return pool[combos], weights
+
+
+def combination_array(pool, k):
+    """All k-card combinations of ``pool`` as a (C(len(pool), k), k) array."""
+    return canonical_combinations(pool, k)[0]
+
+
+def _card_masks(cards):
+    return np.left_shift(1, cards.astype(np.int64)).sum(axis=1)
+
+
+def exact_equity(hero, opponents=1, board=(), dead=(), limit=EXACT_LIMIT):
+    """Exact win/tie/loss probabilities by enumerating every runout.
+
+    Random opponents' hands are enumerated too.  Returns the same keys as
+    `monte_carlo_equity` as `Fraction`s, plus ``deals`` (the number of
+    equally likely deals) and ``evaluated`` (deals actually evaluated after
+    the suit-symmetry reduction).  Raises ``ValueError`` when more than
+    ``limit`` deals would have to be evaluated.
+    """
+    hero, opponents, board, live = parse_spot(hero, opponents, board, dead)
+    if any(isinstance(hand, Range) for hand in opponents):
+        raise ValueError("Exact equity needs known or random opponent hands")
+    missing = 5 - len(board)
+    random_seats = opponents.count(None)
+    known_sets = [hero, board, live] + [hand for hand in opponents if hand]
+    runouts, weights = canonical_combinations(
+        live, missing, suit_symmetries(known_sets)
+    )
+    remaining = len(live) - missing
+    evaluated = len(runouts)
+    for seat in range(random_seats):
+        evaluated *= math.comb(remaining - 2 * seat, 2)
+    if evaluated > limit:
+        raise ValueError(
+            f"Exact enumeration needs {evaluated:,} evaluations (limit {limit:,}); "
+            "use Monte Carlo instead"
+        )
+
+    # Deal every random opponent every pair that is still live in that row.
+    dealt = runouts
+    pairs = combination_array(live, 2)
+    pair_masks = _card_masks(pairs)
+    for _ in range(random_seats):
+        rows, columns = np.nonzero(
+            (_card_masks(dealt)[:, None] & pair_masks[None, :]) == 0
+        )
+        dealt = np.concatenate([dealt[rows], pairs[columns]], axis=1)
+        weights = weights[rows]
+
+    tables = get_tables()
+    n = len(dealt)
+    full_board = np.empty((n, 5), dtype=np.uint8)
+    full_board[:, : len(board)] = board
+    full_board[:, len(board) :] = dealt[:, :missing]
+    board_totals = INDEX_KEYS[board].sum() + INDEX_KEYS[dealt[:, :missing]].sum(axis=1)
+    hero = np.array(hero)
+    hero_strengths = strengths_from_keys(
+        INDEX_KEYS[hero].sum() + board_totals, hero, full_board, tables
+    )
+    opponent_strengths = np.empty((len(opponents), n), dtype=np.uint16)
+    column = missing
+    for seat, hand in enumerate(opponents):
+        if hand is None:
+            hole = dealt[:, column : column + 2]
+            column += 2
+        else:
+            hole = np.array(hand)
+        hole_key = INDEX_KEYS[hole].sum(axis=-1)
+        opponent_strengths[seat] = strengths_from_keys(
+            hole_key + board_totals, hole, full_board, tables
+        )
+
+    best = np.max(opponent_strengths, axis=0)
+    tied = np.count_nonzero(opponent_strengths == hero_strengths, axis=0)
+    total = int(weights.sum())
+    wins = int(weights[hero_strengths > best].sum())
+    split = hero_strengths == best
+    ties = int(weights[split].sum())
+    split_weights = np.bincount(tied[split], weights=weights[split])
+    equity = Fraction(wins)
+    for others, weight in enumerate(split_weights):
+        equity += Fraction(int(weight), others + 1)
+    return {
+        "win": Fraction(wins, total),
+        "tie": Fraction(ties, total),
+        "loss": Fraction(total - wins - ties, total),
+        "equity": equity / total,
+        "deals": total,
+        "evaluated": n,
+    }
+
+
+def _range_sums(keys, weights):
+    # Sorted keys and the cumulative weights in front of each position.
+    order = np.argsort(keys, kind="stable")
+    return keys[order], np.concatenate([[0.0], np.cumsum(weights[order])])
+
+
+def _between(sums, low, high):
+    # Weight of the entries with low <= key < high.
+    keys, cumulative = sums
+    return cumulative[np.searchsorted(keys, high)] - cumulative[
+        np.searchsorted(keys, low)
+    ]
+
+
+def _range_showdowns(hero, villain, boards, tables):
+    """Weighted wins, ties and matchups of hero combos on complete boards.
+
+    Returns three (1326,) arrays summed over ``boards`` (an (R, 5) index
+    array).  Every live combo is evaluated once per board; the villain's
+    combos are sorted by (board, strength), so the weight a hero combo beats
+    or ties is a prefix-sum difference.  Card removal is the same sweep
+    over villain combos sorted by (board, card, strength): the weight
+    holding each of the hero's two cards is taken out again, and the villain
+    combo equal to the hero's (counted for both cards) is added back once.
+    """
+    board_masks = _card_masks(boards)
+    live = (COMBO_MASKS[None, :] & board_masks[:, None]) == 0
+    rows, slots = np.nonzero(live & ((hero > 0) | (villain > 0))[None, :])
+    holes = COMBOS[slots]
+    totals = INDEX_KEYS[boards].sum(axis=1)[rows] + INDEX_KEYS[holes].sum(axis=1)
+    strengths = strengths_from_keys(totals, holes, boards[rows], tables).astype(
+        np.int64
+    )
+
+    is_villain = villain[slots] > 0
+    v_rows, v_strengths = rows[is_villain], strengths[is_villain]
+    v_weights = villain[slots[is_villain]]
+    v_cards = holes[is_villain].astype(np.int64)
+    by_strength = _range_sums(v_rows * STRENGTH_SPAN + v_strengths, v_weights)
+    card_rows = (v_rows[:, None] * 52 + v_cards).T.ravel()
+    by_card = _range_sums(
+        card_rows * STRENGTH_SPAN + np.tile(v_strengths, 2), np.tile(v_weights, 2)
+    )
+
+    is_hero = hero[slots] > 0
+    h_rows, h_slots = rows[is_hero], slots[is_hero]
+    h_strengths = strengths[is_hero]
+    base = h_rows * STRENGTH_SPAN
+    below = _between(by_strength, base, base + h_strengths)
+    equal = _between(by_strength, base + h_strengths, base + h_strengths + 1)
+    matchups = _between(by_strength, base, base + STRENGTH_SPAN)
+    for card in COMBOS[h_slots].astype(np.int64).T:
+        base = (h_rows * 52 + card) * STRENGTH_SPAN
+        below -= _between(by_card, base, base + h_strengths)
+        equal -= _between(by_card, base + h_strengths, base + h_strengths + 1)
+        matchups -= _between(by_card, base, base + STRENGTH_SPAN)
+    same = villain[h_slots]
+    equal += same
+    matchups += same
+
+    weights = hero[h_slots]
+    return tuple(
+        np.bincount(h_slots, weights=weights * values, minlength=NUM_COMBOS)
+        for values in (below, equal, matchups)
+    )
+
+
+def range_equity(hero, villain, board, dead=(), limit=RANGE_BOARD_LIMIT):
+    """Exact equity of one `Range` against another on ``board`` (3-5 cards).
+
+    Every runout of the board is enumerated, and each runout is solved with
+    sorted prefix sums instead of one showdown per pair of combos (see
+    `_range_showdowns`).  Combos blocked by the board or ``dead`` cards are
+    dropped, and pairs of combos sharing a card are never matched up.
+    Returns ``win``, ``tie``, ``loss`` and ``equity`` for the hero's range
+    as a whole (matchups weighted by both ranges' weights), ``combos``: a
+    (1326,) array of each hero combo's equity (NaN where it has none) and
+    ``boards``, the number of runouts.
+    """
+    board = _indices(board)
+    dead = _indices(dead)
+    if not 3 <= len(board) <= 5:
+        raise ValueError("Range equity needs a flop, turn or river board")
+    known = board + dead
+    if len(set(known)) != len(known):
+        raise ValueError("The same card is used twice")
+    blocked = [FULL_DECK[index] for index in known]
+    hero, villain = hero.remove(blocked).weights, villain.remove(blocked).weights
+    if not hero.any() or not villain.any():
+        raise ValueError("A range has no combos left on this board")
+    live = [index for index in range(52) if index not in known]
+    runouts = combination_array(live, 5 - len(board))
+    if len(runouts) > limit:
+        raise ValueError(f"{len(runouts):,} runouts exceed the limit of {limit:,}")
+    boards = np.empty((len(runouts), 5), dtype=np.uint8)
+    boards[:, : len(board)] = board
+    boards[:, len(board) :] = runouts
+    tables = get_tables()
+    wins = np.zeros(NUM_COMBOS)
+    ties = np.zeros(NUM_COMBOS)
+    matchups = np.zeros(NUM_COMBOS)
+    for start in range(0, len(boards), RANGE_CHUNK_BOARDS):
+        chunk = boards[start : start + RANGE_CHUNK_BOARDS]
+        for total, part in zip(
+            (wins, ties, matchups), _range_showdowns(hero, villain, chunk, tables)
+        ):
+            total += part
+    total = matchups.sum()
+    if total == 0:
+        raise ValueError("The ranges have no combos that can meet")
+    with np.errstate(invalid="ignore", divide="ignore"):
+        combos = np.where(matchups > 0, (wins + ties / 2) / matchups, np.nan)
+    return {
+        "win": wins.sum() / total,
+        "tie": ties.sum() / total,
+        "loss": 1 - (wins.sum() + ties.sum()) / total,
+        "equity": (wins.sum() + ties.sum() / 2) / total,
+        "combos": combos,
+        "boards": len(boards),
+    }
@@ -1,75 +1,175 @@
 import random
+from functools import lru_cache
+from itertools import combinations
+from src.card import FULL_DECK, rank_value, to_cards
 from src.deck import Deck
-from src.hand_evaluator import HandEvaluator
+from src.hand_evaluator import CachedHandEvaluator, HandEvaluator
+from src.preflop import get_preflop_table
+from src.probabilities import category_probabilities
+from src.rng import CounterRNG
+
+# Seats whose incremental hand state is kept (one per player at a full table).
+STREET_HANDS = 10
+
+BOTS = ("rules", "equity")
+# Equity bot: seconds per decision, the equity needed to raise or bet, and
+# how often it bets without it.
+EQUITY_BUDGET = 0.002
+EQUITY_RAISE = 0.7
+EQUITY_BET = 0.6
+EQUITY_BLUFF = 0.1
+
+
+def _heuristic_pocket_strength(first, second):
+    # The hand-written preflop rule the bot's thresholds were tuned against.
+    low, high = sorted([rank_value(first), rank_value(second)])
+    strength = 0
+    if low == high:
+        strength += low * 0.5
+    elif first & second & 0xF000:
+        strength += 2
+    if high - low <= 3:
+        strength += (4 - (high - low)) * 0.5
+    strength += high * 0.3
+    return min(strength, 10)
+
+
+@lru_cache(maxsize=None)
+def _pocket_scale():
+    # The heuristic strengths of all 1,326 combos, weakest first.
+    return sorted(
+        _heuristic_pocket_strength(*hole) for hole in combinations(FULL_DECK, 2)
+    )
 
 
 class PokerGame:
-    def __init__(self):
-        self.deck = Deck()
-        self.evaluator = HandEvaluator()
-        self.probabilities = {
-            "Royal Flush": 0.000154,
-            "Straight Flush": 0.00139,
-            "Four of a Kind": 0.0240,
-            "Full House": 0.1441,
-            "Flush": 0.1967,
-            "Straight": 0.3925,
-            "Three of a Kind": 2.1128,
-            "Two Pair": 4.7539,
-            "One Pair": 42.2569,
-            "High Card": 50.1177,
+    def __init__(
+        self,
+        rng=None,
+        seed=None,
+        cache_size=None,
+        bot="rules",
+        budget=EQUITY_BUDGET,
+        player_range=None,
+    ):
+        if bot not in BOTS:
+            raise ValueError(f"Unknown bot {bot!r}; expected one of {', '.join(BOTS)}")
+        self.rng = random if rng is None else rng
+        # "equity" decides postflop from a Monte Carlo equity estimate that
+        # takes at most about ``budget`` seconds per decision, with the player
+        # on ``player_range`` (a `Range`; None for any two cards).
+        self.bot = bot
+        self.budget = budget
+        self.player_range = player_range
+        self.deck = Deck(self.rng)
+        # With a seed every hand draws from its own counter-based stream, so
+        # hand n can be replayed with deal_hands(hand_index=n).
+        self.counter_rng = None if seed is None else CounterRNG(seed)
+        self.hand_index = 0
+        # cache_size memoises best-hand strengths (see CachedHandEvaluator).
+        self.evaluator = (
+            HandEvaluator() if cache_size is None else CachedHandEvaluator(cache_size)
+        )
+        # Incremental best-hand state per seat of the hand being played.
+        self._street_hands = {}
+
+    @property
+    def probabilities(self):
+        """Percent chance of each category in a random 5-card hand."""
+        return self.category_percentages(5)
+
+    @staticmethod
+    def category_percentages(cards=5):
+        """Percent chance of each category as the best hand of 5, 6 or 7 cards."""
+        return {
+            name: 100 * probability
+            for name, probability in category_probabilities(cards).items()
         }
 
-    def deal_hands(self, num_players=2):
+    def deal_hands(self, num_players=2, hand_index=None):
+        if self.counter_rng is not None:
+            if hand_index is None:
+                hand_index = self.hand_index
+            self.hand_index = hand_index + 1
+            # The bot's decisions for this hand continue the same stream.
+            self.rng = self.deck.rng = self.counter_rng.stream(hand_index)
+        elif hand_index is not None:
+            raise ValueError("hand_index needs a game created with a seed")
         self.deck.reset()
         self.deck.shuffle()
         hole_cards = [self.deck.deal(2) for _ in range(num_players)]
         community_cards = self.deck.deal(5)
         return hole_cards, community_cards
 
+    def best_hand_strength(self, hole_cards, community_cards):
+        return self.evaluator.best_strength(
+            to_cards(hole_cards) + to_cards(community_cards)
+        )
+
+    def street_strength(self, hole_cards, community_cards):
+        """`best_hand_strength` for a hand in progress.
+
+        While the hole cards stay the same and the board only grows, only the
+        new board cards are added to the previous street's state.
+        """
+        key = tuple(hole_cards)
+        hand = self._street_hands.get(key)
+        if hand is None or not hand.follows(community_cards):
+            if len(self._street_hands) >= STREET_HANDS:
+                self._street_hands.clear()
+            hand = self._street_hands[key] = self.evaluator.incremental(hole_cards)
+        seen = len(hand.board)
+        if len(community_cards) > seen:
+            hand.extend(community_cards[seen:])
+        return hand.strength
+
     def evaluate_best_hand(self, hole_cards, community_cards):
-        all_cards = hole_cards + community_cards
+        hole_cards = to_cards(hole_cards)
+        all_cards = hole_cards + to_cards(community_cards)
         if len(all_cards) < 5:
-            return "High Card", [
-                self.evaluator.rank_values[card[:-1]] for card in hole_cards
-            ]
-        best_rank, best_values = (
-            "High Card",
-            [self.evaluator.rank_values[card[:-1]] for card in all_cards],
-        )
-        for i in range(len(all_cards)):
-            for j in range(i + 1, len(all_cards)):
-                subset = all_cards[:i] + all_cards[i + 1 : j] + all_cards[j + 1 :]
-                rank, values = self.evaluator.evaluate(subset)
-                if (
-                    self.evaluator.hand_ranks[rank]
-                    > self.evaluator.hand_ranks[best_rank]
-                ):
-                    best_rank, best_values = rank, values
-                elif (
-                    self.evaluator.hand_ranks[rank]
-                    == self.evaluator.hand_ranks[best_rank]
-                ):
-                    if values and (not best_values or max(values) > max(best_values)):
-                        best_rank, best_values = rank, values
-        return best_rank, best_values
-
-    def evaluate_pocket_strength(self, hole_cards):
-        ranks = [card[:-1] for card in hole_cards]
-        suits = [card[-1] for card in hole_cards]
-        values = sorted([self.evaluator.rank_values[rank] for rank in ranks])
-        is_pair = values[0] == values[1]
-        is_suited = suits[0] == suits[1]
-        gap = values[1] - values[0]
-        strength = 0
-        if is_pair:
-            strength += values[0] * 0.5
-        elif is_suited:
-            strength += 2
-        if gap <= 3:
-            strength += (4 - gap) * 0.5
-        strength += max(values) * 0.3
-        return min(strength, 10)
+            return "High Card", [rank_value(card) for card in hole_cards]
+        strength = self.evaluator.best_strength(all_cards)
+        return self.evaluator.category(strength), self.evaluator.hand_values(strength)
+
+    def evaluate_best_hand_batch(self, cards, community_cards=None):
+        """Best-hand strengths and category codes for many hands at once.
+
+        ``cards`` is an (N, 5..7) int card array, or (N, 2) hole cards when
+        ``community_cards`` is given as an (N, k) array or a single board.
+        A `Range` stands for its combos in slot order (`Range.cards`).
+        """
+        import numpy as np
+        from src.batch import as_card_array, best_strength_batch
+        from src.ranges import Range
+
+        if isinstance(cards, Range):
+            cards = cards.cards()
+        cards = as_card_array(cards)
+        if community_cards is not None:
+            if np.ndim(community_cards) != 2:
+                community_cards = [community_cards]
+            board = as_card_array(community_cards)
+            if len(board) == 1:
+                board = np.broadcast_to(board, (len(cards), board.shape[1]))
+            cards = np.concatenate([cards, board], axis=1)
+        return best_strength_batch(cards, self.evaluator.tables)
+
+    def new_context(self, hole_cards):
+        """A `DecisionContext` for the bot holding ``hole_cards`` this hand."""
+        return DecisionContext(self, hole_cards)
+
+    def evaluate_pocket_strength(self, hole_cards, opponents=1):
+        """Preflop strength on the 0-10 scale `opponent_action` compares against.
+
+        Hands are ranked by precomputed equity against ``opponents`` random
+        hands, and the hand at percentile p gets the strength the old
+        hand-written rule gives the combo at percentile p.  Every threshold
+        therefore admits the same share of combos as before (strength 6 or
+        more: about 11.5%), while the order follows equity.
+        """
+        scale = _pocket_scale()
+        percentile = get_preflop_table().percentile(hole_cards, opponents)
+        return scale[round(percentile * len(scale)) - 1]
 
     def opponent_action(
         self,
@@ -81,93 +181,227 @@ class PokerGame:
         opponent_money,
         raise_count,
         player_money,
+        context=None,
     ):
-        strength = (
-            self.evaluate_pocket_strength(opponent_hole)
-            if street == "preflop"
-            else self.evaluator.hand_ranks[
-                self.evaluate_best_hand(opponent_hole, community_cards)[0]
-            ]
-        )
-        if random.random() < 0.1 and strength < 3:
+        """The bot's ``(action, amount)``; pass the hand's `DecisionContext` as
+        ``context`` to reuse its evaluation across decisions."""
+        if self.bot == "equity" and street != "preflop":
+            return self._equity_action(
+                current_bet,
+                pot,
+                opponent_hole,
+                community_cards,
+                opponent_money,
+                raise_count,
+                player_money,
+                context,
+            )
+        if context is not None:
+            strength = context.strength(street, community_cards)
+        elif street == "preflop":
+            strength = self.evaluate_pocket_strength(opponent_hole)
+        else:
+            strength = self.evaluator.category_code(
+                self.street_strength(opponent_hole, community_cards)
+            )
+        if self.rng.random() < 0.1 and strength < 3:
             return "fold", 0
         if current_bet > 0:
-            pot_odds = current_bet / (pot + current_bet)
             if (
-                strength >= 6 or (random.random() < 0.3 and strength >= 3)
+                strength >= 6 or (self.rng.random() < 0.3 and strength >= 3)
             ) and raise_count < 4:
                 raise_amount = max(
                     current_bet * 2, min(int(pot * 0.5), opponent_money, player_money)
                 )
                 return "raise", raise_amount
-            if strength >= 3 or random.random() < 0.5:
+            if strength >= 3 or self.rng.random() < 0.5:
                 return "call", current_bet
             return "fold", 0
-        if strength >= 5 or (random.random() < 0.3 and strength >= 3):
+        if strength >= 5 or (self.rng.random() < 0.3 and strength >= 3):
+            bet_amount = max(1, min(int(pot * 0.2), opponent_money, player_money))
+            return "bet", bet_amount
+        return "check", 0
+
+    def _equity_action(
+        self,
+        current_bet,
+        pot,
+        opponent_hole,
+        community_cards,
+        opponent_money,
+        raise_count,
+        player_money,
+        context,
+    ):
+        from src.equity import anytime_equity
+
+        player = self.player_range
+        known = list(opponent_hole) + list(community_cards)
+        if player is not None and not len(player.remove(known)):
+            player = None  # every combo is blocked: any two cards
+
+        def estimate():
+            seed = int(self.rng.random() * (1 << 53))
+            return anytime_equity(
+                opponent_hole, [player], community_cards, budget=self.budget, seed=seed
+            )["equity"]
+
+        if context is None:
+            equity = estimate()
+        else:
+            context.update(community_cards)
+            equity = context.cached("equity", estimate)
+        if current_bet > 0:
+            pot_odds = current_bet / (pot + current_bet)
+            if equity >= EQUITY_RAISE and raise_count < 4:
+                raise_amount = max(
+                    current_bet * 2, min(int(pot * 0.5), opponent_money, player_money)
+                )
+                return "raise", raise_amount
+            if equity >= pot_odds:
+                return "call", current_bet
+            return "fold", 0
+        if equity >= EQUITY_BET or self.rng.random() < EQUITY_BLUFF:
             bet_amount = max(1, min(int(pot * 0.2), opponent_money, player_money))
             return "bet", bet_amount
         return "check", 0
 
     def play(self, player_hole, opponent_hole, community_cards, pot, player_total_bet):
-        player_rank, player_values = self.evaluate_best_hand(
-            player_hole, community_cards
-        )
-        opponent_rank, opponent_values = self.evaluate_best_hand(
-            opponent_hole, community_cards
-        )
-        if (
-            self.evaluator.hand_ranks[player_rank]
-            > self.evaluator.hand_ranks[opponent_rank]
-        ):
+        player_strength = self.best_hand_strength(player_hole, community_cards)
+        opponent_strength = self.best_hand_strength(opponent_hole, community_cards)
+        if player_strength > opponent_strength:
             return {
                 "winner": "Player",
                 "hand": player_hole,
-                "rank": player_rank,
+                "rank": self.evaluator.category(player_strength),
                 "pot": pot,
             }
-        elif (
-            self.evaluator.hand_ranks[player_rank]
-            < self.evaluator.hand_ranks[opponent_rank]
-        ):
+        elif player_strength < opponent_strength:
             return {
                 "winner": "Opponent",
                 "hand": opponent_hole,
-                "rank": opponent_rank,
+                "rank": self.evaluator.category(opponent_strength),
                 "pot": -player_total_bet,
             }
-        else:
-            # Compare up to 5 kickers
-            player_all_cards = sorted(
-                [
-                    self.evaluator.rank_values[card[:-1]]
-                    for card in player_hole + community_cards
-                ],
-                reverse=True,
-            )[:5]
-            opponent_all_cards = sorted(
-                [
-                    self.evaluator.rank_values[card[:-1]]
-                    for card in opponent_hole + community_cards
-                ],
-                reverse=True,
-            )[:5]
-            for v1, v2 in zip(player_all_cards, opponent_all_cards):
-                if v1 > v2:
-                    return {
-                        "winner": "Player",
-                        "hand": player_hole,
-                        "rank": player_rank,
-                        "pot": pot,
-                    }
-                elif v1 < v2:
-                    return {
-                        "winner": "Opponent",
-                        "hand": opponent_hole,
-                        "rank": opponent_rank,
-                        "pot": -player_total_bet,
-                    }
-            return {"winner": "Tie", "hand": player_hole, "rank": player_rank, "pot": 0}
+        return {
+            "winner": "Tie",
+            "hand": player_hole,
+            "rank": self.evaluator.category(player_strength),
+            "pot": 0,
+        }
+
+    def showdown(self, hole_cards, contributions, community_cards, folded=()):
+        """Settle a showdown between any number of players, side pots included.
+
+        ``hole_cards`` and ``contributions`` (chips each seat put in) are
+        indexed by seat; seats in ``folded`` keep their chips in the pot but
+        cannot win.  Each live hand is evaluated once; then seats are walked
+        in order of contribution, so every side pot is the slice between two
+        contribution levels and goes to the best live hand among the seats
+        that reached it.  Split pots are shared equally, odd chips going to
+        the earliest seats.  Returns ``strengths`` (None for folded seats),
+        ``ranks``, ``pots`` (main pot first, each with ``amount``,
+        ``eligible`` and ``winners``) and ``payouts`` per seat.
+        """
+        seats = len(hole_cards)
+        if len(contributions) != seats:
+            raise ValueError("Need one contribution per player")
+        folded = set(folded)
+        board = to_cards(community_cards)
+        strengths = [
+            None if seat in folded else self.best_hand_strength(hole, board)
+            for seat, hole in enumerate(hole_cards)
+        ]
+        pots = []
+        order = sorted(range(seats), key=contributions.__getitem__)
+        level = 0
+        for position, seat in enumerate(order):
+            layer = contributions[seat] - level
+            if layer <= 0:
+                continue
+            level = contributions[seat]
+            reached = sorted(order[position:])
+            eligible = [s for s in reached if strengths[s] is not None]
+            if pots and eligible and pots[-1]["eligible"] == eligible:
+                # Only folded seats dropped out: still the same pot.
+                pots[-1]["amount"] += layer * len(reached)
+                continue
+            if eligible:
+                best = max(strengths[s] for s in eligible)
+                winners = [s for s in eligible if strengths[s] == best]
+            else:
+                # Everyone who put in this much folded: the chips go back.
+                winners = reached
+            pots.append(
+                {
+                    "amount": layer * len(reached),
+                    "eligible": eligible,
+                    "winners": winners,
+                }
+            )
+        payouts = [0] * seats
+        for pot in pots:
+            share, odd = divmod(pot["amount"], len(pot["winners"]))
+            for index, winner in enumerate(pot["winners"]):
+                payouts[winner] += share + (index < odd)
+        return {
+            "strengths": strengths,
+            "ranks": [
+                None if strength is None else self.evaluator.category(strength)
+                for strength in strengths
+            ],
+            "pots": pots,
+            "payouts": payouts,
+        }
 
     def get_probability(self, hand):
-        rank, _ = self.evaluator.evaluate(hand)
-        return self.probabilities.get(rank, 0.0)
+        """Percent chance of ``hand``'s category among hands of as many cards."""
+        hand = to_cards(hand)
+        strength = self.evaluator.best_strength(hand)
+        return self.category_percentages(len(hand))[self.evaluator.category(strength)]
+
+
+class DecisionContext:
+    """What the bot has worked out about one hand, kept between its decisions.
+
+    Values stored with `cached` (the hand strength, an equity estimate, ...)
+    last until a new board card appears, so acting several times on one
+    street evaluates the hand once; the best hand itself is kept in an
+    `IncrementalHand` that only adds the new cards.  ``state`` is free for
+    a policy to keep its own notes for the whole hand.
+    """
+
+    def __init__(self, game, hole_cards):
+        self.game = game
+        self.hole = hole_cards
+        self.hand = game.evaluator.incremental(hole_cards)
+        self.board = []
+        self.state = {}
+        self._values = {}
+
+    def update(self, community_cards):
+        """Move to ``community_cards``; cached values are dropped if it grew."""
+        if len(community_cards) != len(self.board):
+            self.board = list(community_cards)
+            self._values.clear()
+            seen = len(self.hand.board)
+            if len(community_cards) > seen:
+                self.hand.extend(community_cards[seen:])
+
+    def cached(self, name, compute):
+        """``compute()`` once per board; later calls return the stored value."""
+        values = self._values
+        if name not in values:
+            values[name] = compute()
+        return values[name]
+
+    def strength(self, street, community_cards):
+        """Pocket strength preflop, else the category code of the best hand."""
+        self.update(community_cards)
+        if street == "preflop":
+            return self.cached(
+                "strength", lambda: self.game.evaluate_pocket_strength(self.hole)
+            )
+        return self.cached(
+            "strength", lambda: self.game.evaluator.category_code(self.hand.strength)
+        )
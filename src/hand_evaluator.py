@@ -1,4 +1,16 @@
-from collections import Counter
+from bisect import bisect_left
+from functools import lru_cache
+from src.card import card_from_str, to_cards
+from src.lookup_tables import CATEGORY_BOUNDS, get_tables
+
+_CATEGORY_LIMITS = [bound for bound, _ in CATEGORY_BOUNDS]
+_CATEGORY_NAMES = [name for _, name in CATEGORY_BOUNDS]
+
+DEFAULT_CACHE_SIZE = 4096
+
+# Suit bit (S=1, H=2, D=4, C=8) -> one count nibble per suit.
+_SUIT_COUNT = [0, 0x1, 0x10, 0, 0x100, 0, 0, 0, 0x1000]
+
 
 class HandEvaluator:
     def __init__(self):
@@ -16,46 +28,183 @@ class HandEvaluator:
             "One Pair": 2,
             "High Card": 1
         }
+        self._tables = None
+
+    @property
+    def tables(self):
+        # Loaded on first evaluation so commands like `info` never touch them.
+        if self._tables is None:
+            self._tables = get_tables()
+        return self._tables
+
+    def strength(self, hand):
+        """Return the 5-card hand strength, 1 (worst) to 7462 (royal flush)."""
+        if len(hand) != 5:
+            raise ValueError(f"Expected 5 cards, got {len(hand)}")
+        c1, c2, c3, c4, c5 = to_cards(hand)
+        tables = self._tables or self.tables
+        mask = (c1 | c2 | c3 | c4 | c5) >> 16
+        if c1 & c2 & c3 & c4 & c5 & 0xF000:
+            return tables.flush[mask]
+        value = tables.unique5[mask]
+        if value:
+            return value
+        return tables.products[
+            (c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF) * (c5 & 0xFF)
+        ]
+
+    def best_strength(self, cards):
+        """Return the strength of the best 5-card hand among 5 to 7 int cards."""
+        if not 5 <= len(cards) <= 7:
+            raise ValueError(f"Expected 5 to 7 cards, got {len(cards)}")
+        tables = self._tables or self.tables
+        product = 1
+        suits = 0x3333  # each nibble reaches 8 once its suit has five cards
+        for card in cards:
+            product *= card & 0xFF
+            suits += _SUIT_COUNT[(card >> 12) & 0xF]
+        flush = suits & 0x8888
+        if not flush:
+            return tables.nonflush[product]
+        suit_bit = 1 << (12 + (flush.bit_length() - 4) // 4)
+        mask = 0
+        for card in cards:
+            if card & suit_bit:
+                mask |= card >> 16
+        return tables.flush7[mask]
+
+    def incremental(self, hole_cards=()):
+        """An `IncrementalHand` holding ``hole_cards``; add the board as it comes."""
+        return IncrementalHand(self.tables, hole_cards)
+
+    def evaluate_batch(self, hands):
+        """Vectorised `best_strength` for an (N, 5..7) array of int cards.
+
+        Returns ``(strengths, categories)`` as (N,) arrays; categories use the
+        `hand_ranks` codes.
+        """
+        from src.batch import as_card_array, best_strength_batch, evaluate_batch
+
+        hands = as_card_array(hands)
+        if hands.ndim == 2 and hands.shape[1] in (6, 7):
+            return best_strength_batch(hands, self.tables)
+        return evaluate_batch(hands, self.tables)
+
+    def hand_values(self, strength):
+        """Rank values (2-14, ascending) of the five cards making a hand class."""
+        packed = self.tables.hand_values[strength]
+        return [(packed >> shift) & 0xF for shift in range(0, 20, 4)]
+
+    @staticmethod
+    def category(strength):
+        return _CATEGORY_NAMES[bisect_left(_CATEGORY_LIMITS, strength)]
+
+    @staticmethod
+    def category_code(strength):
+        """Category as its `hand_ranks` value (1 = High Card ... 10 = Royal Flush)."""
+        return bisect_left(_CATEGORY_LIMITS, strength) + 1
 
     def evaluate(self, hand):
-        ranks = [card[:-1] for card in hand]
-        suits = [card[-1] for card in hand]
-        rank_counts = Counter(ranks)
-        values = sorted([self.rank_values[rank] for rank in ranks])
-        is_flush = len(set(suits)) == 1
-        is_straight = len(set(values)) == 5 and max(values) - min(values) == 4
-
-        if is_flush and is_straight and min(values) == 10:
-            return "Royal Flush", values
-        if is_flush and is_straight:
-            return "Straight Flush", values
-        if 4 in rank_counts.values():
-            return "Four of a Kind", values
-        if sorted(rank_counts.values()) == [2, 3]:
-            return "Full House", values
-        if is_flush:
-            return "Flush", values
-        if is_straight:
-            return "Straight", values
-        if 3 in rank_counts.values():
-            return "Three of a Kind", values
-        if sorted(rank_counts.values()) == [1, 2, 2]:
-            return "Two Pair", values
-        if 2 in rank_counts.values():
-            return "One Pair", values
-        return "High Card", values
+        hand = to_cards(hand)
+        values = sorted([((card >> 8) & 0xF) + 2 for card in hand])
+        return self.category(self.strength(hand)), values
 
     def compare_hands(self, hand1, hand2):
-        rank1, values1 = self.evaluate(hand1)
-        rank2, values2 = self.evaluate(hand2)
-        if self.hand_ranks[rank1] > self.hand_ranks[rank2]:
-            return {"winner": "Hand 1", "hand": hand1, "rank": rank1}
-        elif self.hand_ranks[rank1] < self.hand_ranks[rank2]:
-            return {"winner": "Hand 2", "hand": hand2, "rank": rank2}
-        else:
-            for v1, v2 in zip(reversed(values1), reversed(values2)):
-                if v1 > v2:
-                    return {"winner": "Hand 1", "hand": hand1, "rank": rank1}
-                elif v1 < v2:
-                    return {"winner": "Hand 2", "hand": hand2, "rank": rank2}
-            return {"winner": "Tie", "hand": hand1, "rank": rank1}
\ No newline at end of file
+        strength1 = self.strength(hand1)
+        strength2 = self.strength(hand2)
+        if strength1 > strength2:
+            return {"winner": "Hand 1", "hand": hand1, "rank": self.category(strength1)}
+        elif strength1 < strength2:
+            return {"winner": "Hand 2", "hand": hand2, "rank": self.category(strength2)}
+        return {"winner": "Tie", "hand": hand1, "rank": self.category(strength1)}
+
+
+class IncrementalHand:
+    """Best-hand state of one player, updated as cards arrive.
+
+    Keeps the running rank prime product and per-suit counts that
+    `HandEvaluator.best_strength` builds from scratch, so an added card costs
+    one multiply and one add, and `strength` (None below five cards) is a
+    plain attribute.  ``hole`` and ``board`` are the cards as given.
+    """
+
+    __slots__ = ("tables", "hole", "board", "count", "product", "suits", "strength")
+
+    def __init__(self, tables, hole_cards=()):
+        self.tables = tables
+        self.hole = hole_cards
+        self.board = []
+        self.count = 0
+        self.product = 1
+        self.suits = 0x3333
+        self.strength = None
+        self._add(hole_cards)
+
+    def add(self, *cards):
+        """Add board cards (three on the flop, one on the turn or river)."""
+        self.extend(cards)
+
+    def extend(self, cards):
+        self.board += cards
+        self._add(cards)
+
+    def copy(self):
+        """An independent copy, e.g. to try each possible next card."""
+        hand = IncrementalHand.__new__(IncrementalHand)
+        for name in self.__slots__:
+            setattr(hand, name, getattr(self, name))
+        hand.board = list(self.board)
+        return hand
+
+    def _add(self, cards):
+        product = self.product
+        suits = self.suits
+        for card in cards:
+            if isinstance(card, str):
+                card = card_from_str(card)
+            product *= card & 0xFF
+            suits += _SUIT_COUNT[(card >> 12) & 0xF]
+        self.product = product
+        self.suits = suits
+        self.count += len(cards)
+        if self.count < 5:
+            return
+        flush = suits & 0x8888
+        if not flush:
+            self.strength = self.tables.nonflush[product]
+            return
+        # Rare: collect the flush suit's ranks.
+        suit_bit = 1 << (12 + (flush.bit_length() - 4) // 4)
+        mask = 0
+        for card in to_cards(self.hole) + to_cards(self.board):
+            if card & suit_bit:
+                mask |= card >> 16
+        self.strength = self.tables.flush7[mask]
+
+    def follows(self, community_cards):
+        """True if ``community_cards`` starts with the board seen so far."""
+        return self.board == list(community_cards[: len(self.board)])
+
+
+class CachedHandEvaluator(HandEvaluator):
+    """`HandEvaluator` whose `best_strength` is memoised in a bounded LRU cache.
+
+    The key is the frozenset of the cards, so the same cards in any order
+    share one entry.  `cache_info` reports hits, misses and size.
+    """
+
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE):
+        super().__init__()
+        self._cached_strength = lru_cache(maxsize=maxsize)(self._strength_of_set)
+
+    def _strength_of_set(self, cards):
+        return HandEvaluator.best_strength(self, tuple(cards))
+
+    def best_strength(self, cards):
+        return self._cached_strength(frozenset(cards))
+
+    def cache_info(self):
+        return self._cached_strength.cache_info()
+
+    def cache_clear(self):
+        self._cached_strength.cache_clear()
@@ -0,0 +1,107 @@
+"""Append-only JSONL hand history.
+
+`HandHistoryWriter` appends one JSON object per hand to a ``.jsonl`` file
+and keeps only running totals in memory, so a session of any length uses
+constant memory.  Records are buffered and flushed every ``flush_every``
+hands or ``flush_seconds`` seconds (and on close), so a crash loses at most
+that many hands; a partially written last line is simply skipped by
+`read_history`.  When the file grows past ``max_bytes`` it is rotated like
+``logging.handlers.RotatingFileHandler``: ``hands.jsonl`` becomes
+``hands.jsonl.1``, ``.1`` becomes ``.2`` and so on up to ``backups``.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+DEFAULT_PATH = "hand_history.jsonl"
+FLUSH_EVERY = 50
+FLUSH_SECONDS = 5.0
+MAX_BYTES = 16 * 1024 * 1024
+BACKUPS = 5
+
+
+def new_totals():
+    return {"hands": 0, "wins": 0, "losses": 0, "ties": 0, "showdowns": 0, "net": 0}
+
+
+class HandHistoryWriter:
+    def __init__(
+        self,
+        path=DEFAULT_PATH,
+        flush_every=FLUSH_EVERY,
+        flush_seconds=FLUSH_SECONDS,
+        max_bytes=MAX_BYTES,
+        backups=BACKUPS,
+    ):
+        self.path = Path(path)
+        self.flush_every = flush_every
+        self.flush_seconds = flush_seconds
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.totals = new_totals()
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def write(self, record):
+        """Append one hand; ``winner``, ``net`` and ``showdown`` feed the totals."""
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        totals = self.totals
+        totals["hands"] += 1
+        totals["net"] += record.get("net", 0)
+        totals["showdowns"] += bool(record.get("showdown"))
+        winner = record.get("winner")
+        if winner == "Player":
+            totals["wins"] += 1
+        elif winner == "Opponent":
+            totals["losses"] += 1
+        elif winner == "Tie":
+            totals["ties"] += 1
+        self._pending += 1
+        if (
+            self._pending >= self.flush_every
+            or time.monotonic() - self._last_flush >= self.flush_seconds
+        ):
+            self.flush()
+
+    def flush(self):
+        self._file.flush()
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        if self.max_bytes and self._file.tell() >= self.max_bytes:
+            self._rotate()
+
+    def _rotate(self):
+        self._file.close()
+        for index in range(self.backups - 1, 0, -1):
+            source = self.path.with_name(f"{self.path.name}.{index}")
+            if source.exists():
+                os.replace(source, self.path.with_name(f"{self.path.name}.{index + 1}"))
+        if self.backups:
+            os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink()
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_history(path):
+    """Yield the records of a JSONL history, skipping a torn last line."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.endswith("\n"):
+                break
+            yield json.loads(line)
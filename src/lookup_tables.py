@@ -0,0 +1,307 @@
+"""Precomputed lookup tables for the hand evaluator.
+
+Every five card hand maps to one of 7,462 equivalence classes.  Classes are
+numbered 1 (7-5-4-3-2 offsuit) to 7462 (royal flush), so a higher strength
+always wins.  The tables are:
+
+* ``flush``    - 13 bit rank mask -> strength, for five cards of one suit
+* ``unique5``  - rank mask -> strength, for five distinct ranks (no flush)
+* ``products`` - product of the rank primes -> strength, for paired hands
+* ``flush7``   - rank mask of the flush suit (5-7 cards) -> best strength
+* ``nonflush`` - rank prime product of 5-7 cards -> best strength, used
+  when no suit has five cards
+* ``hand_values`` - strength -> the five rank values of that class, packed
+  four bits per value (lowest first)
+* ``rank_sum7`` - sum of ``RANK_KEYS`` over exactly seven cards -> best
+  non-flush strength; a direct index for vectorised evaluation, where the
+  prime-product lookup would need a binary search
+
+With at most seven cards only one suit can hold five of them, and a hand that
+contains a flush cannot also contain quads or a full house, so the 7-card
+strength is ``flush7`` when a flush is present and ``nonflush`` otherwise.
+
+They are generated once, written to a versioned cache file and memory-mapped
+on first use, so importing the evaluator (e.g. for ``info``) costs nothing.
+"""
+
+import array
+import mmap
+import os
+import struct
+import tempfile
+from itertools import combinations, combinations_with_replacement
+from pathlib import Path
+
+from src.card import PRIMES
+
+TABLE_VERSION = 3
+MAGIC = b"PKRT"
+HEADER = struct.Struct("<4sIII")
+MASK_SIZE = 1 << 13
+
+# Highest strength of each category, weakest category first.
+CATEGORY_BOUNDS = [
+    (1277, "High Card"),
+    (4137, "One Pair"),
+    (4995, "Two Pair"),
+    (5853, "Three of a Kind"),
+    (5863, "Straight"),
+    (7140, "Flush"),
+    (7296, "Full House"),
+    (7452, "Four of a Kind"),
+    (7461, "Straight Flush"),
+    (7462, "Royal Flush"),
+]
+MAX_STRENGTH = CATEGORY_BOUNDS[-1][0]
+
+# Per-rank keys whose sums are unique for every 7-card rank multiset.
+RANK_KEYS = [0, 1, 5, 22, 98, 453, 2031, 8698, 22854, 83661, 262349, 636345, 1479181]
+RANK_SUM7_SIZE = 4 * RANK_KEYS[12] + 3 * RANK_KEYS[11] + 1
+
+# Wheel first, broadway last.
+STRAIGHT_MASKS = [0b1000000001111] + [0b11111 << i for i in range(9)]
+
+
+def cache_dir():
+    path = os.environ.get("POKER_SIMULATOR_CACHE")
+    if path:
+        return Path(path)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "poker-simulator"
+
+
+def table_path():
+    return cache_dir() / f"eval-tables-v{TABLE_VERSION}.bin"
+
+
+def _ranks(mask):
+    return [r for r in range(13) if mask >> r & 1]
+
+
+def _mask(ranks):
+    mask = 0
+    for rank in ranks:
+        mask |= 1 << rank
+    return mask
+
+
+def _product(ranks):
+    product = 1
+    for rank in ranks:
+        product *= PRIMES[rank]
+    return product
+
+
+def _pack(ranks):
+    packed = 0
+    for shift, rank in enumerate(sorted(ranks)):
+        packed |= (rank + 2) << (4 * shift)
+    return packed
+
+
+def _kickers(count, excluded):
+    # Kicker combinations ordered weakest first.
+    ranks = [r for r in range(13) if r not in excluded]
+    return sorted(combinations(ranks, count), key=_mask)
+
+
+def build_tables():
+    flush = array.array("H", bytes(2 * MASK_SIZE))
+    unique5 = array.array("H", bytes(2 * MASK_SIZE))
+    products = {}
+    hand_values = array.array("I", bytes(4 * (MAX_STRENGTH + 1)))
+    high_cards = sorted(
+        m for m in map(_mask, combinations(range(13), 5)) if m not in STRAIGHT_MASKS
+    )
+    strength = 0
+
+    for mask in high_cards:
+        strength += 1
+        unique5[mask] = strength
+        hand_values[strength] = _pack(_ranks(mask))
+    for pair in range(13):
+        for kickers in _kickers(3, {pair}):
+            strength += 1
+            products[PRIMES[pair] ** 2 * _product(kickers)] = strength
+            hand_values[strength] = _pack((pair, pair) + kickers)
+    for high in range(13):
+        for low in range(high):
+            for (kicker,) in _kickers(1, {high, low}):
+                strength += 1
+                products[(PRIMES[high] * PRIMES[low]) ** 2 * PRIMES[kicker]] = strength
+                hand_values[strength] = _pack((high, high, low, low, kicker))
+    for trips in range(13):
+        for kickers in _kickers(2, {trips}):
+            strength += 1
+            products[PRIMES[trips] ** 3 * _product(kickers)] = strength
+            hand_values[strength] = _pack((trips,) * 3 + kickers)
+    for mask in STRAIGHT_MASKS:
+        strength += 1
+        unique5[mask] = strength
+        hand_values[strength] = _pack(_ranks(mask))
+    for mask in high_cards:
+        strength += 1
+        flush[mask] = strength
+        hand_values[strength] = _pack(_ranks(mask))
+    for trips in range(13):
+        for (pair,) in _kickers(1, {trips}):
+            strength += 1
+            products[PRIMES[trips] ** 3 * PRIMES[pair] ** 2] = strength
+            hand_values[strength] = _pack((trips,) * 3 + (pair,) * 2)
+    for quads in range(13):
+        for (kicker,) in _kickers(1, {quads}):
+            strength += 1
+            products[PRIMES[quads] ** 4 * PRIMES[kicker]] = strength
+            hand_values[strength] = _pack((quads,) * 4 + (kicker,))
+    for mask in STRAIGHT_MASKS:
+        strength += 1
+        flush[mask] = strength
+        hand_values[strength] = _pack(_ranks(mask))
+
+    assert strength == MAX_STRENGTH
+    flush7 = _build_flush7(flush)
+    nonflush, rank_sum7 = _build_nonflush(unique5, products)
+    keys = sorted(products)
+    nonflush_keys = sorted(nonflush)
+    return {
+        "flush": flush,
+        "unique5": unique5,
+        "product_keys": array.array("I", keys),
+        "product_values": array.array("H", [products[k] for k in keys]),
+        "flush7": flush7,
+        "nonflush_keys": array.array("Q", nonflush_keys),
+        "nonflush_values": array.array("H", [nonflush[k] for k in nonflush_keys]),
+        "hand_values": hand_values,
+        "rank_sum7": rank_sum7,
+    }
+
+
+def _build_flush7(flush):
+    flush7 = array.array("H", bytes(2 * MASK_SIZE))
+    for mask in range(MASK_SIZE):
+        if 5 <= bin(mask).count("1") <= 7:
+            flush7[mask] = max(flush[_mask(c)] for c in combinations(_ranks(mask), 5))
+    return flush7
+
+
+def _build_nonflush(unique5, products):
+    # Best strength of every 5-7 card rank multiset (each rank at most four
+    # times), keyed by the product of its rank primes.
+    def five_card(ranks):
+        mask = _mask(ranks)
+        return unique5[mask] if bin(mask).count("1") == 5 else products[_product(ranks)]
+
+    nonflush = {}
+    rank_sum7 = array.array("H", bytes(2 * RANK_SUM7_SIZE))
+    for size in (5, 6, 7):
+        for ranks in combinations_with_replacement(range(13), size):
+            if any(ranks.count(r) > 4 for r in set(ranks)):
+                continue
+            strength = max(five_card(c) for c in set(combinations(ranks, 5)))
+            nonflush[_product(ranks)] = strength
+            if size == 7:
+                rank_sum7[sum(RANK_KEYS[r] for r in ranks)] = strength
+    return nonflush, rank_sum7
+
+
+def _sections(num_products, num_nonflush):
+    # (name, typecode, length) in file order; every section is 8 byte aligned.
+    return [
+        ("flush", "H", MASK_SIZE),
+        ("unique5", "H", MASK_SIZE),
+        ("product_keys", "I", num_products),
+        ("product_values", "H", num_products),
+        ("flush7", "H", MASK_SIZE),
+        ("nonflush_keys", "Q", num_nonflush),
+        ("nonflush_values", "H", num_nonflush),
+        ("hand_values", "I", MAX_STRENGTH + 1),
+        ("rank_sum7", "H", RANK_SUM7_SIZE),
+    ]
+
+
+def _aligned(size):
+    return (size + 7) & ~7
+
+
+def serialize_tables(tables):
+    counts = len(tables["product_keys"]), len(tables["nonflush_keys"])
+    raw = bytearray(HEADER.pack(MAGIC, TABLE_VERSION, *counts))
+    for name, _, _ in _sections(*counts):
+        data = tables[name].tobytes()
+        raw += data.ljust(_aligned(len(data)), b"\0")
+    return bytes(raw)
+
+
+def write_tables(tables, path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(serialize_tables(tables))
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class LookupTables:
+    def __init__(self, buffer):
+        magic, version, *counts = HEADER.unpack_from(buffer)
+        if magic != MAGIC or version != TABLE_VERSION:
+            raise ValueError("Lookup table file has the wrong format or version")
+        self.buffer = buffer
+        self.offsets = {}
+        self._arrays = {}
+        view = memoryview(buffer)
+        offset = HEADER.size
+        for name, typecode, length in _sections(*counts):
+            size = length * array.array(typecode).itemsize
+            if offset + size > len(view):
+                raise ValueError("Lookup table file is truncated")
+            self.offsets[name] = offset
+            setattr(self, name, view[offset : offset + size].cast(typecode))
+            offset += _aligned(size)
+        self.products = dict(zip(self.product_keys, self.product_values))
+        self.nonflush = dict(zip(self.nonflush_keys, self.nonflush_values))
+
+    def array(self, name):
+        """Zero-copy NumPy view of one table (NumPy is only imported here)."""
+        if name not in self._arrays:
+            import numpy as np
+
+            view = getattr(self, name)
+            self._arrays[name] = np.frombuffer(
+                self.buffer, dtype=view.format, count=len(view), offset=self.offsets[name]
+            )
+        return self._arrays[name]
+
+
+def _map_file(path):
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def load_tables(path=None):
+    path = Path(path) if path else table_path()
+    try:
+        return LookupTables(_map_file(path))
+    except (OSError, ValueError, struct.error):
+        pass
+    tables = build_tables()
+    try:
+        write_tables(tables, path)
+        return LookupTables(_map_file(path))
+    except OSError:
+        # Read-only cache location: keep the freshly built tables in memory.
+        return LookupTables(serialize_tables(tables))
+
+
+_tables = None
+
+
+def get_tables():
+    global _tables
+    if _tables is None:
+        _tables = load_tables()
+    return _tables
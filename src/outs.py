@@ -0,0 +1,163 @@
+"""Exact outs and draw odds on the flop or turn.
+
+Every card that can come next is tried on the hero's incremental hand (one
+multiply and one add per card), and every runout to the river is scored
+against the opponent in one NumPy pass: the opponent is a `Range` (a known
+hand is a one-combo range, a random hand the full range), and the strengths
+of all its live combos on all runouts come from summed per-card keys
+(`src.batch.INDEX_KEYS`), so a flop against a random hand (about a million
+showdowns) needs no per-hand Python work.
+
+Probabilities weight each runout and opponent combo jointly, so card
+removal by a range is accounted for; against a known or random hand they
+are exact frequencies.
+"""
+
+from collections import Counter
+
+import numpy as np
+
+from src.batch import DECK, INDEX_KEYS, categories, evaluate_batch, strengths_from_keys
+from src.card import FULL_DECK
+from src.equity import combination_array, parse_spot
+from src.hand_evaluator import HandEvaluator
+from src.lookup_tables import CATEGORY_BOUNDS, get_tables
+from src.ranges import COMBO_MASKS, COMBOS, Range
+
+# Category code (1 = High Card) -> name.
+CATEGORY_NAMES = [None] + [name for _, name in CATEGORY_BOUNDS]
+# Sorted rank counts of four cards -> category code.
+_FOUR_CARD_CATEGORIES = {(4,): 8, (3, 1): 4, (2, 2): 3, (2, 1, 1): 2}
+
+
+def _board_category(evaluator, cards):
+    # Category code of four or five board cards on their own.
+    if len(cards) == 5:
+        return evaluator.category_code(evaluator.strength(cards))
+    counts = Counter((card >> 8) & 0xF for card in cards)
+    return _FOUR_CARD_CATEGORIES.get(tuple(sorted(counts.values(), reverse=True)), 1)
+
+
+def _villain_weights(villain, known):
+    if villain is None:
+        return Range.full().remove(known).weights
+    if isinstance(villain, Range):
+        return villain.weights
+    return Range.from_hands([[FULL_DECK[index] for index in villain]]).weights
+
+
+def _showdowns(hero_strengths, boards, weights, tables):
+    # Weighted opponent wins, ties and combos per board.
+    board_masks = np.left_shift(1, boards.astype(np.int64)).sum(axis=1)
+    live = (COMBO_MASKS[None, :] & board_masks[:, None]) == 0
+    rows, slots = np.nonzero(live & (weights > 0)[None, :])
+    holes = COMBOS[slots]
+    totals = INDEX_KEYS[boards].sum(axis=1)[rows] + INDEX_KEYS[holes].sum(axis=1)
+    strengths = strengths_from_keys(totals, holes, boards[rows], tables)
+    hero = hero_strengths[rows]
+    combo_weights = weights[slots]
+    return tuple(
+        np.bincount(rows, weights=values, minlength=len(boards))
+        for values in (
+            combo_weights * (hero > strengths),
+            combo_weights * (hero == strengths),
+            combo_weights,
+        )
+    )
+
+
+def analyze_outs(hero, board, villain=None, dead=()):
+    """Outs and exact odds of ``hero`` on a flop or turn ``board``.
+
+    ``villain`` is two known cards, a `Range` or ``None`` for a random hand.
+    Returns a dict with the hero's current ``category``, the ``outs`` (next
+    cards that improve the category), ``improve`` (probability of a better
+    category by the river), ``categories`` (probability of each final
+    category), ``win``/``tie``/``loss``/``equity`` by the river and
+    ``runouts``.  ``cards`` has one dict per possible next card: its
+    ``category`` and whether it ``improves``, the ``probability`` that it
+    comes next and the ``win``/``tie``/``equity`` once it has; best first.
+
+    A hand only improves if its new category also beats the board's own:
+    a card that just pairs the board (or a river that plays for both
+    players) is not an out, and ``improve`` leaves those runouts out too.
+    """
+    hero, opponents, board, live = parse_spot(hero, [villain], board, dead)
+    if len(board) not in (3, 4):
+        raise ValueError("Outs need a flop or a turn")
+    villain = opponents[0]
+    tables = get_tables()
+    evaluator = HandEvaluator()
+    hand = evaluator.incremental([FULL_DECK[index] for index in hero])
+    hand.extend([FULL_DECK[index] for index in board])
+    current = evaluator.category_code(hand.strength)
+
+    unseen = set(live)
+    known = [FULL_DECK[index] for index in range(52) if index not in unseen]
+    weights = _villain_weights(villain, known)
+    missing = 5 - len(board)
+    runouts = combination_array(live, missing)
+    boards = np.empty((len(runouts), 5), dtype=np.uint8)
+    boards[:, : len(board)] = board
+    boards[:, len(board) :] = runouts
+    hero_totals = INDEX_KEYS[hero].sum() + INDEX_KEYS[boards].sum(axis=1)
+    hero_strengths = strengths_from_keys(
+        hero_totals, np.array(hero, dtype=np.uint8), boards, tables
+    ).astype(np.int64)
+    wins, ties, totals = _showdowns(hero_strengths, boards, weights, tables)
+    final = categories(hero_strengths)
+    board_categories = evaluate_batch(DECK[boards], tables)[1]
+    improved = (final > current) & (final > board_categories)
+    total = totals.sum()
+    if total == 0:
+        raise ValueError("The opponent has no combos left")
+
+    # Each runout comes with either of its cards first, with equal chance.
+    per_card = np.zeros((3, 52))
+    for column in range(missing):
+        for row, values in enumerate((wins, ties, totals)):
+            per_card[row] += np.bincount(
+                runouts[:, column], weights=values, minlength=52
+            )
+    cards = []
+    for index in live:
+        card_total = per_card[2, index]
+        if card_total == 0:
+            continue
+        next_hand = hand.copy()
+        next_hand.add(FULL_DECK[index])
+        code = evaluator.category_code(next_hand.strength)
+        board_code = _board_category(evaluator, next_hand.board)
+        win = float(per_card[0, index] / card_total)
+        tie = float(per_card[1, index] / card_total)
+        cards.append(
+            {
+                "card": FULL_DECK[index],
+                "category": CATEGORY_NAMES[code],
+                "improves": code > max(current, board_code),
+                "probability": float(card_total / (missing * total)),
+                "win": win,
+                "tie": tie,
+                "equity": win + tie / 2,
+            }
+        )
+    cards.sort(key=lambda row: row["equity"], reverse=True)
+    by_category = np.bincount(final, weights=totals, minlength=11) / total
+    win = float(wins.sum() / total)
+    tie = float(ties.sum() / total)
+    return {
+        "category": CATEGORY_NAMES[current],
+        "outs": [row["card"] for row in cards if row["improves"]],
+        "improve": float(totals[improved].sum() / total),
+        "categories": {
+            CATEGORY_NAMES[code]: float(by_category[code])
+            for code in range(10, 0, -1)
+            if by_category[code]
+        },
+        "win": win,
+        "tie": tie,
+        "loss": 1 - win - tie,
+        "equity": win + tie / 2,
+        "runouts": len(runouts),
+        "cards": cards,
+    }
@@ -0,0 +1,182 @@
+"""Preflop equity of the 169 starting hands against 1-9 random opponents.
+
+Suits only matter preflop through suitedness, so the 1,326 two-card combos
+fall into 169 classes: 13 pairs ("AA"), 78 suited ("AKs") and 78 offsuit
+("AKo") hands.  Their equities are estimated offline with
+`src.equity.monte_carlo_equity` (`build_preflop_table`, one process per
+hand) and shipped as a small binary file: a header followed by one uint16 per
+(hand, opponents) pair, the equity scaled to 0-65535.  The file is read on
+first use, after which every lookup is a list index.
+"""
+
+import os
+import struct
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from src.card import RANKS, SUITS, make_card, rank_index, to_cards
+
+TABLE_VERSION = 1
+MAGIC = b"PKPF"
+HEADER = struct.Struct("<4sIIII")
+MAX_OPPONENTS = 9
+SCALE = 65535
+DEFAULT_TRIALS = 200_000
+
+_NAMES = [rank if rank != "10" else "T" for rank in RANKS]
+
+
+def _starting_hands():
+    # Chart order: AA, AKs, AKo, ..., A2o, KK, KQs, ... 22.
+    hands = []
+    for high in range(12, -1, -1):
+        hands.append(_NAMES[high] * 2)
+        for low in range(high - 1, -1, -1):
+            hands.append(_NAMES[high] + _NAMES[low] + "s")
+            hands.append(_NAMES[high] + _NAMES[low] + "o")
+    return hands
+
+
+STARTING_HANDS = _starting_hands()
+HAND_INDEX = {name: index for index, name in enumerate(STARTING_HANDS)}
+
+
+def hand_name(hole_cards):
+    """Canonical name of two hole cards, e.g. ["AH", "KH"] -> "AKs"."""
+    first, second = to_cards(hole_cards)
+    high, low = sorted([rank_index(first), rank_index(second)], reverse=True)
+    if high == low:
+        return _NAMES[high] * 2
+    suited = "s" if first & second & 0xF000 else "o"
+    return _NAMES[high] + _NAMES[low] + suited
+
+
+def combos(name):
+    """Number of two-card combos in a starting hand class (6, 4 or 12)."""
+    if len(name) == 2:
+        return 6
+    return 4 if name[2] == "s" else 12
+
+
+def example_cards(name):
+    """One pair of int cards belonging to the starting hand class ``name``."""
+    high, low = _NAMES.index(name[0]), _NAMES.index(name[1])
+    second_suit = SUITS[0] if name[2:] == "s" else SUITS[1]
+    return [make_card(high, SUITS[0]), make_card(low, second_suit)]
+
+
+def table_path():
+    return Path(__file__).parent / "data" / f"preflop-equity-v{TABLE_VERSION}.bin"
+
+
+def _hand_equities(args):
+    from src.equity import monte_carlo_equity
+
+    name, trials, seed = args
+    cards = example_cards(name)
+    return [
+        monte_carlo_equity(cards, opponents, trials=trials, seed=seed)["equity"]
+        for opponents in range(1, MAX_OPPONENTS + 1)
+    ]
+
+
+def build_preflop_table(trials=DEFAULT_TRIALS, workers=None, seed=0):
+    """Estimate every starting hand's equity against 1-9 random opponents.
+
+    Hands are spread over ``workers`` processes (default: one per CPU).
+    Each hand gets its own seed derived from ``seed``, so the result does
+    not depend on the number of workers.  Returns a list of 169 lists of 9
+    equities in `STARTING_HANDS` order.
+    """
+    import numpy as np
+
+    seeds = np.random.SeedSequence(seed).generate_state(len(STARTING_HANDS))
+    tasks = [
+        (name, trials, int(hand_seed)) for name, hand_seed in zip(STARTING_HANDS, seeds)
+    ]
+    if workers == 1:
+        return [_hand_equities(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_hand_equities, tasks))
+
+
+def serialize_table(equities, trials):
+    raw = bytearray(
+        HEADER.pack(MAGIC, TABLE_VERSION, len(STARTING_HANDS), MAX_OPPONENTS, trials)
+    )
+    for row in equities:
+        raw += struct.pack(f"<{MAX_OPPONENTS}H", *(round(e * SCALE) for e in row))
+    return bytes(raw)
+
+
+def write_preflop_table(equities, trials, path=None):
+    path = Path(path) if path else table_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(serialize_table(equities, trials))
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return path
+
+
+class PreflopTable:
+    def __init__(self, buffer):
+        magic, version, hands, opponents, trials = HEADER.unpack_from(buffer)
+        if magic != MAGIC or version != TABLE_VERSION:
+            raise ValueError("Preflop table file has the wrong format or version")
+        if hands != len(STARTING_HANDS) or opponents != MAX_OPPONENTS:
+            raise ValueError("Preflop table file has the wrong shape")
+        values = struct.unpack_from(f"<{hands * opponents}H", buffer, HEADER.size)
+        self.trials = trials
+        self.equities = [
+            [value / SCALE for value in values[i : i + opponents]]
+            for i in range(0, len(values), opponents)
+        ]
+        self._percentiles = {}
+
+    def equity(self, hand, opponents=1):
+        """Equity of a hand (name or two cards) against ``opponents`` random hands."""
+        if not 1 <= opponents <= MAX_OPPONENTS:
+            raise ValueError(f"opponents must be between 1 and {MAX_OPPONENTS}")
+        name = hand if isinstance(hand, str) else hand_name(hand)
+        return self.equities[HAND_INDEX[name]][opponents - 1]
+
+    def chart(self, opponents=1):
+        """``(name, equity)`` for every starting hand, strongest first."""
+        return sorted(
+            ((name, self.equity(name, opponents)) for name in STARTING_HANDS),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+
+    def percentile(self, hand, opponents=1):
+        """Share of all 1,326 combos that are no stronger than ``hand`` (0-1]."""
+        if opponents not in self._percentiles:
+            ranked = self.chart(opponents)[::-1]
+            percentiles, below = {}, 0
+            for name, _ in ranked:
+                below += combos(name)
+                percentiles[name] = below / 1326
+            self._percentiles[opponents] = percentiles
+        name = hand if isinstance(hand, str) else hand_name(hand)
+        return self._percentiles[opponents][name]
+
+
+def load_preflop_table(path=None):
+    path = Path(path) if path else table_path()
+    return PreflopTable(path.read_bytes())
+
+
+_table = None
+
+
+def get_preflop_table():
+    global _table
+    if _table is None:
+        _table = load_preflop_table()
+    return _table
@@ -0,0 +1,143 @@
+"""Exact hand-category frequencies for 5, 6 and 7 cards.
+
+Rather than evaluating all C(52, n) hands (133,784,560 for seven cards),
+every hand is counted through the same 7-card lookups, grouped by suit
+symmetry.  With seven or fewer cards at most one suit can hold five, so:
+
+* a hand whose flush suit holds exactly the ranks ``M`` (5 or more) takes
+  the ``flush7`` strength of ``M``, and there are ``4 * C(39, n - |M|)``
+  such hands, whatever the other cards are;
+* every other hand takes the ``nonflush`` strength of its rank multiset (at
+  most 49,205 of them).  A multiset with ``c_r`` cards of rank ``r`` makes
+  ``prod(C(4, c_r))`` hands, less the flushes: ``4 *`` the coefficients of
+  ``x**5`` and up in ``prod(C(3, c_r) + x * C(3, c_r - 1))``, which choose
+  the ranks present in the flush suit.
+
+All three hand sizes take about a second; the counts are then written to a
+small JSON file next to the lookup tables, so later runs just read it.
+"""
+
+import json
+import os
+import tempfile
+from functools import lru_cache
+from math import comb
+from pathlib import Path
+
+from src.card import PRIMES
+from src.hand_evaluator import HandEvaluator
+from src.lookup_tables import CATEGORY_BOUNDS, TABLE_VERSION, cache_dir, get_tables
+
+CARD_COUNTS = (5, 6, 7)
+
+
+def _rank_multisets(cards):
+    # (count of each rank, their prime product, suit assignments) for every
+    # multiset of ``cards`` cards with at most four of a rank.
+    partial = [((), cards, 1, 1)]
+    for prime in PRIMES:
+        partial = [
+            (
+                ranks + (count,),
+                left - count,
+                product * prime**count,
+                hands * comb(4, count),
+            )
+            for ranks, left, product, hands in partial
+            for count in range(min(left, 4) + 1)
+        ]
+    return [
+        (ranks, product, hands) for ranks, left, product, hands in partial if not left
+    ]
+
+
+@lru_cache(maxsize=None)
+def _flush_hands(counts):
+    # Suit assignments of a rank multiset where one suit holds 5+ cards; only
+    # the sorted nonzero rank counts matter.
+    ways = [1]
+    for count in counts:
+        off, on = comb(3, count), comb(3, count - 1)
+        ways = [a * off + b * on for a, b in zip(ways + [0], [0] + ways)]
+    return 4 * sum(ways[5:])
+
+
+def compute_category_counts(cards=7):
+    """Number of ``cards``-card hands whose best hand is each category.
+
+    Returns a dict keyed by category name, Royal Flush first, summing to
+    C(52, cards).
+    """
+    if cards not in CARD_COUNTS:
+        raise ValueError(f"Hands have 5, 6 or 7 cards, got {cards}")
+    tables = get_tables()
+    category = HandEvaluator.category
+    counts = {name: 0 for _, name in reversed(CATEGORY_BOUNDS)}
+    for mask in range(1 << 13):
+        suited = bin(mask).count("1")
+        if 5 <= suited <= cards:
+            counts[category(tables.flush7[mask])] += 4 * comb(39, cards - suited)
+    for ranks, product, hands in _rank_multisets(cards):
+        if 13 - ranks.count(0) >= 5:
+            hands -= _flush_hands(tuple(sorted(ranks))[ranks.count(0) :])
+        counts[category(tables.nonflush[product])] += hands
+    return counts
+
+
+def counts_path():
+    return cache_dir() / f"category-counts-v{TABLE_VERSION}.json"
+
+
+def _valid(counts):
+    return sorted(counts) == list(CARD_COUNTS) and all(
+        sum(counts[cards].values()) == comb(52, cards) for cards in CARD_COUNTS
+    )
+
+
+def load_category_counts(path=None):
+    """`compute_category_counts` for every hand size, read from the cache file.
+
+    The file is (re)written when it is missing or invalid; a read-only cache
+    location only means the counts are computed again next time.
+    """
+    path = Path(path) if path else counts_path()
+    try:
+        data = json.loads(path.read_text())
+        counts = {int(cards): value for cards, value in data.items()}
+        if _valid(counts):
+            return counts
+    except (OSError, ValueError, AttributeError):
+        pass
+    counts = {cards: compute_category_counts(cards) for cards in CARD_COUNTS}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(counts, f, indent=2)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        pass
+    return counts
+
+
+_counts = None
+
+
+def category_counts(cards=7):
+    """Cached `compute_category_counts`."""
+    global _counts
+    if cards not in CARD_COUNTS:
+        raise ValueError(f"Hands have 5, 6 or 7 cards, got {cards}")
+    if _counts is None:
+        _counts = load_category_counts()
+    return _counts[cards]
+
+
+def category_probabilities(cards=7):
+    """Chance (0-1) of each category as the best hand of ``cards`` random cards."""
+    total = comb(52, cards)
+    return {name: count / total for name, count in category_counts(cards).items()}
@@ -0,0 +1,105 @@
+"""Call counters and cumulative timers for the hot paths.
+
+Nothing is instrumented until `enable` is called: it swaps each function in
+`TARGETS` for a timed wrapper and `disable` puts the originals back, so a
+normal run pays nothing.  Times are inclusive (a call's time includes the
+instrumented calls it makes) and only cover this process; work done in a
+`--workers` pool is not counted.
+"""
+
+import functools
+import importlib
+import time
+
+# (module, class or None, function, group)
+TARGETS = [
+    ("src.hand_evaluator", "HandEvaluator", "evaluate", "eval"),
+    ("src.game", "PokerGame", "best_hand_strength", "eval"),
+    ("src.game", "PokerGame", "evaluate_best_hand", "eval"),
+    ("src.game", "PokerGame", "opponent_action", "game"),
+    ("src.game", "PokerGame", "deal_hands", "game"),
+    ("src.history", "HandHistoryWriter", "write", "io"),
+    ("src.history", "HandHistoryWriter", "flush", "io"),
+    ("src.binary_history", "BinaryHistoryWriter", "write", "io"),
+    ("src.binary_history", None, "convert_history", "io"),
+    ("src.stats", None, "summarize_history", "io"),
+    ("src.lookup_tables", None, "load_tables", "io"),
+    ("src.preflop", None, "load_preflop_table", "io"),
+]
+
+_counters = {}
+_originals = []
+
+
+def _timed(counter, func):
+    clock = time.perf_counter
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = clock()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            counter[0] += 1
+            counter[1] += clock() - start
+
+    return wrapper
+
+
+def enabled():
+    return bool(_originals)
+
+
+def enable():
+    """Instrument every target; calling it again is a no-op."""
+    if _originals:
+        return
+    for module_name, class_name, name, group in TARGETS:
+        module = importlib.import_module(module_name)
+        owner = module if class_name is None else getattr(module, class_name)
+        label = name if class_name is None else f"{class_name}.{name}"
+        original = owner.__dict__[name]
+        counter = _counters.setdefault(label, [0, 0.0, group])
+        setattr(owner, name, _timed(counter, original))
+        _originals.append((owner, name, original))
+
+
+def disable():
+    """Restore the original functions; the counts are kept until `reset`."""
+    while _originals:
+        owner, name, original = _originals.pop()
+        setattr(owner, name, original)
+
+
+def reset():
+    for counter in _counters.values():
+        counter[0] = 0
+        counter[1] = 0.0
+
+
+def report():
+    """Counts and times of every target called so far, slowest first."""
+    rows = [
+        {
+            "name": label,
+            "group": group,
+            "calls": calls,
+            "total_s": total,
+            "mean_us": total / calls * 1e6,
+        }
+        for label, (calls, total, group) in _counters.items()
+        if calls
+    ]
+    return sorted(rows, key=lambda row: row["total_s"], reverse=True)
+
+
+def format_report(rows):
+    lines = [
+        f"{'function':<34} {'group':<5} {'calls':>10} {'total s':>9} {'mean us':>9}"
+    ]
+    for row in rows:
+        lines.append(
+            f"{row['name']:<34} {row['group']:<5} {row['calls']:>10,} "
+            f"{row['total_s']:>9.3f} {row['mean_us']:>9.2f}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,237 @@
+"""Hand ranges: weighted sets of the 1,326 two-card combos.
+
+A `Range` holds one weight in [0, 1] per combo.  Combo ``k`` is the k-th pair
+``(i, j)``, ``i < j``, of `FULL_DECK` indices (`COMBOS`), so set operations,
+card removal and sampling are single NumPy operations over 1,326 slots
+instead of Python loops over hands.
+
+`parse_range` reads the usual notation, a comma-separated list of:
+
+* starting hands: ``AA``, ``AKs``, ``AKo``, ``AK`` (suited and offsuit);
+  ``T`` or ``10`` for tens
+* ``+`` for "this or better with the same top card": ``TT+`` (TT-AA),
+  ``A2s+`` (A2s-AKs), ``K9o+`` (K9o-KQo)
+* spans: ``22-55``, ``A2s-A5s``, ``KTo-KQo``
+* exact combos: ``AhKh``, ``10s9s``
+* an optional weight: ``KQo:0.5``
+
+Later entries override earlier ones.
+"""
+
+import re
+from itertools import combinations
+
+import numpy as np
+
+from src.card import CARD_INDEX, FULL_DECK, parse_cards, to_cards
+
+NUM_COMBOS = 1326
+# Combo slot -> its two FULL_DECK indices, and the reverse lookup.
+COMBOS = np.array(list(combinations(range(52), 2)), dtype=np.uint8)
+COMBO_INDEX = {(int(i), int(j)): slot for slot, (i, j) in enumerate(COMBOS)}
+# Combo slot -> 52-bit mask of its cards.
+COMBO_MASKS = (np.int64(1) << COMBOS[:, 0].astype(np.int64)) | (
+    np.int64(1) << COMBOS[:, 1].astype(np.int64)
+)
+# FULL_DECK is rank-major (2H, 2D, 2C, 2S, 3H, ...).
+_HIGH = COMBOS[:, 1] // 4
+_LOW = COMBOS[:, 0] // 4
+_SUITED = COMBOS[:, 0] % 4 == COMBOS[:, 1] % 4
+
+_RANK_NAMES = "23456789TJQKA"
+_HAND = re.compile(r"(10|[2-9TJQKA])(10|[2-9TJQKA])([SO]?)", re.IGNORECASE)
+
+
+def combo_index(hole_cards):
+    """Slot of two hole cards (ints or strings, either order)."""
+    first, second = sorted(CARD_INDEX[card] for card in to_cards(hole_cards))
+    if first == second:
+        raise ValueError("A combo needs two different cards")
+    return COMBO_INDEX[(first, second)]
+
+
+def card_mask(cards):
+    """52-bit mask of ``cards`` (ints or strings)."""
+    mask = 0
+    for card in to_cards(cards):
+        mask |= 1 << CARD_INDEX[card]
+    return mask
+
+
+class Range:
+    def __init__(self, weights=None):
+        if weights is None:
+            weights = np.zeros(NUM_COMBOS)
+        weights = np.asarray(weights, dtype=np.float64)
+        if weights.shape != (NUM_COMBOS,):
+            raise ValueError(f"Expected {NUM_COMBOS} weights, got {weights.shape}")
+        if np.any((weights < 0) | (weights > 1)):
+            raise ValueError("Range weights must be between 0 and 1")
+        self.weights = weights
+
+    @classmethod
+    def parse(cls, text):
+        return parse_range(text)
+
+    @classmethod
+    def from_hands(cls, hands):
+        """A range holding each of ``hands`` (pairs of hole cards) at weight 1."""
+        weights = np.zeros(NUM_COMBOS)
+        weights[[combo_index(hole) for hole in hands]] = 1.0
+        return cls(weights)
+
+    @classmethod
+    def full(cls):
+        return cls(np.ones(NUM_COMBOS))
+
+    @property
+    def mask(self):
+        """Boolean vector of the combos in the range."""
+        return self.weights > 0
+
+    def __len__(self):
+        return int(np.count_nonzero(self.weights))
+
+    def __contains__(self, hole_cards):
+        return bool(self.weights[combo_index(hole_cards)] > 0)
+
+    def __eq__(self, other):
+        return isinstance(other, Range) and np.array_equal(self.weights, other.weights)
+
+    def __or__(self, other):
+        return Range(np.maximum(self.weights, other.weights))
+
+    def __and__(self, other):
+        return Range(np.minimum(self.weights, other.weights))
+
+    def __sub__(self, other):
+        return Range(np.where(other.weights > 0, 0.0, self.weights))
+
+    def __invert__(self):
+        return Range(np.where(self.weights > 0, 0.0, 1.0))
+
+    def __repr__(self):
+        return f"Range({len(self)} combos, weight {self.total():g})"
+
+    def total(self):
+        """Weighted number of combos."""
+        return float(self.weights.sum())
+
+    def weight(self, hole_cards):
+        return float(self.weights[combo_index(hole_cards)])
+
+    def remove(self, dead):
+        """The range without combos that use any of the ``dead`` cards."""
+        blocked = (COMBO_MASKS & card_mask(dead)) != 0
+        return Range(np.where(blocked, 0.0, self.weights))
+
+    def slots(self):
+        """Slots of the combos in the range."""
+        return np.flatnonzero(self.weights)
+
+    def cards(self):
+        """(N, 2) int cards of the combos in the range, e.g. for
+        `PokerGame.evaluate_best_hand_batch`."""
+        return np.array(FULL_DECK, dtype=np.int64)[COMBOS[self.slots()]]
+
+    def hands(self):
+        """``(hole_cards, weight)`` for every combo in the range."""
+        return [
+            ([FULL_DECK[i] for i in COMBOS[slot]], float(self.weights[slot]))
+            for slot in self.slots()
+        ]
+
+    def sample(self, rng, size=1, dead=()):
+        """``size`` combo slots drawn in proportion to their weights.
+
+        ``rng`` is a NumPy ``Generator``; combos using a ``dead`` card are
+        never drawn.
+        """
+        weights = self.remove(dead).weights if len(dead) else self.weights
+        total = weights.sum()
+        if total <= 0:
+            raise ValueError("The range is empty")
+        return rng.choice(NUM_COMBOS, size=size, p=weights / total)
+
+
+def _rank(text):
+    return _RANK_NAMES.index("T" if text == "10" else text.upper())
+
+
+def _hand_slots(high, low, suit):
+    # suit: "s", "o" or "" (both); high >= low rank indices.
+    slots = (_HIGH == high) & (_LOW == low)
+    if high != low and suit:
+        slots &= _SUITED if suit == "s" else ~_SUITED
+    return slots
+
+
+def _parse_hand(text):
+    match = _HAND.fullmatch(text)
+    if not match:
+        raise ValueError(f"Invalid hand {text!r}")
+    first, second = _rank(match.group(1)), _rank(match.group(2))
+    suit = match.group(3).lower()
+    if first == second and suit:
+        raise ValueError(f"A pair cannot be suited or offsuit: {text!r}")
+    return max(first, second), min(first, second), suit
+
+
+def _token_slots(token):
+    if "-" in token:
+        start, end = (_parse_hand(part.strip()) for part in token.split("-", 1))
+        (high1, low1, suit1), (high2, low2, suit2) = start, end
+        if high1 == low1 and high2 == low2:
+            ranks = [
+                (rank, rank) for rank in range(min(low1, low2), max(low1, low2) + 1)
+            ]
+        elif high1 == high2 and suit1 == suit2 and high1 != low1 and high2 != low2:
+            low_ranks = range(min(low1, low2), max(low1, low2) + 1)
+            ranks = [(high1, low) for low in low_ranks]
+        else:
+            raise ValueError(f"Invalid span {token!r}")
+        suit = suit1
+    elif token.endswith("+"):
+        high, low, suit = _parse_hand(token[:-1])
+        if high == low:
+            ranks = [(rank, rank) for rank in range(low, 13)]
+        else:
+            ranks = [(high, rank) for rank in range(low, high)]
+    elif _HAND.fullmatch(token):
+        high, low, suit = _parse_hand(token)
+        ranks = [(high, low)]
+    else:
+        try:
+            cards = parse_cards(token)
+        except ValueError:
+            cards = []
+        if len(cards) != 2:
+            raise ValueError(f"Invalid range entry {token!r}")
+        slots = np.zeros(NUM_COMBOS, dtype=bool)
+        slots[combo_index(cards)] = True
+        return slots
+    slots = np.zeros(NUM_COMBOS, dtype=bool)
+    for high, low in ranks:
+        slots |= _hand_slots(high, low, suit)
+    return slots
+
+
+def parse_range(text):
+    """Parse range notation (see the module docstring) into a `Range`."""
+    weights = np.zeros(NUM_COMBOS)
+    for token in text.split(","):
+        token = token.strip()
+        if not token:
+            continue
+        weight = 1.0
+        if ":" in token:
+            token, value = token.rsplit(":", 1)
+            try:
+                weight = float(value)
+            except ValueError:
+                raise ValueError(f"Invalid weight {value!r}") from None
+            if not 0 <= weight <= 1:
+                raise ValueError(f"Weight must be between 0 and 1, got {weight}")
+            token = token.strip()
+        weights[_token_slots(token)] = weight
+    return Range(weights)
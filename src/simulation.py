@@ -0,0 +1,215 @@
+"""Headless heads-up simulation for validating the bot in bulk.
+
+Every hand is dealt with `PokerGame.deal_hands` and settled with
+`PokerGame.play`, exactly as the `play` command does, but nothing is printed:
+results are folded into one aggregate dict.  With ``betting`` both seats are
+driven by `PokerGame.opponent_action` through all four streets (blinds 1/2,
+the button alternates every hand); without it each hand is a fixed-bet
+showdown.  Wins, losses and net chips are counted for the first seat
+("Player").
+
+`simulate_sharded` deals every hand from a `src.rng.CounterRNG` stream keyed
+by (seed, hand index) and splits the run into fixed-size shards over worker
+processes.  The merged result depends only on the seed, never on the number
+of workers, and any single hand can be regenerated with `replay_hand`.
+"""
+
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+SMALL_BLIND, BIG_BLIND = 1, 2
+SHARD_HANDS = 50_000
+STREETS = (("preflop", 0), ("flop", 3), ("turn", 4), ("river", 5))
+
+
+def new_stats():
+    return {
+        "hands": 0,
+        "wins": 0,
+        "losses": 0,
+        "ties": 0,
+        "folds": 0,
+        "net": 0,
+        "categories": {},
+    }
+
+
+def _record(stats, result, net):
+    stats["hands"] += 1
+    stats["net"] += net
+    if result["winner"] == "Player":
+        stats["wins"] += 1
+    elif result["winner"] == "Opponent":
+        stats["losses"] += 1
+    else:
+        stats["ties"] += 1
+    if result["rank"] is None:
+        stats["folds"] += 1
+    else:
+        categories = stats["categories"]
+        categories[result["rank"]] = categories.get(result["rank"], 0) + 1
+
+
+def showdown_hand(game, bet=1, hand_index=None):
+    """Deal one hand and settle it at showdown with both seats betting ``bet``."""
+    (player_hole, opponent_hole), community_cards = game.deal_hands(2, hand_index)
+    result = game.play(player_hole, opponent_hole, community_cards, bet * 2, bet)
+    net = {"Player": bet, "Opponent": -bet}.get(result["winner"], 0)
+    return result, net
+
+
+def betting_hand(game, button=0, stack=100, hand_index=None):
+    """Deal one hand and let `opponent_action` play both seats.
+
+    Seat ``button`` posts the small blind and acts first preflop; the other
+    seat acts first after the flop.  Returns ``(result, net)`` where
+    ``result`` is the `play` dict (``rank`` is None when the hand ended with
+    a fold) and ``net`` is the first seat's chip change.
+    """
+    holes, board = game.deal_hands(2, hand_index)
+    contexts = [game.new_context(hole) for hole in holes]
+    stacks = [stack, stack]
+    put = [0, 0]
+    for seat, blind in ((button, SMALL_BLIND), (1 - button, BIG_BLIND)):
+        put[seat] = min(blind, stacks[seat])
+        stacks[seat] -= put[seat]
+    for street, shown in STREETS:
+        if 0 in stacks:
+            break
+        community = board[:shown]
+        actor = button if street == "preflop" else 1 - button
+        street_bets = list(put) if street == "preflop" else [0, 0]
+        acted = [False, False]
+        raise_count = 0
+        while True:
+            other = 1 - actor
+            to_call = street_bets[other] - street_bets[actor]
+            if stacks[actor] == 0 or (to_call <= 0 and stacks[other] == 0):
+                break
+            action, amount = game.opponent_action(
+                to_call,
+                put[0] + put[1],
+                street,
+                holes[actor],
+                community,
+                stacks[actor],
+                raise_count,
+                stacks[other],
+                context=contexts[actor],
+            )
+            if action == "fold" and to_call > 0:
+                pot = put[0] + put[1]
+                net = pot - put[0] if other == 0 else -put[0]
+                result = {
+                    "winner": "Player" if other == 0 else "Opponent",
+                    "hand": holes[other],
+                    "rank": None,
+                    "pot": pot,
+                }
+                return result, net
+            if action in ("bet", "raise"):
+                paid = min(max(amount, to_call + 1), stacks[actor])
+                raise_count += 1
+                acted[other] = False
+            else:
+                paid = min(to_call, stacks[actor])
+            stacks[actor] -= paid
+            put[actor] += paid
+            street_bets[actor] += paid
+            acted[actor] = True
+            settled = street_bets[0] == street_bets[1] or 0 in stacks
+            if (acted[other] and settled) or paid < to_call:
+                break
+            actor = other
+    # Return whatever part of a bet the other seat could not match.
+    matched = min(put)
+    result = game.play(holes[0], holes[1], board, 2 * matched, matched)
+    net = {"Player": matched, "Opponent": -matched}.get(result["winner"], 0)
+    return result, net
+
+
+def play_hand(game, index, betting=False, bet=1, stack=100):
+    """Play hand number ``index`` of a run (the button alternates by index)."""
+    hand_index = None if game.counter_rng is None else index
+    if betting:
+        return betting_hand(game, index % 2, stack, hand_index)
+    return showdown_hand(game, bet, hand_index)
+
+
+def simulate(
+    hands, game=None, betting=False, bet=1, stack=100, stats=None, first_hand=None
+):
+    """Play ``hands`` heads-up hands and return the aggregate stats dict.
+
+    Hands are numbered from ``first_hand`` (default: the hands already in
+    ``stats``); a seeded game deals hand n from its stream n.
+    """
+    if game is None:
+        from src.game import PokerGame
+
+        game = PokerGame()
+    stats = new_stats() if stats is None else stats
+    start = stats["hands"] if first_hand is None else first_hand
+    for index in range(start, start + hands):
+        result, net = play_hand(game, index, betting, bet, stack)
+        _record(stats, result, net)
+    return stats
+
+
+def merge_stats(total, stats):
+    """Add one aggregate dict into another (in place) and return it."""
+    for key, value in stats.items():
+        if key == "categories":
+            categories = total["categories"]
+            for rank, count in value.items():
+                categories[rank] = categories.get(rank, 0) + count
+        else:
+            total[key] += value
+    return total
+
+
+def _run_shard(args):
+    from src.game import PokerGame
+
+    first_hand, hands, seed, betting, bet, stack = args
+    game = PokerGame(seed=seed)
+    return simulate(hands, game, betting, bet, stack, first_hand=first_hand)
+
+
+def simulate_sharded(hands, workers=1, seed=None, betting=False, bet=1, stack=100):
+    """`simulate` split into `SHARD_HANDS` shards over ``workers`` processes.
+
+    Returns ``(stats, seed)``; ``seed`` is the seed actually used (a random
+    one when ``seed`` is None), so any run can be repeated.
+    """
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+    tasks = [
+        (first, min(SHARD_HANDS, hands - first), seed, betting, bet, stack)
+        for first in range(0, hands, SHARD_HANDS)
+    ]
+    total = new_stats()
+    if workers == 1 or len(tasks) == 1:
+        for task in tasks:
+            merge_stats(total, _run_shard(task))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for stats in pool.map(_run_shard, tasks):
+                merge_stats(total, stats)
+    return total, seed
+
+
+def replay_hand(seed, hand_index, betting=False, bet=1, stack=100):
+    """Regenerate one hand of a `simulate_sharded` run from its seed alone."""
+    from src.game import PokerGame
+
+    result, net = play_hand(PokerGame(seed=seed), hand_index, betting, bet, stack)
+    holes, board = PokerGame(seed=seed).deal_hands(2, hand_index)
+    return {
+        "hand_index": hand_index,
+        "player": holes[0],
+        "opponent": holes[1],
+        "board": board,
+        "result": result,
+        "net": net,
+    }
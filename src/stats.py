@@ -0,0 +1,303 @@
+"""Summaries of hand-history files of any size.
+
+Three layouts are read, all without loading the file whole:
+
+* JSONL (`src.history`): split into byte ranges that end on line breaks;
+  each range is parsed and summarised on its own.
+* binary (`src.binary_history`): split into record ranges, each read as a
+  NumPy record array and summarised with vector operations.
+* the legacy ``game_history.json`` document: a single JSON object, so it is
+  walked sequentially with an incremental decoder that holds one hand at a
+  time.
+
+Range summaries are computed in a process pool and merged by addition, so
+the result does not depend on the number of workers.
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from src.binary_history import (
+    CATEGORIES,
+    HEADER,
+    MAGIC,
+    RECORD,
+    RECORD_DTYPE,
+    WINNERS,
+    legacy_record,
+)
+
+
+CHUNK_BYTES = 32 * 1024 * 1024
+UNKNOWN_RANK = "Unknown"
+_RESULTS = {"Player": "wins", "Opponent": "losses", "Tie": "ties"}
+
+
+def _new_row():
+    return {"hands": 0, "wins": 0, "losses": 0, "ties": 0, "net": 0}
+
+
+def new_summary():
+    return dict(
+        _new_row(), showdowns=0, abandoned=0, by_player_rank={}, by_opponent_rank={}
+    )
+
+
+def add_record(summary, record):
+    # A hand left with "finish" has no winner; it is counted on its own and
+    # kept out of every other total.
+    if record.get("abandoned") or record.get("winner") is None:
+        summary["abandoned"] += 1
+        return summary
+    net = record.get("net", 0)
+    result = _RESULTS.get(record.get("winner"))
+    summary["hands"] += 1
+    summary["net"] += net
+    summary["showdowns"] += bool(record.get("showdown"))
+    if result:
+        summary[result] += 1
+    for key, rank in (
+        ("by_player_rank", record.get("player_rank")),
+        ("by_opponent_rank", record.get("opponent_rank")),
+    ):
+        row = summary[key].setdefault(rank or UNKNOWN_RANK, _new_row())
+        row["hands"] += 1
+        row["net"] += net
+        if result:
+            row[result] += 1
+    return summary
+
+
+def merge_summaries(total, part):
+    for key, value in part.items():
+        if isinstance(value, dict):
+            rows = total[key]
+            for rank, row in value.items():
+                target = rows.setdefault(rank, _new_row())
+                for field, count in row.items():
+                    target[field] += count
+        else:
+            total[key] += value
+    return total
+
+
+# --- JSONL -----------------------------------------------------------------
+
+
+def _jsonl_chunks(path, chunk_bytes):
+    size = os.path.getsize(path)
+    return [
+        (path, start, min(start + chunk_bytes, size))
+        for start in range(0, size, chunk_bytes)
+    ]
+
+
+def _summarize_jsonl(args):
+    # A line belongs to the range holding its first byte.
+    path, start, end = args
+    summary = new_summary()
+    with open(path, "rb") as f:
+        if start:
+            f.seek(start - 1)
+            if f.read(1) != b"\n":
+                f.readline()
+        while f.tell() < end:
+            line = f.readline()
+            if not line.endswith(b"\n"):
+                break  # torn last line
+            if line.strip():
+                add_record(summary, json.loads(line))
+    return summary
+
+
+# --- binary ----------------------------------------------------------------
+
+
+def _binary_chunks(path, chunk_records):
+    count = (os.path.getsize(path) - HEADER.size) // RECORD.size
+    return [
+        (path, start, min(start + chunk_records, count))
+        for start in range(0, count, chunk_records)
+    ]
+
+
+def _summarize_binary(args):
+    import numpy as np
+
+    path, start, stop = args
+    records = np.fromfile(
+        path,
+        dtype=RECORD_DTYPE,
+        count=stop - start,
+        offset=HEADER.size + start * RECORD.size,
+    )
+    winners = records["outcome"] & 0xF
+    summary = new_summary()
+    played = winners != WINNERS.index(None)
+    summary["abandoned"] = len(records) - int(np.count_nonzero(played))
+    records, winners = records[played], winners[played]
+    net = records["net"].astype(np.int64)
+    summary["hands"] = len(records)
+    summary["net"] = int(net.sum())
+    summary["showdowns"] = int(np.count_nonzero(records["outcome"] >> 4 == 4))
+    for code, winner in enumerate(WINNERS):
+        if winner in _RESULTS:
+            summary[_RESULTS[winner]] = int(np.count_nonzero(winners == code))
+    for key, codes in (
+        ("by_player_rank", records["ranks"] >> 4),
+        ("by_opponent_rank", records["ranks"] & 0xF),
+    ):
+        size = len(CATEGORIES)
+        hands = np.bincount(codes, minlength=size)
+        nets = np.bincount(codes, weights=net, minlength=size)
+        results = {
+            _RESULTS[winner]: np.bincount(codes[winners == code], minlength=size)
+            for code, winner in enumerate(WINNERS)
+            if winner in _RESULTS
+        }
+        for code in np.flatnonzero(hands):
+            row = {"hands": int(hands[code]), "net": int(nets[code])}
+            row.update({field: int(counts[code]) for field, counts in results.items()})
+            summary[key][CATEGORIES[code] or UNKNOWN_RANK] = row
+    return summary
+
+
+# --- legacy game_history.json ----------------------------------------------
+
+
+class _JsonStream:
+    """Incremental decoding of one JSON document read in blocks."""
+
+    def __init__(self, f, block=1 << 20):
+        self.file = f
+        self.block = block
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self):
+        data = self.file.read(self.block)
+        self.eof = not data
+        self.buffer = self.buffer[self.pos :] + data
+        self.pos = 0
+        return not self.eof
+
+    def peek(self):
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos].isspace():
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON document")
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} in JSON document")
+        self.pos += 1
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                value, end = None, None
+            # A value that reaches the end of the buffer may be cut short.
+            if end is not None and (end < len(self.buffer) or self.eof):
+                self.pos = end
+                return value
+            if not self._fill() and end is None:
+                raise ValueError("Invalid JSON document")
+
+    def entries(self):
+        """Yield the keys of the object starting here; the caller reads each value."""
+        self.expect("{")
+        while self.peek() != "}":
+            key = self.value()
+            self.expect(":")
+            yield key
+            if self.peek() == ",":
+                self.pos += 1
+        self.pos += 1
+
+
+def iter_legacy_records(path):
+    """Yield the hands of a ``game_history.json`` one at a time.
+
+    Only the small per-round ``bets`` map is kept in memory.
+    """
+    with open(path, encoding="utf-8") as f:
+        stream = _JsonStream(f)
+        bets = {}
+        for key in stream.entries():
+            if key in ("bets", "hands") and stream.peek() == "{":
+                for round_key in stream.entries():
+                    value = stream.value()
+                    if key == "bets":
+                        bets[round_key] = value
+                    else:
+                        yield legacy_record(round_key, value, bets.get(round_key, 0))
+            else:
+                stream.value()
+
+
+def _summarize_legacy(path):
+    summary = new_summary()
+    for record in iter_legacy_records(path):
+        add_record(summary, record)
+    return summary
+
+
+# ---------------------------------------------------------------------------
+
+
+def history_format(path):
+    """``"binary"``, ``"jsonl"`` or ``"legacy"`` (one JSON document).
+
+    Decided by the first non-blank line: the legacy document is written
+    indented, so its ``{`` stands alone, while every JSONL line holds a whole
+    record.  An empty file is an empty JSONL history, and a torn first line
+    stays JSONL.
+    """
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) == MAGIC:
+            return "binary"
+        f.seek(0)
+        first = b""
+        for line in f:
+            first = line.strip()
+            if first:
+                break
+    if first == b"{":
+        return "legacy"
+    try:
+        record = json.loads(first)
+    except ValueError:
+        return "jsonl"  # torn
+    # A legacy document written on one line.
+    return "legacy" if isinstance(record, dict) and "hands" in record else "jsonl"
+
+
+def summarize_history(path, workers=1, chunk_bytes=CHUNK_BYTES):
+    """Summarise a hand-history file; see `new_summary` for the keys."""
+    layout = history_format(path)
+    if layout == "legacy":
+        return _summarize_legacy(path)
+    if layout == "binary":
+        worker, chunks = _summarize_binary, _binary_chunks(
+            path, max(chunk_bytes // RECORD.size, 1)
+        )
+    else:
+        worker, chunks = _summarize_jsonl, _jsonl_chunks(path, chunk_bytes)
+    total = new_summary()
+    if workers == 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            merge_summaries(total, worker(chunk))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for summary in pool.map(worker, chunks):
+                merge_summaries(total, summary)
+    return total
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+from src.batch import DECK
+from src.card import to_cards
+from src.game import PokerGame
+from src.hand_evaluator import HandEvaluator
+
+
+@pytest.fixture
+def cards():
+    rng = np.random.default_rng(7)
+    return DECK[np.argsort(rng.random((2000, 52)), axis=1)[:, :7]]
+
+
+def test_evaluate_batch_matches_scalar(cards):
+    evaluator = HandEvaluator()
+    strengths, categories = evaluator.evaluate_batch(cards[:, :5])
+    for hand, strength, category in zip(cards[:, :5].tolist(), strengths, categories):
+        assert strength == evaluator.strength(hand)
+        assert category == evaluator.category_code(strength)
+
+
+@pytest.mark.parametrize("num_cards", [5, 6, 7])
+def test_best_hand_batch_matches_scalar(cards, num_cards):
+    game = PokerGame()
+    strengths, _ = game.evaluate_best_hand_batch(cards[:, :num_cards])
+    for hand, strength in zip(cards[:, :num_cards].tolist(), strengths):
+        assert strength == game.evaluator.best_strength(hand)
+
+
+def test_best_hand_batch_with_shared_board():
+    game = PokerGame()
+    board = ["10H", "JH", "QH", "2C", "3D"]
+    strengths, categories = game.evaluate_best_hand_batch([["AH", "KH"], ["2D", "3C"]], board)
+    assert strengths[0] == 7462
+    assert list(categories) == [10, 3]
+
+
+def test_evaluate_batch_takes_seven_cards(cards):
+    evaluator = HandEvaluator()
+    strengths, categories = evaluator.evaluate_batch(cards)
+    for hand, strength, category in zip(cards.tolist(), strengths, categories):
+        assert strength == evaluator.best_strength(hand)
+        assert category == evaluator.category_code(strength)
+    hand = np.array([to_cards(["AH", "KH", "QH", "JH", "10H", "2C", "3D"])])
+    assert evaluator.evaluate_batch(hand)[0].tolist() == [7462]
+
+
+def test_batch_rejects_bad_shape():
+    with pytest.raises(ValueError):
+        HandEvaluator().evaluate_batch(np.zeros((3, 4), dtype=np.int64))
+    with pytest.raises(ValueError, match="No hands"):
+        PokerGame().evaluate_best_hand_batch([])
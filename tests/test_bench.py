@@ -0,0 +1,56 @@
+import os
+
+import pytest
+
+from src.bench import (
+    BENCHMARKS,
+    THRESHOLD,
+    load_baseline,
+    measure,
+    regressions,
+    run_suite,
+    save_baseline,
+)
+
+
+def test_measure_reports_throughput_and_percentiles():
+    result = measure(lambda: None, duration=0.01)
+    assert result["calls"] > 0
+    assert result["ops_per_sec"] > 0
+    assert 0 <= result["p50_us"] <= result["p90_us"] <= result["p99_us"]
+
+
+def test_every_benchmark_runs():
+    report = run_suite(duration=0.01)
+    assert list(report["benchmarks"]) == list(BENCHMARKS)
+    for result in report["benchmarks"].values():
+        assert result["ops_per_sec"] > 0
+
+
+def test_unknown_benchmark_is_rejected():
+    with pytest.raises(ValueError):
+        run_suite(["nope"], duration=0.01)
+
+
+def test_baseline_round_trip_and_regressions(tmp_path):
+    report = run_suite(["evaluate"], duration=0.01)
+    path = tmp_path / "baseline.json"
+    save_baseline(report, path)
+    baseline = load_baseline(path)
+    assert regressions(report, baseline) == []
+    ops = report["benchmarks"]["evaluate"]["ops_per_sec"]
+    baseline["benchmarks"]["evaluate"]["ops_per_sec"] = ops * 2
+    assert regressions(report, baseline, 0.2) == [("evaluate", ops * 2, ops)]
+    assert regressions(report, baseline, 0.6) == []
+    # Benchmarks missing from the baseline are not regressions.
+    assert regressions(report, {"benchmarks": {}}) == []
+
+
+@pytest.mark.skipif(
+    "BENCH_BASELINE" not in os.environ, reason="set BENCH_BASELINE to a saved baseline"
+)
+def test_no_regression_against_baseline():
+    baseline = load_baseline(os.environ["BENCH_BASELINE"])
+    threshold = float(os.environ.get("BENCH_THRESHOLD", THRESHOLD))
+    report = run_suite(list(baseline["benchmarks"]))
+    assert regressions(report, baseline, threshold) == []
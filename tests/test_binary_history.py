@@ -0,0 +1,96 @@
+import json
+
+import pytest
+from src.binary_history import (
+    RECORD,
+    BinaryHistory,
+    BinaryHistoryWriter,
+    convert_history,
+    pack_record,
+    unpack_record,
+)
+from src.history import HandHistoryWriter
+
+RECORD_EXAMPLE = {
+    "round": 7,
+    "street": "showdown",
+    "player_hole": ["AH", "KH"],
+    "opponent_hole": ["2C", "3D"],
+    "community_cards": ["10H", "JH", "QH", "2D", "4S"],
+    "winner": "Player",
+    "showdown": True,
+    "player_rank": "Royal Flush",
+    "opponent_rank": "One Pair",
+    "bet": 12,
+    "pot": 27,
+    "net": 15,
+    "money": 115,
+}
+
+
+def test_record_round_trip():
+    raw = pack_record(RECORD_EXAMPLE)
+    assert len(raw) == RECORD.size == 27
+    assert unpack_record(raw, number=7) == RECORD_EXAMPLE
+    folded = dict(
+        RECORD_EXAMPLE,
+        street="flop",
+        showdown=False,
+        community_cards=["10H", "JH", "QH"],
+        player_rank=None,
+        opponent_rank=None,
+        winner="Opponent",
+        net=-4,
+    )
+    assert unpack_record(pack_record(folded), number=7) == folded
+
+
+def test_reader_seeks_to_any_hand(tmp_path):
+    path = tmp_path / "hands.bin"
+    with BinaryHistoryWriter(path) as writer:
+        for number in range(100):
+            writer.write(dict(RECORD_EXAMPLE, net=number - 50))
+    with open(path, "ab") as f:
+        f.write(b"\x01\x02")  # torn record from an interrupted write
+    with BinaryHistory(path) as history:
+        assert len(history) == 100
+        assert history[42]["net"] == -8
+        assert history[42]["round"] == 43
+        assert history[-1]["round"] == 100
+        assert sum(record["net"] for record in history) == sum(range(-50, 50))
+        with pytest.raises(IndexError):
+            history[100]
+
+
+def test_convert_legacy_and_jsonl(tmp_path):
+    legacy = {
+        "rounds": 1,
+        "bets": {"round3": 10},
+        "hands": {
+            "round3": {
+                "player_hole": ["AH", "KH"],
+                "opponent_hole": ["2C", "3D"],
+                "community_cards": ["10H", "JH", "QH", "2D", "4S"],
+                "result": "Player",
+                "player_rank": "Royal Flush",
+                "opponent_rank": "One Pair",
+            }
+        },
+    }
+    source = tmp_path / "game_history.json"
+    source.write_text(json.dumps(legacy, indent=4))
+    assert convert_history(source, tmp_path / "legacy.bin") == 1
+    with BinaryHistory(tmp_path / "legacy.bin") as history:
+        assert history[0]["round"] == 1
+        assert history[0]["bet"] == 10
+        assert history[0]["winner"] == "Player"
+
+    with HandHistoryWriter(tmp_path / "hands.jsonl") as writer:
+        writer.write(dict(RECORD_EXAMPLE, round=1))
+        writer.write(dict(RECORD_EXAMPLE, round=2))
+    assert convert_history(tmp_path / "hands.jsonl", tmp_path / "hands.bin") == 2
+    with BinaryHistory(tmp_path / "hands.bin") as history:
+        assert list(history) == [
+            dict(RECORD_EXAMPLE, round=1),
+            dict(RECORD_EXAMPLE, round=2),
+        ]
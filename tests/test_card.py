@@ -0,0 +1,26 @@
+from src.card import FULL_DECK, card_from_str, card_to_str, rank_value, to_cards
+from src.deck import Deck
+from src.hand_evaluator import HandEvaluator
+
+
+def test_round_trip():
+    for card in FULL_DECK:
+        assert card_from_str(card_to_str(card)) == card
+    assert card_to_str(card_from_str("th")) == "10H"
+
+
+def test_full_deck_is_unique():
+    assert len(set(FULL_DECK)) == 52
+    deck = Deck()
+    assert set(deck.cards) == set(FULL_DECK)
+    assert len(deck.suits) * len(deck.ranks) == 52
+
+
+def test_rank_value():
+    assert [rank_value(card) for card in to_cards(["2C", "10D", "AS"])] == [2, 10, 14]
+
+
+def test_string_and_int_cards_agree():
+    evaluator = HandEvaluator()
+    hand = ["10H", "JH", "QH", "KH", "AH"]
+    assert evaluator.evaluate(hand) == evaluator.evaluate(to_cards(hand))
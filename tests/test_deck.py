@@ -1,5 +1,11 @@
 import random
 
+import pytest
+
+import src.deck
+from src.card import FULL_DECK, to_cards
+
+
 class Deck:
     def __init__(self):
         ranks = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
@@ -24,4 +30,42 @@ class Deck:
     @staticmethod
     def full_name_suit(suit):
         suit_map = {'H': 'Hearts', 'D': 'Diamonds', 'C': 'Clubs', 'S': 'Spades'}
-        return suit_map.get(suit, 'Unknown')
\ No newline at end of file
+        return suit_map.get(suit, 'Unknown')
+
+
+def test_deck_deals_without_repeats():
+    deck = src.deck.Deck(random.Random(1))
+    deck.shuffle()
+    dealt = deck.deal(2) + deck.deal(5) + deck.deal(45)
+    assert sorted(dealt) == sorted(FULL_DECK)
+    with pytest.raises(ValueError):
+        deck.deal(1)
+    deck.reset()
+    assert deck.cards == list(FULL_DECK)
+    assert deck.deal(2) == list(FULL_DECK[:2])
+
+
+def test_deck_remove_dead_cards():
+    deck = src.deck.Deck(random.Random(2))
+    dead = to_cards(["AS", "KD", "2C"])
+    for card in dead:
+        deck.remove(card)
+    assert len(deck) == 49
+    deck.shuffle()
+    dealt = deck.deal(49)
+    assert not set(dead) & set(dealt)
+    assert len(set(dealt)) == 49
+    deck.reset()
+    deck.deal(1)
+    with pytest.raises(ValueError):
+        deck.remove(FULL_DECK[0])
+
+
+def test_shuffle_only_randomises_dealt_cards():
+    deck = src.deck.Deck(random.Random(3))
+    deck.shuffle()
+    # shuffle() only switches to random dealing; nothing moves until a deal.
+    assert deck.cards == list(FULL_DECK)
+    dealt = deck.deal(5)
+    assert dealt != list(FULL_DECK[:5])
+    assert sorted(dealt + deck.cards) == sorted(FULL_DECK)
@@ -0,0 +1,110 @@
+import pytest
+from src.equity import monte_carlo_equity
+
+
+def test_pocket_aces_against_random_hand():
+    result = monte_carlo_equity(["AH", "AD"], 1, trials=200_000, seed=1)
+    assert result["equity"] == pytest.approx(0.852, abs=0.005)
+    assert result["win"] + result["tie"] + result["loss"] == pytest.approx(1.0)
+    assert 0 < result["stderr"] < 0.002
+
+
+def test_complete_board_is_decided():
+    board = ["10H", "JH", "QH", "2C", "3D"]
+    result = monte_carlo_equity(["AH", "KH"], [["2D", "3C"]], board, trials=1000)
+    assert result["win"] == 1.0
+    assert result["stderr"] == 0.0
+    result = monte_carlo_equity(["2S", "3S"], [["2D", "3C"]], board, trials=1000)
+    assert result["tie"] == 1.0
+    assert result["equity"] == 0.5
+
+
+def test_seed_makes_runs_reproducible():
+    first = monte_carlo_equity(["7C", "8C"], 3, board=["9C"], trials=5000, seed=42)
+    second = monte_carlo_equity(["7C", "8C"], 3, board=["9C"], trials=5000, seed=42)
+    assert first == second
+
+
+def test_duplicate_cards_are_rejected():
+    with pytest.raises(ValueError):
+        monte_carlo_equity(["AH", "KH"], [["AH", "QD"]])
+    with pytest.raises(ValueError):
+        monte_carlo_equity(["AH", "KH"], dead=["KH"])
+
+
+def test_exact_equity_matches_brute_force():
+    from fractions import Fraction
+    from itertools import combinations
+    from src.card import FULL_DECK, to_cards
+    from src.equity import exact_equity
+    from src.hand_evaluator import HandEvaluator
+
+    evaluator = HandEvaluator()
+    hero, villain = to_cards(["AH", "KH"]), to_cards(["QS", "QC"])
+    board = to_cards(["2H", "7H", "9C"])
+    live = [card for card in FULL_DECK if card not in hero + villain + board]
+    wins = ties = deals = 0
+    for runout in combinations(live, 2):
+        hero_strength = evaluator.best_strength(hero + board + list(runout))
+        villain_strength = evaluator.best_strength(villain + board + list(runout))
+        wins += hero_strength > villain_strength
+        ties += hero_strength == villain_strength
+        deals += 1
+    result = exact_equity(hero, [villain], board)
+    assert result["deals"] == deals
+    assert result["win"] == Fraction(wins, deals)
+    assert result["tie"] == Fraction(ties, deals)
+    assert result["equity"] == Fraction(2 * wins + ties, 2 * deals)
+
+
+def test_suit_symmetry_reduces_work_without_changing_result():
+    from math import comb
+    from src.equity import canonical_combinations, exact_equity, suit_symmetries
+
+    symmetries = suit_symmetries([[0, 1], [4, 5], list(range(8, 52))])
+    assert len(symmetries) == 4
+    runouts, weights = canonical_combinations(range(8, 52), 3, symmetries)
+    assert weights.sum() == comb(44, 3)
+    assert len(runouts) < comb(44, 3)
+
+    result = exact_equity(["AH", "AD"], [["KS", "KC"]])
+    assert result["deals"] == 1712304
+    assert result["evaluated"] < result["deals"]
+    assert float(result["equity"]) == pytest.approx(0.8126, abs=1e-4)
+
+
+def test_exact_equity_refuses_huge_enumerations():
+    from src.equity import exact_equity
+
+    with pytest.raises(ValueError):
+        exact_equity(["AH", "KH"], 1)
+
+
+def test_anytime_equity_stops_at_target_or_cap():
+    from src.equity import anytime_equity, monte_carlo_equity
+
+    result = anytime_equity(
+        ["AH", "KH"], 1, ["2H", "7H", "9C"], budget=None, target_stderr=0.02, seed=3
+    )
+    assert result["stderr"] <= 0.02
+    reference = monte_carlo_equity(
+        ["AH", "KH"], 1, ["2H", "7H", "9C"], trials=50_000, seed=3
+    )
+    assert result["equity"] == pytest.approx(reference["equity"], abs=0.08)
+    assert (
+        anytime_equity(
+            ["AH", "KH"], budget=None, target_stderr=0, max_trials=600, seed=1
+        )["trials"]
+        == 600
+    )
+    assert anytime_equity(["AH", "KH"], budget=None, seed=5) == anytime_equity(
+        ["AH", "KH"], budget=None, seed=5
+    )
+
+
+def test_anytime_equity_respects_the_time_budget():
+    from src.equity import ANYTIME_CHUNK, anytime_equity
+
+    # A zero budget still runs the first chunk, then stops.
+    result = anytime_equity(["AH", "KH"], 3, budget=0, target_stderr=0, seed=1)
+    assert result["trials"] == ANYTIME_CHUNK
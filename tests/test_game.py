@@ -3,10 +3,12 @@ from src.game import PokerGame
 from src.deck import Deck
 from src.hand_evaluator import HandEvaluator
 
+
 @pytest.fixture
 def game():
     return PokerGame()
 
+
 def test_deal_hands(game):
     (player_hole, opponent_hole), community_cards = game.deal_hands(2)
     assert len(player_hole) == 2
@@ -17,6 +19,9 @@ def test_deal_hands(game):
     dealt_cards = set(player_hole + opponent_hole + community_cards)
     assert dealt_cards.issubset(deck_cards)
     assert len(dealt_cards) == 9  # 2 + 2 + 5 unique cards
+    with pytest.raises(ValueError, match="Not enough cards"):
+        game.deal_hands(30)
+
 
 def test_opponent_action(game):
     action, bet = game.opponent_action(2, 3, "preflop", ["AH", "KH"], [], 100, 0, 100)
@@ -28,6 +33,7 @@ def test_opponent_action(game):
     elif action == "fold":
         assert bet == 0
 
+
 def test_play_result(game):
     player_hole = ["AH", "KH"]
     opponent_hole = ["2C", "3D"]
@@ -35,4 +41,164 @@ def test_play_result(game):
     result = game.play(player_hole, opponent_hole, community_cards, 20, 10)
     assert result["winner"] == "Player"
     assert result["rank"] == "Royal Flush"
-    assert result["pot"] == 20
\ No newline at end of file
+    assert result["pot"] == 20
+
+
+def test_best_hand_uses_all_seven_cards(game):
+    rank, values = game.evaluate_best_hand(["AH", "AD"], ["AC", "KS", "KD", "2C", "2H"])
+    assert rank == "Full House"
+    assert values == [13, 13, 14, 14, 14]
+    rank, values = game.evaluate_best_hand(["9S", "8S"], ["7S", "6S", "5S", "4S", "KH"])
+    assert rank == "Straight Flush"
+    assert values == [5, 6, 7, 8, 9]
+
+
+def test_play_compares_pair_before_kickers(game):
+    community_cards = ["6C", "2D", "10H", "AS", "JD"]
+    result = game.play(["7D", "7H"], ["6H", "9D"], community_cards, 10, 5)
+    assert result["winner"] == "Player"
+    assert result["rank"] == "One Pair"
+
+
+def test_play_split_pot(game):
+    community_cards = ["10H", "JD", "QC", "KS", "AS"]
+    result = game.play(["2C", "3D"], ["4C", "5D"], community_cards, 10, 5)
+    assert result["winner"] == "Tie"
+    assert result["rank"] == "Straight"
+
+
+def test_showdown_side_pots():
+    game = PokerGame()
+    board = ["2C", "7D", "9H", "JS", "KD"]
+    holes = [["AH", "AD"], ["KH", "KC"], ["QH", "QC"], ["3S", "4S"]]
+    # Seat 0 is all-in for 10, seat 3 folded after putting in 20.
+    result = game.showdown(holes, [10, 50, 50, 20], board, folded=[3])
+    assert result["strengths"][3] is None
+    assert result["ranks"][:2] == ["One Pair", "Three of a Kind"]
+    assert [pot["amount"] for pot in result["pots"]] == [40, 90]
+    assert result["pots"][0]["winners"] == [1]
+    assert result["pots"][1]["eligible"] == [1, 2]
+    assert result["payouts"] == [0, 130, 0, 0]
+    assert sum(result["payouts"]) == 130
+
+
+def test_showdown_split_pot_and_uncalled_bet():
+    game = PokerGame()
+    board = ["10H", "JD", "QC", "KS", "AS"]
+    holes = [["2C", "3D"], ["4C", "5D"], ["9C", "9D"]]
+    result = game.showdown(holes, [7, 7, 12], board)
+    assert result["pots"][0] == {"amount": 21, "eligible": [0, 1, 2], "winners": [0, 1, 2]}
+    assert result["payouts"] == [7, 7, 12]
+    result = game.showdown(holes[:2], [5, 6], board, folded=[])
+    assert result["payouts"] == [5, 6]
+    result = game.showdown([["AH", "AD"], ["2C", "2D"], ["3C", "3D"]], [5, 5, 5], board, folded=[0])
+    assert result["payouts"] == [0, 8, 7]
+
+
+def test_street_strength_follows_the_board(game):
+    hole, board = ["AH", "AD"], ["AC", "KS", "KD", "2C", "7H"]
+    for shown in (3, 4, 5):
+        expected = game.best_hand_strength(hole, board[:shown])
+        assert game.street_strength(hole, board[:shown]) == expected
+    # A new board for the same hole cards starts over.
+    other = ["2D", "3D", "4D"]
+    assert game.street_strength(hole, other) == game.best_hand_strength(hole, other)
+    expected = game.best_hand_strength(["KH", "QH"], board)
+    assert game.street_strength(["KH", "QH"], board) == expected
+
+
+def test_decision_context_caches_per_street(game):
+    calls = []
+    pocket = game.evaluate_pocket_strength
+    game.evaluate_pocket_strength = lambda hole: calls.append(hole) or pocket(hole)
+    context = game.new_context(["AH", "AD"])
+    for _ in range(3):
+        assert context.strength("preflop", []) == 10
+    assert len(calls) == 1
+    board = ["AC", "KS", "KD", "2C", "7H"]
+    assert context.strength("flop", board[:3]) == 7
+    assert context.cached("strength", lambda: 0) == 7
+    assert context.strength("turn", board[:4]) == 7
+    assert context.cached("equity", lambda: 0.9) == 0.9
+    context.strength("river", board)
+    assert context.cached("equity", lambda: 0.5) == 0.5
+    assert context.hand.board == board
+
+
+def test_opponent_action_with_context_decides_the_same():
+    import random
+
+    board = ["AC", "KS", "KD", "2C", "7H"]
+    plain, cached = PokerGame(random.Random(4)), PokerGame(random.Random(4))
+    context = cached.new_context(["AH", "AD"])
+    streets = [("preflop", 0), ("flop", 3), ("flop", 3), ("turn", 4), ("river", 5)]
+    for street, shown in streets:
+        args = (4, 10, street, ["AH", "AD"], board[:shown], 100, 0, 100)
+        expected = plain.opponent_action(*args)
+        assert cached.opponent_action(*args, context=context) == expected
+
+
+def test_equity_bot_decides_from_pot_odds():
+    import random
+
+    game = PokerGame(random.Random(1), bot="equity", budget=None)
+    board = ["AS", "KS", "QS", "2D", "7C"]
+    # Nuts facing a bet: raise.
+    action, _ = game.opponent_action(10, 20, "river", ["JS", "10S"], board, 100, 0, 100)
+    assert action == "raise"
+    # Nothing facing a pot-sized bet: fold.
+    action = game.opponent_action(20, 20, "river", ["3H", "4C"], board, 100, 0, 100)
+    assert action == ("fold", 0)
+    with pytest.raises(ValueError):
+        PokerGame(bot="nope")
+
+
+def test_equity_bot_puts_the_player_on_a_range(monkeypatch):
+    import random
+
+    from src import equity
+    from src.ranges import parse_range
+
+    calls = []
+    anytime = equity.anytime_equity
+
+    def counted(*args, **kwargs):
+        calls.append(args)
+        return anytime(*args, **kwargs)
+
+    monkeypatch.setattr(equity, "anytime_equity", counted)
+    aces = parse_range("AA")
+    board = ["KS", "7D", "2C"]
+    args = (10, 20, "flop", ["QH", "QD"], board, 100, 0, 100)
+    # Queens beat most hands but hardly ever aces.
+    game = PokerGame(random.Random(3), bot="equity", budget=None)
+    assert game.opponent_action(*args)[0] == "raise"
+    assert calls[-1][1] == [None]
+    game = PokerGame(random.Random(3), bot="equity", budget=None, player_range=aces)
+    assert game.opponent_action(*args) == ("fold", 0)
+    assert calls[-1][1] == [aces]
+    # A range the bot's cards and the board block entirely means any hand.
+    game.opponent_action(10, 20, "flop", ["AH", "AD"], ["AC", "KD", "2C"], 100, 0, 100)
+    assert calls[-1][1] == [None]
+
+
+def test_equity_bot_estimates_once_per_street(monkeypatch):
+    import random
+
+    from src import equity
+
+    calls = []
+    anytime = equity.anytime_equity
+
+    def counted(*args, **kwargs):
+        calls.append(args)
+        return anytime(*args, **kwargs)
+
+    monkeypatch.setattr(equity, "anytime_equity", counted)
+    game = PokerGame(random.Random(2), bot="equity", budget=None)
+    context = game.new_context(["AH", "AD"])
+    board = ["AC", "KS", "KD", "2C", "7H"]
+    for shown in (3, 3, 4, 4):
+        args = (4, 10, "flop", ["AH", "AD"], board[:shown], 100, 0, 100)
+        game.opponent_action(*args, context=context)
+    assert len(calls) == 2
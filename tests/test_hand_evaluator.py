@@ -47,4 +47,92 @@ def test_empty_values(game):
 
 def test_raise_limit(game):
     action, amount = game.opponent_action(10, 20, "preflop", ["AH", "KH"], [], 100, 4, 100)
-    assert action != "raise"
\ No newline at end of file
+    assert action != "raise"
+
+
+def test_wheel_is_a_straight(evaluator):
+    rank, _ = evaluator.evaluate(["AH", "2D", "3C", "4S", "5H"])
+    assert rank == "Straight"
+    assert evaluator.strength(["AH", "2D", "3C", "4S", "5H"]) < evaluator.strength(
+        ["2H", "3D", "4C", "5S", "6H"]
+    )
+
+
+def test_kickers_decide(evaluator):
+    hand1 = ["AH", "AD", "KC", "7S", "2H"]
+    hand2 = ["AC", "AS", "QC", "JS", "10H"]
+    assert evaluator.compare_hands(hand1, hand2)["winner"] == "Hand 1"
+    assert evaluator.compare_hands(hand1, ["AC", "AS", "KH", "7D", "2C"])["winner"] == "Tie"
+
+
+def test_strength_range(evaluator):
+    assert evaluator.strength(["7H", "5D", "4C", "3S", "2H"]) == 1
+    assert evaluator.strength(["10S", "JS", "QS", "KS", "AS"]) == 7462
+    assert evaluator.category(evaluator.strength(["2H", "2D", "2C", "3S", "3H"])) == "Full House"
+
+
+def test_tables_are_persisted(tmp_path):
+    from src.lookup_tables import TABLE_VERSION, load_tables
+
+    path = tmp_path / "tables.bin"
+    tables = load_tables(path)
+    assert path.exists()
+    assert len(tables.products) == 4888
+    assert load_tables(path).unique5[0b1111100000000] == tables.unique5[0b1111100000000]
+    path.write_bytes(b"PKRT" + (TABLE_VERSION + 1).to_bytes(4, "little") + bytes(8))
+    assert len(load_tables(path).products) == 4888
+
+
+def test_cached_evaluator_is_order_independent():
+    from src.card import to_cards
+    from src.hand_evaluator import CachedHandEvaluator
+
+    cached = CachedHandEvaluator(maxsize=2)
+    cards = to_cards(["AH", "AD", "AC", "KS", "KD", "2C", "2H"])
+    expected = HandEvaluator().best_strength(cards)
+    assert cached.best_strength(cards) == expected
+    assert cached.best_strength(cards[::-1]) == expected
+    info = cached.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+    cached.best_strength(cards[:5])
+    cached.best_strength(cards[:6])
+    assert cached.cache_info().currsize == 2
+    cached.best_strength(cards)
+    assert cached.cache_info().misses == 4
+
+
+def test_game_with_cache_plays_the_same():
+    game = PokerGame(cache_size=16)
+    result = game.play(["2C", "3D"], ["4C", "5D"], ["10H", "JD", "QC", "KS", "AS"], 10, 5)
+    assert result["winner"] == "Tie"
+    assert game.evaluate_best_hand(["4C", "5D"], ["10H", "JD", "QC", "KS", "AS"])[0] == "Straight"
+    assert game.evaluator.cache_info().hits == 1
+
+
+def test_incremental_hand_matches_best_strength(evaluator):
+    import random
+
+    from src.card import FULL_DECK
+
+    rng = random.Random(7)
+    for _ in range(2000):
+        cards = rng.sample(FULL_DECK, 7)
+        hand = evaluator.incremental(cards[:2])
+        assert hand.strength is None
+        hand.extend(cards[2:5])
+        assert hand.strength == evaluator.best_strength(cards[:5])
+        hand.add(cards[5])
+        assert hand.strength == evaluator.best_strength(cards[:6])
+        hand.add(cards[6])
+        assert hand.strength == evaluator.best_strength(cards)
+
+
+def test_incremental_hand_accepts_strings(evaluator):
+    hand = evaluator.incremental(["AH", "KH"])
+    hand.add("QH", "JH", "2C")
+    assert evaluator.category(hand.strength) == "High Card"
+    hand.add("10H")
+    assert evaluator.category(hand.strength) == "Royal Flush"
+    assert hand.board == ["QH", "JH", "2C", "10H"]
+    assert hand.follows(["QH", "JH", "2C", "10H", "3D"])
+    assert not hand.follows(["QH", "JH", "2D"])
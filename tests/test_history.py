@@ -0,0 +1,40 @@
+from src.history import HandHistoryWriter, read_history
+
+
+def test_writer_appends_and_keeps_totals(tmp_path):
+    path = tmp_path / "hands.jsonl"
+    with HandHistoryWriter(path, flush_every=2) as writer:
+        writer.write({"winner": "Player", "net": 5, "showdown": True})
+        assert path.read_text() == ""
+        writer.write({"winner": "Opponent", "net": -2, "showdown": False})
+        assert len(path.read_text().splitlines()) == 2
+        writer.write({"winner": "Tie", "net": 0, "showdown": True})
+    assert writer.totals == {
+        "hands": 3,
+        "wins": 1,
+        "losses": 1,
+        "ties": 1,
+        "showdowns": 2,
+        "net": 3,
+    }
+    with HandHistoryWriter(path) as writer:
+        writer.write({"winner": "Player", "net": 1})
+    assert [r["net"] for r in read_history(path)] == [5, -2, 0, 1]
+
+
+def test_writer_rotates_files(tmp_path):
+    path = tmp_path / "hands.jsonl"
+    with HandHistoryWriter(path, flush_every=1, max_bytes=100, backups=2) as writer:
+        for hand in range(20):
+            writer.write({"hand": hand, "padding": "x" * 40})
+    rotated = sorted(p.name for p in tmp_path.iterdir())
+    assert rotated == ["hands.jsonl", "hands.jsonl.1", "hands.jsonl.2"]
+    hands = [r["hand"] for name in rotated[::-1] for r in read_history(tmp_path / name)]
+    # Each file holds two records; the oldest ones were rotated away.
+    assert hands == [16, 17, 18, 19]
+
+
+def test_read_history_skips_torn_line(tmp_path):
+    path = tmp_path / "hands.jsonl"
+    path.write_text('{"hand": 1}\n{"hand": 2}\n{"hand"')
+    assert list(read_history(path)) == [{"hand": 1}, {"hand": 2}]
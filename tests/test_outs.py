@@ -0,0 +1,72 @@
+from itertools import combinations
+
+import pytest
+
+from src.card import FULL_DECK, to_cards
+from src.equity import exact_equity
+from src.hand_evaluator import HandEvaluator
+from src.outs import analyze_outs
+from src.ranges import parse_range
+
+
+def test_flop_odds_match_enumeration():
+    evaluator = HandEvaluator()
+    hero, villain = to_cards(["AH", "KH"]), to_cards(["QS", "QC"])
+    board = to_cards(["2H", "7H", "9C"])
+    now = evaluator.category_code(evaluator.best_strength(hero + board))
+    live = [card for card in FULL_DECK if card not in hero + villain + board]
+    improved = []
+    for runout in combinations(live, 2):
+        final = board + list(runout)
+        code = evaluator.category_code(evaluator.best_strength(hero + final))
+        on_board = evaluator.category_code(evaluator.strength(final))
+        improved.append(code > max(now, on_board))
+    result = analyze_outs(hero, board, villain)
+    assert result["runouts"] == len(improved)
+    assert result["improve"] == pytest.approx(sum(improved) / len(improved))
+    assert result["equity"] == pytest.approx(
+        float(exact_equity(hero, [villain], board)["equity"])
+    )
+    assert sum(row["probability"] for row in result["cards"]) == pytest.approx(1.0)
+
+
+def test_turn_outs_against_a_random_hand():
+    board = ["2H", "7H", "9C", "QD"]
+    result = analyze_outs(["AH", "KH"], board)
+    assert result["category"] == "High Card"
+    assert result["runouts"] == 46
+    outs = set(result["outs"])
+    assert (
+        set(to_cards(["3H", "4H", "5H", "6H", "8H", "9H", "10H", "JH", "QH"])) <= outs
+    )
+    assert set(to_cards(["AD", "KS"])) <= outs
+    assert not outs & set(to_cards(["3C", "JD"]))
+    exact = exact_equity(["AH", "KH"], 1, board)
+    assert result["equity"] == pytest.approx(float(exact["equity"]))
+    flush = next(row for row in result["cards"] if row["card"] == to_cards(["3H"])[0])
+    assert flush["category"] == "Flush" and flush["improves"]
+
+
+def test_cards_that_only_pair_the_board_are_not_outs():
+    result = analyze_outs(["AH", "KH"], ["2H", "7H", "9C"])
+    outs = set(result["outs"])
+    assert len(outs) == 9 + 3 + 3
+    assert not outs & set(to_cards(["7D", "2D", "9S"]))
+    assert set(to_cards(["AD", "KC", "5H"])) <= outs
+    pair = next(row for row in result["cards"] if row["card"] == to_cards(["7D"])[0])
+    assert pair["category"] == "One Pair" and not pair["improves"]
+    # A pocket pair making a full house on a paired board does improve.
+    result = analyze_outs(["9H", "9D"], ["2H", "7H", "9C"])
+    assert set(to_cards(["7D", "2D"])) <= set(result["outs"])
+
+
+def test_range_opponent_and_bad_spots():
+    result = analyze_outs(["AH", "KH"], ["2H", "7H", "9C", "QD"], parse_range("QQ+"))
+    # Nine combos are left, three of them a set of queens.
+    assert 0 < result["equity"] < 0.3
+    with pytest.raises(ValueError):
+        analyze_outs(["AH", "KH"], ["2H", "7H"])
+    with pytest.raises(ValueError):
+        analyze_outs(["AH", "KH"], ["2H", "7H", "9C", "QD", "3S"])
+    with pytest.raises(ValueError):
+        analyze_outs(["AH", "KH"], ["2H", "7H", "9C"], ["AH", "QD"])
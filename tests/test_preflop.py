@@ -0,0 +1,76 @@
+import random
+
+import pytest
+from src.game import PokerGame
+from src.preflop import (
+    STARTING_HANDS,
+    PreflopTable,
+    combos,
+    example_cards,
+    get_preflop_table,
+    hand_name,
+    serialize_table,
+)
+
+
+def test_starting_hands_cover_every_combo():
+    assert len(STARTING_HANDS) == 169
+    assert STARTING_HANDS[:3] == ["AA", "AKs", "AKo"]
+    assert sum(combos(name) for name in STARTING_HANDS) == 1326
+    for name in STARTING_HANDS:
+        assert hand_name(example_cards(name)) == name
+
+
+def test_hand_name():
+    assert hand_name(["AH", "KH"]) == "AKs"
+    assert hand_name(["KD", "AH"]) == "AKo"
+    assert hand_name(["10S", "10C"]) == "TT"
+    assert hand_name(["2C", "7D"]) == "72o"
+
+
+def test_table_round_trip():
+    equities = [[index / 169] * 9 for index in range(169)]
+    table = PreflopTable(serialize_table(equities, trials=10))
+    assert table.trials == 10
+    assert table.equity("AA", 9) == 0.0
+    assert table.equity("22", 1) == pytest.approx(168 / 169, abs=1e-4)
+    assert table.chart()[0][0] == "22"
+    with pytest.raises(ValueError):
+        table.equity("AA", 10)
+
+
+def test_shipped_table_ranks_hands():
+    table = get_preflop_table()
+    assert table.chart(1)[0] == ("AA", table.equity(["AS", "AD"], 1))
+    assert table.equity("AA", 1) == pytest.approx(0.852, abs=0.005)
+    assert table.equity("32o", 1) == pytest.approx(0.323, abs=0.005)
+    for opponents in range(1, 9):
+        assert table.equity("AKs", opponents) > table.equity("AKs", opponents + 1)
+    assert table.percentile("AA") == 1.0
+
+
+def test_pocket_strength_uses_equity_table():
+    game = PokerGame()
+    assert game.evaluate_pocket_strength(["AH", "AD"]) == 10
+    assert game.evaluate_pocket_strength(["AH", "KH"]) >= 6
+    assert game.evaluate_pocket_strength(["7C", "2D"]) < 3
+
+
+def test_pocket_strength_keeps_the_threshold_shares():
+    from itertools import combinations
+
+    from src.card import FULL_DECK
+
+    game = PokerGame(random.Random(3))
+    combos = [list(hole) for hole in combinations(FULL_DECK, 2)]
+    strengths = [game.evaluate_pocket_strength(hole) for hole in combos]
+    # Shares the old hand-written rule gave: 11.5%, 26.4% and 82.8%.
+    assert sum(s >= 6 for s in strengths) / 1326 == pytest.approx(0.115, abs=0.005)
+    assert sum(s >= 5 for s in strengths) / 1326 == pytest.approx(0.264, abs=0.005)
+    assert sum(s >= 3 for s in strengths) / 1326 == pytest.approx(0.828, abs=0.005)
+    raises = sum(
+        game.opponent_action(4, 10, "preflop", hole, [], 100, 0, 100)[0] == "raise"
+        for hole in combos * 4
+    )
+    # 11.5% always raise plus 30% of the 71% between 3 and 6.
+    assert raises / len(combos * 4) == pytest.approx(0.33, abs=0.02)
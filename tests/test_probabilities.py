@@ -0,0 +1,63 @@
+from math import comb
+
+import numpy as np
+import pytest
+
+from src.batch import DECK, evaluate_batch
+from src.equity import combination_array
+from src.game import PokerGame
+from src.probabilities import (
+    category_counts,
+    category_probabilities,
+    compute_category_counts,
+    load_category_counts,
+)
+
+SEVEN_CARD_COUNTS = {
+    "Royal Flush": 4324,
+    "Straight Flush": 37260,
+    "Four of a Kind": 224848,
+    "Full House": 3473184,
+    "Flush": 4047644,
+    "Straight": 6180020,
+    "Three of a Kind": 6461620,
+    "Two Pair": 31433400,
+    "One Pair": 58627800,
+    "High Card": 23294460,
+}
+
+
+def test_seven_card_counts():
+    assert compute_category_counts(7) == SEVEN_CARD_COUNTS
+    assert category_counts(7) == SEVEN_CARD_COUNTS
+
+
+def test_five_card_counts_match_every_hand():
+    hands = DECK[combination_array(range(52), 5)]
+    _, codes = evaluate_batch(hands)
+    per_code = np.bincount(codes, minlength=11)
+    counts = compute_category_counts(5)
+    assert list(counts.values()) == per_code[:0:-1].tolist()
+    assert sum(compute_category_counts(6).values()) == comb(52, 6)
+
+
+def test_counts_are_cached_on_disk(tmp_path):
+    path = tmp_path / "counts.json"
+    counts = load_category_counts(path)
+    assert path.exists()
+    assert load_category_counts(path) == counts
+    path.write_text('{"5": {}}')
+    assert load_category_counts(path) == counts
+    with pytest.raises(ValueError):
+        category_counts(4)
+
+
+def test_game_probabilities_depend_on_hand_size():
+    game = PokerGame()
+    assert sum(category_probabilities(6).values()) == pytest.approx(1.0)
+    assert game.probabilities["Royal Flush"] == pytest.approx(100 * 4 / comb(52, 5))
+    pair = ["AH", "AD", "7C", "4S", "2H"]
+    assert game.get_probability(pair) == pytest.approx(42.2569, abs=1e-4)
+    assert game.get_probability(pair + ["9D", "JC"]) == pytest.approx(
+        100 * 58627800 / comb(52, 7)
+    )
@@ -0,0 +1,42 @@
+from src import profiling
+from src.game import PokerGame
+from src.hand_evaluator import HandEvaluator
+
+
+def test_disabled_by_default_and_restored():
+    original = PokerGame.__dict__["opponent_action"]
+    assert not profiling.enabled()
+    profiling.enable()
+    try:
+        assert profiling.enabled()
+        assert PokerGame.__dict__["opponent_action"] is not original
+    finally:
+        profiling.disable()
+    assert PokerGame.__dict__["opponent_action"] is original
+    assert not profiling.enabled()
+
+
+def test_counts_calls_and_time():
+    profiling.reset()
+    profiling.enable()
+    try:
+        game = PokerGame(seed=3)
+        for _ in range(5):
+            (hole, _), board = game.deal_hands()
+            game.evaluate_best_hand(hole, board)
+        HandEvaluator().evaluate(["AH", "KH", "QH", "JH", "10H"])
+    finally:
+        profiling.disable()
+    rows = {row["name"]: row for row in profiling.report()}
+    assert rows["PokerGame.deal_hands"]["calls"] == 5
+    assert rows["PokerGame.evaluate_best_hand"]["calls"] == 5
+    assert rows["HandEvaluator.evaluate"]["calls"] == 1
+    assert rows["PokerGame.deal_hands"]["total_s"] > 0
+    assert "PokerGame.deal_hands" in profiling.format_report(profiling.report())
+    # Calls made while disabled are not counted.
+    PokerGame(seed=3).deal_hands()
+    assert {row["name"]: row for row in profiling.report()}["PokerGame.deal_hands"][
+        "calls"
+    ] == 5
+    profiling.reset()
+    assert profiling.report() == []
@@ -0,0 +1,164 @@
+import numpy as np
+import pytest
+
+from src.card import FULL_DECK, to_cards
+from src.equity import exact_equity, monte_carlo_equity
+from src.game import PokerGame
+from src.ranges import (
+    COMBO_MASKS,
+    COMBOS,
+    NUM_COMBOS,
+    Range,
+    card_mask,
+    combo_index,
+    parse_range,
+)
+
+
+@pytest.mark.parametrize(
+    "text, combos",
+    [
+        ("AA", 6),
+        ("AKs", 4),
+        ("AKo", 12),
+        ("AK", 16),
+        ("TT+", 30),
+        ("A2s+", 48),
+        ("K9o+", 48),
+        ("22-55", 24),
+        ("A5s-A2s", 16),
+        ("10s9s", 1),
+        ("QQ+, AKs, AKo", 34),
+    ],
+)
+def test_parse_range_counts_combos(text, combos):
+    assert len(parse_range(text)) == combos
+
+
+def test_weights_and_overrides():
+    hand = parse_range("KQo:0.5")
+    assert hand.total() == 6
+    assert hand.weight(["KH", "QD"]) == 0.5
+    assert ["KH", "QH"] not in hand
+    assert len(parse_range("AK, AKs:0")) == 12
+
+
+@pytest.mark.parametrize("text", ["AAs", "AKx", "A2s-K5s", "KQo:2", "AhAh", "Zz"])
+def test_invalid_notation(text):
+    with pytest.raises(ValueError):
+        parse_range(text)
+
+
+def test_set_operations_and_blocking():
+    pairs, broadway = parse_range("TT+"), parse_range("AK, AQ, KQ, TT+")
+    assert (pairs | broadway) == broadway
+    assert (pairs & broadway) == pairs
+    assert len(broadway - pairs) == 48
+    assert len(~pairs) == NUM_COMBOS - 30
+    blocked = pairs.remove(["AH", "KD"])
+    assert len(blocked) == 30 - 3 - 3
+    assert ["AD", "AS"] in blocked and ["AH", "AS"] not in blocked
+
+
+def test_sampling_follows_weights_and_dead_cards():
+    hand = parse_range("AA, KK:0.5")
+    slots = hand.sample(np.random.default_rng(1), 30_000, dead=["AH"])
+    aces = np.isin(slots, parse_range("AA").slots())
+    assert aces.mean() == pytest.approx(3 / 6, abs=0.02)
+    assert combo_index(["AH", "AD"]) not in slots
+    with pytest.raises(ValueError):
+        parse_range("AA").sample(np.random.default_rng(1), dead=["AH", "AD", "AC"])
+
+
+def test_ranges_feed_the_batch_evaluator():
+    board = ["AC", "KS", "7D"]
+    hand = parse_range("AA, 72o").remove(board)
+    strengths, categories = PokerGame().evaluate_best_hand_batch(hand, board)
+    assert len(strengths) == len(hand) == 3 + 9
+    assert sorted(categories.tolist()) == [2] * 9 + [4] * 3
+    assert Range.from_hands([["AH", "AD"]]) == parse_range("AhAd")
+
+
+def test_range_opponents_in_equity():
+    single = monte_carlo_equity(
+        ["AH", "AD"], [parse_range("KsKc")], trials=50_000, seed=1
+    )
+    exact = exact_equity(["AH", "AD"], [["KS", "KC"]])
+    assert single["equity"] == pytest.approx(float(exact["equity"]), abs=0.01)
+    with pytest.raises(ValueError):
+        exact_equity(["AH", "AD"], [parse_range("KK")])
+    with pytest.raises(ValueError):
+        monte_carlo_equity(["AH", "AD"], [parse_range("AhAd, AdAh")], trials=10)
+
+
+def test_ranges_that_cannot_be_dealt_together_are_rejected():
+    queens = parse_range("QQ")
+    with pytest.raises(ValueError):
+        monte_carlo_equity(["QH", "2C"], [queens, queens], trials=1000)
+    with pytest.raises(ValueError):
+        monte_carlo_equity(["AH", "2C"], [parse_range("QdQc"), parse_range("QcQs")])
+    result = monte_carlo_equity(
+        ["QH", "2C"], [queens, parse_range("QdQc, KK")], trials=1000, seed=1
+    )
+    assert result["trials"] == 1000
+
+
+def test_range_equity_matches_pairwise_showdowns():
+    from itertools import combinations
+    from src.equity import range_equity
+    from src.hand_evaluator import HandEvaluator
+
+    evaluator = HandEvaluator()
+    hero = parse_range("AA, KK, AKs, QJs:0.5, AhKd")
+    villain = parse_range("KK+, QQ:0.3, AQs, JTs, AsQd")
+    board = ["QH", "JH", "2D", "9S"]
+    board_mask = card_mask(board)
+    wins = ties = matchups = 0.0
+    for river in range(52):
+        if board_mask >> river & 1:
+            continue
+        full = board_mask | 1 << river
+        cards = to_cards(board) + [FULL_DECK[river]]
+        strength = {}
+        for slot in np.flatnonzero(hero.weights + villain.weights):
+            if not COMBO_MASKS[slot] & full:
+                hole = [FULL_DECK[index] for index in COMBOS[slot]]
+                strength[slot] = evaluator.best_strength(hole + cards)
+        for h, v in combinations(strength, 2):
+            for a, b in ((h, v), (v, h)):
+                weight = hero.weights[a] * villain.weights[b]
+                if weight and not COMBO_MASKS[a] & COMBO_MASKS[b]:
+                    matchups += weight
+                    wins += weight * (strength[a] > strength[b])
+                    ties += weight * (strength[a] == strength[b])
+    result = range_equity(hero, villain, board)
+    assert result["boards"] == 48
+    assert result["win"] == pytest.approx(wins / matchups)
+    assert result["tie"] == pytest.approx(ties / matchups)
+    assert result["loss"] == pytest.approx(1 - (wins + ties) / matchups)
+
+
+def test_range_equity_of_single_combos_is_exact():
+    from src.equity import range_equity
+
+    board = ["2H", "7H", "9C"]
+    result = range_equity(parse_range("AhKh"), parse_range("QsQc"), board)
+    exact = exact_equity(["AH", "KH"], [["QS", "QC"]], board)
+    assert result["equity"] == pytest.approx(float(exact["equity"]))
+    assert result["boards"] == 1176
+    combos = result["combos"]
+    assert combos[combo_index(["AH", "KH"])] == pytest.approx(result["equity"])
+    assert np.isnan(combos).sum() == NUM_COMBOS - 1
+
+
+def test_range_equity_rejects_bad_spots():
+    from src.equity import range_equity
+
+    with pytest.raises(ValueError):
+        range_equity(parse_range("AA"), parse_range("KK"), ["2H", "7H"])
+    with pytest.raises(ValueError):
+        range_equity(parse_range("AA"), parse_range("KK"), ["AH", "AD", "AC"], ["AS"])
+    with pytest.raises(ValueError):
+        range_equity(parse_range("AhAd"), parse_range("AhAd"), ["2H", "7H", "9C"])
+    with pytest.raises(ValueError):
+        range_equity(parse_range("AA"), parse_range("KK"), ["2H", "7H", "9C"], limit=10)
@@ -0,0 +1,37 @@
+import pytest
+from src.game import PokerGame
+from src.rng import BLOCK_HANDS, CounterRNG, HandStream
+
+
+def test_streams_are_pure_functions_of_seed_and_index():
+    first = CounterRNG(11).stream(5)
+    second = CounterRNG(11).stream(5)
+    assert [first.random() for _ in range(50)] == [second.random() for _ in range(50)]
+    assert CounterRNG(11).stream(6).random() != CounterRNG(11).stream(5).random()
+    assert CounterRNG(12).stream(5).random() != CounterRNG(11).stream(5).random()
+
+
+def test_block_draws_match_scalar_draws():
+    rng = CounterRNG(3)
+    index = BLOCK_HANDS + 17
+    blocked = rng.stream(index)
+    scalar = HandStream(rng.key(index))
+    assert [blocked.random() for _ in range(100)] == [
+        scalar.random() for _ in range(100)
+    ]
+
+
+def test_draws_look_uniform():
+    rng = CounterRNG(1)
+    draws = [rng.stream(index).random() for index in range(20_000)]
+    assert all(0.0 <= draw < 1.0 for draw in draws)
+    assert sum(draws) / len(draws) == pytest.approx(0.5, abs=0.01)
+
+
+def test_seeded_game_replays_any_hand():
+    game = PokerGame(seed=99)
+    deals = [game.deal_hands(2) for _ in range(30)]
+    assert PokerGame(seed=99).deal_hands(2, hand_index=23) == deals[23]
+    assert deals[0] != deals[1]
+    with pytest.raises(ValueError):
+        PokerGame().deal_hands(2, hand_index=3)
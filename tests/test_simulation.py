@@ -0,0 +1,87 @@
+import random
+from src.game import PokerGame
+from src.simulation import (
+    betting_hand,
+    merge_stats,
+    replay_hand,
+    simulate,
+    simulate_sharded,
+)
+
+
+def test_showdown_simulation_aggregates():
+    stats = simulate(500, bet=5)
+    assert stats["hands"] == 500
+    assert stats["wins"] + stats["losses"] + stats["ties"] == 500
+    assert stats["folds"] == 0
+    assert sum(stats["categories"].values()) == 500
+    assert stats["net"] == 5 * (stats["wins"] - stats["losses"])
+
+
+def test_betting_simulation_aggregates():
+    stats = simulate(500, betting=True, stack=50)
+    assert stats["wins"] + stats["losses"] + stats["ties"] == 500
+    assert sum(stats["categories"].values()) == 500 - stats["folds"]
+    assert -50 * 500 <= stats["net"] <= 50 * 500
+
+
+def test_betting_hand_stays_within_stacks():
+    random.seed(7)
+    game = PokerGame()
+    for button in (0, 1) * 100:
+        result, net = betting_hand(game, button, stack=10)
+        assert -10 <= net <= 10
+        if result["winner"] == "Tie":
+            assert net == 0
+        elif result["winner"] == "Player":
+            assert net > 0
+        else:
+            assert net < 0
+
+
+def test_simulation_continues_existing_stats():
+    stats = simulate(10)
+    simulate(15, stats=stats)
+    assert stats["hands"] == 25
+
+
+def test_sharded_simulation_is_reproducible(monkeypatch):
+    import src.simulation
+
+    monkeypatch.setattr(src.simulation, "SHARD_HANDS", 100)
+    serial, seed = simulate_sharded(350, workers=1, seed=42, betting=True)
+    parallel, _ = simulate_sharded(350, workers=2, seed=42, betting=True)
+    assert seed == 42
+    assert serial == parallel
+    assert serial["hands"] == 350
+    other, _ = simulate_sharded(350, workers=1, seed=43, betting=True)
+    assert other != serial
+
+
+def test_merge_stats():
+    total = simulate(20, PokerGame(random.Random(1)))
+    part = simulate(30, PokerGame(random.Random(2)))
+    merged = merge_stats(dict(total, categories=dict(total["categories"])), part)
+    assert merged["hands"] == 50
+    assert merged["net"] == total["net"] + part["net"]
+    assert sum(merged["categories"].values()) == 50
+
+
+def test_seeded_game_deals_the_same_hands():
+    first = PokerGame(random.Random(3)).deal_hands(2)
+    second = PokerGame(random.Random(3)).deal_hands(2)
+    assert first == second
+
+
+def test_replay_hand_matches_the_run(monkeypatch):
+    import src.simulation
+
+    monkeypatch.setattr(src.simulation, "SHARD_HANDS", 40)
+    hand = replay_hand(5, 57, betting=True)
+    stats, _ = simulate_sharded(58, seed=5, betting=True)
+    before, _ = simulate_sharded(57, seed=5, betting=True)
+    assert stats["net"] - before["net"] == hand["net"]
+    deals = PokerGame(seed=5)
+    for _ in range(57):
+        deals.deal_hands(2)
+    assert deals.deal_hands(2) == ([hand["player"], hand["opponent"]], hand["board"])
@@ -0,0 +1,128 @@
+import io
+import json
+
+from src.binary_history import convert_history
+from src.history import HandHistoryWriter
+from src.stats import (
+    _JsonStream,
+    history_format,
+    iter_legacy_records,
+    new_summary,
+    summarize_history,
+)
+
+HAND = {
+    "player_hole": ["AH", "KH"],
+    "opponent_hole": ["2C", "3D"],
+    "community_cards": ["10H", "JH", "QH", "2D", "4S"],
+    "player_rank": "Royal Flush",
+    "opponent_rank": "One Pair",
+}
+
+
+def _write_jsonl(path, count):
+    with HandHistoryWriter(path) as writer:
+        for number in range(count):
+            winner = ["Player", "Opponent", "Tie"][number % 3]
+            net = {"Player": 5, "Opponent": -3, "Tie": 0}[winner]
+            showdown = number % 4 != 0
+            writer.write(
+                dict(
+                    HAND,
+                    round=number,
+                    street="showdown" if showdown else "flop",
+                    showdown=showdown,
+                    winner=winner,
+                    net=net,
+                    player_rank=HAND["player_rank"] if showdown else None,
+                )
+            )
+
+
+def test_summary_is_the_same_for_any_chunking(tmp_path):
+    path = tmp_path / "hands.jsonl"
+    _write_jsonl(path, 300)
+    summary = summarize_history(path)
+    assert summary["hands"] == 300
+    assert (summary["wins"], summary["losses"], summary["ties"]) == (100, 100, 100)
+    assert summary["net"] == 100 * 5 - 100 * 3
+    assert summary["showdowns"] == 225
+    assert summary["by_player_rank"]["Royal Flush"]["hands"] == 225
+    assert summary["by_player_rank"]["Unknown"]["hands"] == 75
+    assert summary["by_opponent_rank"]["One Pair"]["net"] == 200
+    assert summarize_history(path, workers=2, chunk_bytes=1000) == summary
+    assert summarize_history(path, chunk_bytes=777) == summary
+
+    binary = tmp_path / "hands.bin"
+    convert_history(path, binary)
+    assert history_format(binary) == "binary"
+    assert summarize_history(binary, workers=2, chunk_bytes=27 * 7) == summary
+
+
+def test_abandoned_hands_are_not_counted(tmp_path):
+    path = tmp_path / "hands.jsonl"
+    _write_jsonl(path, 6)
+    with HandHistoryWriter(path) as writer:
+        for number in range(6, 9):
+            writer.write(
+                dict(HAND, round=number, street="flop", winner=None, abandoned=True)
+            )
+    summary = summarize_history(path)
+    assert (summary["hands"], summary["abandoned"]) == (6, 3)
+    assert (summary["wins"], summary["losses"], summary["ties"]) == (2, 2, 2)
+    assert summary["by_player_rank"]["Royal Flush"]["hands"] == 4
+    binary = tmp_path / "hands.bin"
+    convert_history(path, binary)
+    assert summarize_history(binary) == summary
+
+
+def test_legacy_history_is_streamed(tmp_path):
+    legacy = {
+        "rounds": 2,
+        "wins": 1,
+        "bets": {"round1": 10, "round2": 4},
+        "probabilities": {},
+        "hands": {
+            "round1": dict(HAND, result="Player"),
+            "round2": dict(HAND, result="Opponent", player_rank="One Pair"),
+        },
+    }
+    path = tmp_path / "game_history.json"
+    path.write_text(json.dumps(legacy, indent=4))
+    assert history_format(path) == "legacy"
+    records = list(iter_legacy_records(path))
+    assert [record["bet"] for record in records] == [10, 4]
+    summary = summarize_history(path)
+    assert (summary["hands"], summary["wins"], summary["losses"]) == (2, 1, 1)
+    assert summary["showdowns"] == 2
+    assert set(summary["by_player_rank"]) == {"Royal Flush", "One Pair"}
+
+
+def test_empty_history_is_empty_jsonl(tmp_path):
+    path = tmp_path / "hands.jsonl"
+    path.write_text("")
+    assert history_format(path) == "jsonl"
+    assert summarize_history(path) == new_summary()
+    path.write_text("\n  \n")
+    assert history_format(path) == "jsonl"
+    assert summarize_history(path)["hands"] == 0
+
+
+def test_torn_first_line_is_jsonl(tmp_path):
+    path = tmp_path / "hands.jsonl"
+    _write_jsonl(path, 1)
+    path.write_bytes(path.read_bytes()[:20])
+    assert history_format(path) == "jsonl"
+    assert summarize_history(path)["hands"] == 0
+
+
+def test_json_stream_handles_values_split_across_blocks():
+    document = json.dumps({"a": 12345, "hands": {"round1": {"x": "y" * 50}}, "z": 6})
+    stream = _JsonStream(io.StringIO(document), block=3)
+    values = {}
+    for key in stream.entries():
+        if key == "hands":
+            values[key] = {k: stream.value() for k in stream.entries()}
+        else:
+            values[key] = stream.value()
+    assert values == json.loads(document)